@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Binary extended Euclid versus Itoh-Tsujii inversion by field degree."""
+from random import Random
+from timeit import repeat
+
+from lib.points.binary_field import BinaryField
+from lib.points.curve import convert_polynomial
+
+POLYNOMIALS = [
+    [8, 4, 3, 1, 0],
+    [31, 3, 0],
+    [64, 4, 3, 1, 0],
+    [113, 9, 0],
+    [163, 7, 6, 3, 0],
+    [233, 74, 0],
+    [283, 12, 7, 5, 0],
+    [409, 87, 0],
+    [571, 10, 5, 2, 0]
+]
+
+ROUNDS = 200
+
+
+def measure(inverse, numbers):
+    """Best microseconds per inversion."""
+    seconds = min(repeat(lambda: [inverse(number) for number in numbers], number=1, repeat=5))
+
+    return seconds / len(numbers) * 1e6
+
+
+def main():
+    """Benchmark running."""
+    random = Random(0)
+
+    for powers in POLYNOMIALS:
+        field = BinaryField(convert_polynomial(powers))
+        numbers = [random.getrandbits(field.degree) | 1 for _ in range(ROUNDS)]
+
+        print('m = {}: euclid {:.1f}us, itoh-tsujii {:.1f}us'.format(
+            field.degree,
+            measure(field.euclid_inverse, numbers),
+            measure(field.itoh_tsujii_inverse, numbers)))
+
+
+if __name__ == '__main__':
+    main()
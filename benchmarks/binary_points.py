@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Affine versus projective scalar multiplication on binary curves."""
+from random import Random
+from timeit import default_timer
+
+from lib.points import Curve, points_factory
+
+CURVES = {
+    'B-163': {
+        'payload': [163, 7, 6, 3, 0],
+        'coefficients': [1, 1, 0x20a601907b8c953ca1481eb10512f78744a3205fd],
+        'x': 0x3f0eba16286a2d57ea0991168d4994637e8343e36,
+        'y': 0x0d51fbc6c71a0094fa2cdd545b11c5c0c797324f1
+    },
+    'B-233': {
+        'payload': [233, 74, 0],
+        'coefficients': [1, 1, 0x066647ede6c332c7f8c0923bb58213b333b20e9ce4281fe115f7d8f90ad],
+        'x': 0x0fac9dfcbac8313bb2139f1bb755fef65bc391f8b36f8f8eb7371fd558b,
+        'y': 0x1006a08a41903350678e58528bebf8a0beff867a7ca36716f7e01f81052
+    }
+}
+
+ROUNDS = 5
+
+
+def affine_factorize(point, factor):
+    """Double-and-add with an inversion in every addition."""
+    result = point
+
+    for bit in bin(factor)[3:]:
+        result += result
+
+        if bit == '1':
+            result += point
+
+    return result
+
+
+def measure(function, point, factors):
+    """Average seconds per scalar multiplication."""
+    started = default_timer()
+
+    for factor in factors:
+        function(point, factor)
+
+    return (default_timer() - started) / len(factors)
+
+
+def main():
+    """Benchmark running."""
+    random = Random(0)
+
+    for name, params in sorted(CURVES.items()):
+        point = points_factory(Curve('n', params['payload'], params['coefficients']),
+                               params['x'], params['y'])
+        factors = [random.getrandbits(params['payload'][0]) | 1 for _ in range(ROUNDS)]
+
+        affine = measure(affine_factorize, point, factors)
+        projective = measure(lambda this, factor: this * factor, point, factors)
+
+        print('{}: affine {:.4f}s, projective {:.4f}s, speedup {:.1f}x'.format(
+            name, affine, projective, affine / projective))
+
+
+if __name__ == '__main__':
+    main()
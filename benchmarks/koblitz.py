@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""w-NAF versus τNAF scalar multiplication on Koblitz curves."""
+from random import Random
+from timeit import default_timer
+
+from lib.points import NAMED_CURVES, Curve, points_factory
+
+CURVES = ['K-163', 'K-233']
+
+ROUNDS = 20
+
+
+def measure(function, point, factors):
+    """Average seconds per scalar multiplication."""
+    started = default_timer()
+
+    for factor in factors:
+        function(point, factor)
+
+    return (default_timer() - started) / len(factors)
+
+
+def main():
+    """Benchmark running."""
+    random = Random(0)
+
+    for name in CURVES:
+        params = NAMED_CURVES[name]
+        curve = Curve(params['curve_type'], params['payload'], params['coefficients'])
+        point = points_factory(curve, *params['generator'])
+        factors = [random.randrange(1, params['subgroup_order']) for _ in range(ROUNDS)]
+
+        wnaf = measure(lambda this, factor: this.factorize(factor, 'wnaf'), point, factors)
+        tnaf = measure(lambda this, factor: this * factor, point, factors)
+
+        print('{}: w-NAF {:.4f}s, τNAF {:.4f}s, speedup {:.1f}x'.format(
+            name, wnaf, tnaf, wnaf / tnaf))
+
+
+if __name__ == '__main__':
+    main()
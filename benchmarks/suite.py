@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite: point addition, doubling and scalar multiplication,
+field primitives and end-to-end throughput of main.py on named curves
+and small teaching fields.
+
+Every case reports operations per second averaged over repeats with
+their standard deviation. Results are written as JSON and compared
+with a baseline one: a case slower than the baseline by more than the
+threshold is a regression.
+
+    python3 -m benchmarks.suite --json results.json --baseline benchmarks/baseline.json
+"""
+import json
+import platform
+import subprocess
+import sys
+from argparse import ArgumentParser
+from os.path import dirname, join
+from random import Random
+from statistics import mean, stdev
+from tempfile import TemporaryDirectory
+from timeit import Timer
+
+from lib.points import NAMED_CURVES, POINTS, Curve, points_factory
+from lib.points.backends import BACKENDS
+from lib.points.order import random_point
+from lib.points.prime_point import PrimePoint, use_backend
+
+TEACHING_CURVES = {
+    'p-199': ('p', [199], [1, 3]),
+    'n-2^4': ('n', [4, 1, 0], [1, 1, 1]),
+    's-2^4': ('s', [4, 1, 0], [1, 1, 1]),
+    's-2^163': ('s', [163, 7, 6, 3, 0], [1, 0, 0])
+}
+
+NAMED = ['P-192', 'P-256', 'B-163', 'K-163']
+
+MAIN_CURVES = ['p-199', 'P-256', 'B-163', 'K-163']
+
+BACKEND_CURVES = ['P-192', 'P-256']
+
+MAIN_INSTRUCTIONS = 200
+
+REPEATS = 5
+
+MIN_SECONDS = 0.05
+
+THRESHOLD = 0.2
+
+MAIN_PATH = join(dirname(dirname(__file__)), 'main.py')
+
+
+def curves():
+    """Curves of the suite by name with a point on each."""
+    generator = Random(0)
+    result = {}
+
+    for name in NAMED:
+        params = NAMED_CURVES[name]
+        curve = Curve(params['curve_type'], params['payload'], params['coefficients'])
+        result[name] = points_factory(curve, *params['generator'])
+
+    for name, (curve_type, payload, coefficients) in TEACHING_CURVES.items():
+        curve = Curve(curve_type, payload, coefficients)
+        result[name] = random_point(curve, POINTS[curve_type], generator)
+
+    return result
+
+
+def field_operations(point, generator):
+    """Field primitives inverse, multiply and modulus on random elements."""
+    curve = point.curve
+
+    if curve.curve_type == 'p':
+        bits = curve.modulus.bit_length()
+        number = generator.getrandbits(bits) % (curve.modulus - 1) + 1
+        other = generator.getrandbits(bits) % curve.modulus
+        wide = number * other
+
+        return {
+            'inverse': lambda: point.inverse(number),
+            'multiply': lambda: point.multiply(number, other),
+            'modulus': lambda: wide % curve.modulus
+        }
+
+    field = curve.field
+    number = generator.getrandbits(field.degree) | 1
+    other = generator.getrandbits(field.degree)
+    wide = generator.getrandbits(2 * field.degree - 1)
+
+    return {
+        'inverse': lambda: field.inverse(number),
+        'multiply': lambda: field.multiply(number, other),
+        'modulus': lambda: field.modulus(wide)
+    }
+
+
+def bit_length(curve):
+    """Bit length of the curve field elements."""
+    return curve.field.degree if curve.field is not None else curve.modulus.bit_length()
+
+
+def on_backend(backend, function):
+    """Callable running a function with prime field arithmetic on a backend."""
+    def run():
+        previous = PrimePoint.backend.name
+        use_backend(backend)
+
+        try:
+            return function()
+        finally:
+            use_backend(previous)
+
+    return run
+
+
+def backend_cases(points):
+    """Scalar multiplication and field inversion on prime curves with every available backend."""
+    generator = Random(2)
+    result = {}
+
+    for name in BACKEND_CURVES:
+        point = points[name]
+        modulus = point.curve.modulus
+        number = generator.getrandbits(modulus.bit_length()) % (modulus - 1) + 1
+        factor = generator.getrandbits(modulus.bit_length())
+
+        for backend_name, backend in BACKENDS.items():
+            prefix = 'backend/{}/{}'.format(backend_name, name)
+            result['{}/multiply'.format(prefix)] = (
+                on_backend(backend_name, lambda point=point, factor=factor: point * factor), 1)
+            result['{}/inverse'.format(prefix)] = (
+                lambda backend=backend, number=number, modulus=modulus:
+                backend.inverse(number, modulus), 1)
+
+    return result
+
+
+def cases():
+    """Benchmark cases by name: a callable and the number of operations it runs."""
+    generator = Random(1)
+    points = curves()
+    result = {}
+
+    for name, point in points.items():
+        other = point * 3
+        factor = generator.getrandbits(bit_length(point.curve))
+
+        result['{}/add'.format(name)] = (lambda point=point, other=other: point + other, 1)
+        result['{}/double'.format(name)] = (lambda point=point: point + point, 1)
+        result['{}/multiply'.format(name)] = (
+            lambda point=point, factor=factor: point * factor, 1)
+
+        for operation, function in field_operations(point, generator).items():
+            result['{}/field/{}'.format(name, operation)] = (function, 1)
+
+    for name in MAIN_CURVES:
+        content = main_input(name, points[name], generator)
+        result['main/{}'.format(name)] = (main_runner(content), MAIN_INSTRUCTIONS)
+
+    result.update(backend_cases(points))
+
+    return result
+
+
+def main_input(name, point, generator):
+    """Input file of main.py with random sums and products of multiples of a point."""
+    if name in NAMED_CURVES:
+        curve_type, payload, coefficients = (NAMED_CURVES[name][key] for key in
+                                             ('curve_type', 'payload', 'coefficients'))
+    else:
+        curve_type, payload, coefficients = TEACHING_CURVES[name]
+
+    points = [point * (generator.getrandbits(16) + 1) for _ in range(8)]
+    bits = bit_length(point.curve)
+    lines = [curve_type, ' '.join(map(str, payload)), ' '.join(map(str, coefficients))]
+
+    for index in range(MAIN_INSTRUCTIONS):
+        this = points[index % len(points)]
+        that = points[(index * 5 + 1) % len(points)]
+
+        if index % 2:
+            lines.append('({}, {}) + ({}, {})'.format(this.x, this.y, that.x, that.y))
+        else:
+            lines.append('({}, {}) * {}'.format(this.x, this.y, generator.getrandbits(bits)))
+
+    return '\n'.join(lines) + '\n'
+
+
+def main_runner(content):
+    """Callable running main.py as a process on an input file of a content."""
+    def run():
+        with TemporaryDirectory() as directory:
+            input_path = join(directory, 'input.txt')
+
+            with open(input_path, mode='w', encoding='utf-8') as input_file:
+                input_file.write(content)
+
+            subprocess.run([sys.executable, MAIN_PATH, '-i', input_path,
+                            '-o', join(directory, 'output.txt')],
+                           check=True, stdout=subprocess.DEVNULL)
+
+    return run
+
+
+def measure(function, operations, repeats=REPEATS, min_seconds=MIN_SECONDS):
+    """Operations per second of every repeat, calls are batched to last at least min_seconds."""
+    timer = Timer(function)
+    number = 1
+
+    while timer.timeit(number) < min_seconds:
+        number *= 2
+
+    return [number * operations / seconds for seconds in timer.repeat(repeats, number)]
+
+
+def summary(rates):
+    """Mean operations per second with their standard deviation."""
+    return {
+        'ops': mean(rates),
+        'stdev': stdev(rates) if len(rates) > 1 else 0.0,
+        'repeats': len(rates)
+    }
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    """Cases slower than the baseline by more than a threshold as {name: ratio}."""
+    regressions = {}
+
+    for name, result in results.items():
+        reference = baseline.get(name)
+
+        if reference is None:
+            continue
+
+        ratio = result['ops'] / reference['ops']
+
+        if ratio < 1 - threshold:
+            regressions[name] = ratio
+
+    return regressions
+
+
+def parse_args():
+    """Command-line arguments parsing."""
+    parser = ArgumentParser(prog='Benchmark suite',
+                            description='Elliptic curve benchmarks with a baseline comparison',
+                            usage='python3 -m benchmarks.suite')
+    parser.add_argument('-f', '--filter', type=str, default='',
+                        help='run only cases with names containing a substring')
+    parser.add_argument('-r', '--repeats', type=int, default=REPEATS,
+                        help='number of repeats, default is {}'.format(REPEATS))
+    parser.add_argument('--json', type=str, default=None, help='JSON results file path')
+    parser.add_argument('--baseline', type=str, default=None, help='JSON baseline file path')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help='allowed slowdown ratio, default is {}'.format(THRESHOLD))
+
+    return parser.parse_args()
+
+
+def main():
+    """Benchmark running."""
+    args = parse_args()
+    baseline = {}
+
+    if args.baseline is not None:
+        with open(args.baseline, mode='r', encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)['results']
+
+    results = {}
+
+    for name, (function, operations) in sorted(cases().items()):
+        if args.filter not in name:
+            continue
+
+        results[name] = summary(measure(function, operations, args.repeats))
+        reference = baseline.get(name)
+        line = '{:<32} {:>14.1f} ops/s ± {:>5.1f}%'.format(
+            name, results[name]['ops'], 100 * results[name]['stdev'] / results[name]['ops'])
+
+        if reference is not None:
+            line += '  {:>6.2f}x baseline'.format(results[name]['ops'] / reference['ops'])
+
+        print(line)
+
+    if args.json is not None:
+        with open(args.json, mode='w', encoding='utf-8') as json_file:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'results': results
+            }, json_file, indent=2, sort_keys=True)
+
+    regressions = compare(results, baseline, args.threshold)
+
+    for name, ratio in sorted(regressions.items()):
+        print('regression: {} is {:.2f}x of the baseline'.format(name, ratio))
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Elliptic curve computation library."""
-from lib.computer import Computer, parse_number
+from lib.computer import Computer
+from lib.parser import ParseError, parse_number, parse_program
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Index of fixed-base tables for repeated base points."""
+from collections import OrderedDict
+
+from lib.points.fixed_base import FixedBaseTable
+
+TABLES_SIZE = 8
+TABLE_THRESHOLD = 16
+COUNTERS_FACTOR = 64
+
+
+class BaseIndex:
+    """
+    Size-bounded LRU index of fixed-base tables. A table is built once
+    a base point has been multiplied `threshold` times, which is about
+    where it pays off against the table construction. Tables of a
+    precomputation store are used from the first multiplication.
+    """
+    def __init__(self, size=TABLES_SIZE, threshold=TABLE_THRESHOLD, store=None):
+        self.size = size
+        self.threshold = threshold
+        self.store = store
+        self.tables = OrderedDict()
+        self.counters = OrderedDict()
+
+    def get(self, point, bit_length):
+        """Returns a table of the point or None while the point is not hot."""
+        if not self.size:
+            return None
+
+        key = point.x, point.y
+        table = self.tables.get(key)
+
+        if table is not None:
+            self.tables.move_to_end(key)
+            return table
+
+        if self.store is not None:
+            table = self.store.table(point, bit_length)
+
+            if table is not None:
+                return table
+
+        count = self.counters.pop(key, 0) + 1
+
+        if count < self.threshold:
+            self.counters[key] = count
+
+            if len(self.counters) > self.size * COUNTERS_FACTOR:
+                self.counters.popitem(last=False)
+
+            return None
+
+        table = FixedBaseTable(point, bit_length)
+        self.tables[key] = table
+
+        if len(self.tables) > self.size:
+            self.tables.popitem(last=False)
+
+        return table
+
+    def __len__(self):
+        return len(self.tables)
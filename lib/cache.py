@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Bounded cache of instruction results."""
+import sys
+from collections import OrderedDict
+
+CACHE_SIZE = 1 << 16
+
+
+def deep_size(item):
+    """Approximate memory size of an item with the items of its tuples."""
+    if isinstance(item, tuple):
+        return sys.getsizeof(item) + sum(map(deep_size, item))
+
+    return sys.getsizeof(item)
+
+
+class ResultCache:
+    """
+    LRU cache bounded by a number of entries and optionally by their
+    approximate size in bytes, counting hits, misses and evictions.
+    """
+    def __init__(self, size=CACHE_SIZE, max_bytes=None):
+        self.size = size
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+
+    def get(self, key):
+        """Cached value of a key, None if there is no one."""
+        entry = self.entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+
+        return entry[0]
+
+    def put(self, key, value):
+        """Caches a value evicting the least recently used entries over the bounds."""
+        if key in self.entries:
+            self.bytes -= self.entries.pop(key)[1]
+
+        size = deep_size(key) + deep_size(value)
+        self.entries[key] = value, size
+        self.bytes += size
+
+        while self.entries and (len(self.entries) > self.size or
+                                self.max_bytes is not None and self.bytes > self.max_bytes):
+            _, (_, evicted_size) = self.entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+
+    def stats(self):
+        """Counters of the cache usage."""
+        return {
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'bytes': self.bytes
+        }
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
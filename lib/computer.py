@@ -2,78 +2,280 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=invalid-name
 """Elliptic curve computer."""
-import re
+from collections import OrderedDict
 
-from lib.points import points_factory
+from lib.base_index import BaseIndex, TABLES_SIZE
+from lib.cache import CACHE_SIZE, ResultCache
+from lib.parser import ADD, COMBINATION, LOG, MULTIPLY, parse_instruction
+from lib.points import POINTS, Curve, points_factory
+from lib.points.batch import batch_add, batch_affine, batch_odd_multiples
+from lib.points.logarithm import logarithm
+from lib.points.multipliers import DEFAULT_MULTIPLIER, linear_combination, multiples_count, \
+    window_size
+from lib.points.order import group_order
+from lib.points.vectorized import VectorizedEngine, vectorized_available
 
-INSTRUCTION_PATTERN = re.compile(r'^\((.+?), (.+?)\) ([+*]) (?:\((.+?), (.+?)\)|([\S]+))$')
+CHUNK_SIZE = 1024
+
+VECTORIZED_BATCH = 32
 
 HANDLERS = {
-    '+': lambda this, that: this + that,
-    '*': lambda this, that: this * that
+    ADD: lambda this, that: this + that,
+    MULTIPLY: lambda this, that: this * that,
+    COMBINATION: lambda terms, _: linear_combination(terms)
 }
 
-BASES = {
-    '0b': 2,
-    '0o': 8,
-    '0x': 16
-}
+
+def distinct(raw_instructions):
+    """Lazy stream of instructions without repetitions."""
+    seen = set()
+
+    for raw_instruction in raw_instructions:
+        if raw_instruction not in seen:
+            seen.add(raw_instruction)
+            yield raw_instruction
 
 
-def parse_number(number):
-    """Parsing by a radix."""
-    radix = number[:2]
-    base = 10
+def computer_of(computers, curve, store=None):
+    """
+    Computer of a curve built once per dictionary of computers, keyed by
+    the curve with its order: curves compare equal whatever their order.
+    """
+    key = curve, curve.order
+    computer = computers.get(key)
 
-    if radix in BASES:
-        base = BASES.get(radix, 10)
+    if computer is None:
+        computer = Computer(curve.curve_type, curve.payload, curve.coefficients, order=curve.order,
+                            store=store)
+        computers[key] = computer
 
-    return int(number, base)
+    return computer
 
 
 class Computer:
     """Computer class."""
     # pylint: disable=too-few-public-methods
-    def __init__(self, curve_type, payload, coefficients):
+    def __init__(self, curve_type, payload, coefficients, tables_size=TABLES_SIZE,
+                 cache_size=CACHE_SIZE, cache_bytes=None, vectorized=True, order=None,
+                 store=None, executor=None, jobs=1):
+        # pylint: disable=too-many-arguments
         self.payload = payload
         self.coefficients = coefficients
         self.curve_type = curve_type
-        self.cache = {}
+        self.curve = Curve(curve_type, payload, coefficients, order)
+
+        if self.curve.order is None and store is not None and store.order(self.curve):
+            self.curve = Curve(curve_type, payload, coefficients, store.order(self.curve))
+
+        self.order = group_order(self.curve, POINTS[curve_type])
+        self.cache = ResultCache(cache_size, cache_bytes)
+        self.tables = BaseIndex(tables_size, store=store)
+        self.bit_length = self._scalar_bit_length()
+        self.vectorized = None
+        self.executor = executor
+        self.jobs = jobs
+
+        if vectorized and vectorized_available(self.curve):
+            self.vectorized = VectorizedEngine(self.curve)
 
     def calc(self, raw_instruction):
         """Instruction calculation."""
-        if raw_instruction in self.cache:
-            return self.cache[raw_instruction]
+        return self.calc_instruction(parse_instruction(raw_instruction))
 
-        left, handler, right = self._parse_instruction(raw_instruction)
-        result = handler(left, right)
-        self.cache[raw_instruction] = result
+    def calc_instruction(self, instruction):
+        """Calculation of an instruction parsed into (opcode, operands)."""
+        result = self.cache.get(instruction)
+
+        if result is not None:
+            return result
+
+        left, operator, right = self._operands(instruction)
+
+        if operator == MULTIPLY:
+            result = self._multiply(left, left.reduce_factor(right))
+        elif operator == LOG:
+            result = self._logarithm(left, right)
+        else:
+            result = HANDLERS[operator](left, right)
+
+        self.cache.put(instruction, result)
 
         return result
 
-    def _get_point(self, x, y):
-        """Creates point."""
-        params = {
-            'x': parse_number(x),
-            'y': parse_number(y),
-            'curve_type': self.curve_type,
-            'payload': self.payload,
-            'coefficients': self.coefficients
-        }
+    def calc_batch(self, raw_instructions):
+        """
+        Calculation of independent instructions in lockstep: all additions
+        share one field inversion, multiplications share one inversion per
+        precomputation step and one for the final conversion to affine.
+        """
+        return self.calc_program([parse_instruction(raw_instruction)
+                                  for raw_instruction in raw_instructions])
+
+    def calc_stream(self, raw_instructions, chunk_size=CHUNK_SIZE):
+        """
+        Lazy calculation of an instruction stream in batches of a chunk size.
+        Yields pairs of distinct instructions and results in input order.
+        """
+        chunk = []
+
+        for raw_instruction in distinct(raw_instructions):
+            chunk.append(raw_instruction)
+
+            if len(chunk) == chunk_size:
+                yield from zip(chunk, self.calc_batch(chunk))
+                chunk = []
+
+        if chunk:
+            yield from zip(chunk, self.calc_batch(chunk))
+
+    def calc_program(self, program):
+        """
+        Results of instructions parsed into (opcode, operands), the ones
+        missing in the cache are computed in a batch once per instruction.
+        """
+        results = {}
+        pending = OrderedDict()
+
+        for instruction in program:
+            if instruction in results or instruction in pending:
+                continue
+
+            result = self.cache.get(instruction)
+
+            if result is None:
+                pending[instruction] = self._operands(instruction)
+            else:
+                results[instruction] = result
+
+        for instruction, result in zip(pending, self._compute_batch(list(pending.values()))):
+            self.cache.put(instruction, result)
+            results[instruction] = result
+
+        return [results[instruction] for instruction in program]
+
+    def _compute_batch(self, instructions):
+        """Results of parsed instructions computed in lockstep."""
+        sums = []
+        products = []
+
+        for index, (left, operator, right) in enumerate(instructions):
+            if operator == ADD:
+                sums.append((index, left, right))
+            elif operator == MULTIPLY:
+                products.append((index, left, left.reduce_factor(right)))
+
+        results = [None] * len(instructions)
+
+        if self.vectorized is not None and len(sums) + len(products) >= VECTORIZED_BATCH:
+            computed = self.vectorized.add_points([(left, right) for _, left, right in sums])
+            computed += self._multiply_vectorized([(left, right) for _, left, right in products])
+        else:
+            computed = batch_add([(left, right) for _, left, right in sums])
+            computed += self._multiply_batch([(left, right) for _, left, right in products])
+
+        for (index, _, _), result in zip(sums + products, computed):
+            results[index] = result
+
+        for index, (left, operator, right) in enumerate(instructions):
+            if operator == COMBINATION:
+                results[index] = HANDLERS[operator](left, right)
+            elif operator == LOG:
+                results[index] = self._logarithm(left, right)
+
+        return results
+
+    def _multiply_vectorized(self, products):
+        """Multiplications by the vectorized engine, trivial factors keep points as they are."""
+        results = [point * factor if -1 <= factor <= 1 else None for point, factor in products]
+        pending = [index for index, result in enumerate(results) if result is None]
+        computed = self.vectorized.multiply_points([products[index] for index in pending])
+
+        for index, result in zip(pending, computed):
+            results[index] = result
+
+        return results
+
+    def _multiply_batch(self, products):
+        """Multiplications in lockstep sharing field inversions."""
+        results = [None] * len(products)
+        projective = []
+        engine = []
+
+        for index, (point, factor) in enumerate(products):
+            if -1 <= factor <= 1:
+                results[index] = point * factor
+                continue
+
+            table = None
+
+            if factor.bit_length() <= self.bit_length:
+                table = self.tables.get(point, self.bit_length)
+
+            if table is not None:
+                projective.append((index, table.point, table.multiply_projective(abs(factor)),
+                                   factor < 0))
+            else:
+                base = point if factor > 0 else -point
+                engine.append((index, base, abs(factor), window_size(factor.bit_length())))
+
+        counts = [multiples_count(DEFAULT_MULTIPLIER, window) for _, _, _, window in engine]
+        multiples = batch_odd_multiples([base for _, base, _, _ in engine], counts)
+
+        for (index, base, factor, window), base_multiples in zip(engine, multiples):
+            result = base.multiplier()(base, factor, window, base_multiples)
+            projective.append((index, base, result, False))
+
+        points = batch_affine([(point, result) for _, point, result, _ in projective])
+
+        for (index, _, _, negate), point in zip(projective, points):
+            results[index] = -point if negate else point
+
+        return results
+
+    def _multiply(self, point, factor):
+        """Multiplication served from a fixed-base table for hot base points."""
+        if -1 <= factor <= 1 or factor.bit_length() > self.bit_length:
+            return point * factor
+
+        table = self.tables.get(point, self.bit_length)
+
+        if table is None:
+            return point * factor
+
+        if factor < 0:
+            return -table.multiply(-factor)
+
+        return table.multiply(factor)
+
+    def _logarithm(self, base, target):
+        """Discrete logarithm with walks in the processes of the executor if there is one."""
+        return logarithm(base, target, self.executor, self.jobs)
+
+    def _scalar_bit_length(self):
+        """Bit length of the group order or the largest one allowed by the Hasse bound."""
+        if self.order is not None:
+            return self.order.bit_length()
+
+        if self.curve.modulus is not None:
+            return self.curve.modulus.bit_length() + 1
+
+        return self.curve.field.degree + 1
+
+    def _operands(self, instruction):
+        """Points and factors of an instruction as (left, operator, right)."""
+        opcode, operands = instruction
 
-        return points_factory(self.curve_type, params)
+        if opcode in (ADD, LOG):
+            x1, y1, x2, y2 = operands
 
-    def _parse_instruction(self, raw_instruction):
-        """Raw instruction parsing."""
-        match = re.findall(INSTRUCTION_PATTERN, raw_instruction)[0]
+            return points_factory(self.curve, x1, y1), opcode, points_factory(self.curve, x2, y2)
 
-        if not match:
-            raise Exception('Incorrect instruction: {}'.format(raw_instruction))
+        if opcode == MULTIPLY:
+            x, y, factor = operands
 
-        x1, y1, operator, x2, y2, factor = match
+            return points_factory(self.curve, x, y), opcode, factor
 
-        left = self._get_point(x1, y1)
-        right = self._get_point(x2, y2) if x2 and y2 else int(factor)
-        handler = HANDLERS[operator]
+        terms = tuple((points_factory(self.curve, operands[index], operands[index + 1]),
+                       operands[index + 2]) for index in range(0, len(operands), 3))
 
-        return left, handler, right
+        return terms, opcode, None
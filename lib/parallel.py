@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parallel evaluation in a process pool: instruction streams of a curve
+split into chunks, or whole sections of multi-curve inputs.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from lib.computer import Computer, computer_of, distinct
+from lib.parser import ADD, LOG, ParseError, parse_instruction
+from lib.store import open_store
+
+ADDITION_COST = 1
+
+CHUNK_COST = 1 << 14
+
+PENDING_CHUNKS = 4
+
+COMPUTER = None
+
+SECTION_COMPUTERS = {}
+
+STORE = None
+
+
+def instruction_cost(raw_instruction):
+    """
+    Rough cost of an instruction in point additions: a multiplication
+    takes a doubling and a fraction of an addition per bit of the factor.
+    Malformed instructions cost an addition, their workers report them.
+    Logarithms have no cost, they are computed by the whole pool apart.
+    """
+    try:
+        opcode, operands = parse_instruction(raw_instruction)
+    except ParseError:
+        return ADDITION_COST
+
+    if opcode == ADD:
+        return ADDITION_COST
+
+    if opcode == LOG:
+        return None
+
+    factors = operands[2::3]
+    cost = (len(factors) - 1) * ADDITION_COST
+    cost += sum(abs(factor).bit_length() for factor in factors if abs(factor) > 1)
+
+    return max(cost, ADDITION_COST)
+
+
+def chunks(raw_instructions, chunk_cost=CHUNK_COST):
+    """Lazy split of instructions into chunks of about the same cost, logarithms stay apart."""
+    chunk = []
+    cost = 0
+
+    for raw_instruction in raw_instructions:
+        step_cost = instruction_cost(raw_instruction)
+
+        if step_cost is None:
+            if chunk:
+                yield chunk
+
+            yield [raw_instruction]
+            chunk = []
+            cost = 0
+            continue
+
+        chunk.append(raw_instruction)
+        cost += step_cost
+
+        if cost >= chunk_cost:
+            yield chunk
+            chunk = []
+            cost = 0
+
+    if chunk:
+        yield chunk
+
+
+def init_worker(curve_type, payload, coefficients, order, store_path=None):
+    """Builds the computer of a worker process once, mapping the precomputation store."""
+    global COMPUTER  # pylint: disable=global-statement
+    COMPUTER = Computer(curve_type, payload, coefficients, order=order,
+                        store=open_store(store_path))
+
+
+def calc_chunk(raw_instructions):
+    """Results of a chunk in a worker process, formatted to keep transfers small."""
+    results = COMPUTER.calc_stream(raw_instructions, len(raw_instructions))
+
+    return [str(result) for _, result in results]
+
+
+def calc_logarithms(computer, raw_instructions):
+    """Formatted logarithms computed by a computer walking in the pool of its executor."""
+    return [str(computer.calc(raw_instruction)) for raw_instruction in raw_instructions]
+
+
+def calc_parallel(curve_type, payload, coefficients, raw_instructions, jobs,
+                  chunk_cost=CHUNK_COST, order=None, store_path=None):
+    """
+    Lazy calculation of an instruction stream by a pool of jobs processes.
+    Yields pairs of distinct instructions and formatted results in input
+    order, keeping at most PENDING_CHUNKS chunks per job in flight.
+    Workers share the precomputation store file mapped read-only.
+    Logarithms are computed in a thread by walks over the whole pool.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    initargs = curve_type, payload, coefficients, order, store_path
+
+    with ProcessPoolExecutor(jobs, initializer=init_worker, initargs=initargs) as executor, \
+            ThreadPoolExecutor(1) as logarithms:
+        pending = deque()
+        computer = None
+
+        for chunk in chunks(distinct(raw_instructions), chunk_cost):
+            if instruction_cost(chunk[0]) is None:
+                if computer is None:
+                    computer = Computer(curve_type, payload, coefficients, order=order,
+                                        store=open_store(store_path), executor=executor, jobs=jobs)
+
+                pending.append((chunk, logarithms.submit(calc_logarithms, computer, chunk)))
+            else:
+                pending.append((chunk, executor.submit(calc_chunk, chunk)))
+
+            if len(pending) >= jobs * PENDING_CHUNKS:
+                chunk, future = pending.popleft()
+                yield from zip(chunk, future.result())
+
+        while pending:
+            chunk, future = pending.popleft()
+            yield from zip(chunk, future.result())
+
+
+def init_sections(store_path=None):
+    """Maps the precomputation store in a worker process computing sections."""
+    global STORE  # pylint: disable=global-statement
+    STORE = open_store(store_path)
+
+
+def calc_section(curve, raw_instructions):
+    """
+    Formatted results of a section in a worker process by the computer of
+    its curve, kept with its caches for later sections of the curve.
+    """
+    computer = computer_of(SECTION_COMPUTERS, curve, STORE)
+
+    return [(raw_instruction, str(result))
+            for raw_instruction, result in computer.calc_stream(raw_instructions)]
+
+
+def calc_sections(sections, jobs, store_path=None):
+    """
+    Lazy calculation of sections (curve, instructions) dispatched whole to
+    a pool of jobs processes. Yields lists of pairs of distinct instructions
+    and formatted results section by section in input order.
+    """
+    with ProcessPoolExecutor(jobs, initializer=init_sections, initargs=(store_path,)) as executor:
+        pending = deque()
+
+        for curve, raw_instructions in sections:
+            pending.append(executor.submit(calc_section, curve, list(raw_instructions)))
+
+            if len(pending) >= jobs * PENDING_CHUNKS:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Instruction language parser.
+
+An instruction is parsed into a compact tuple (opcode, operands) with
+flat integer operands:
+
+- ADD: (x1, y1, x2, y2) for `(x1, y1) + (x2, y2)`
+- MULTIPLY: (x, y, k) for `(x, y) * k`
+- COMBINATION: (x1, y1, k1, x2, y2, k2, ...) for `(x1, y1) * k1 + (x2, y2) * k2 + ...`,
+  a term without a factor has k = 1
+- LOG: (x1, y1, x2, y2) for `(x1, y1) log (x2, y2)`, the discrete logarithm
+
+Sums and products are matched by a single compiled pattern,
+other lines are read by a lazy tokenizer that reports error positions.
+"""
+import re
+
+ADD = '+'
+MULTIPLY = '*'
+COMBINATION = 'combination'
+LOG = 'log'
+
+UNSIGNED = r'(?:0[bB][01]+|0[oO][0-7]+|0[xX][0-9a-fA-F]+|\d+)'
+
+NUMBER = r'-?' + UNSIGNED
+
+ORDER_PATTERN = re.compile(UNSIGNED)
+
+POINT = r'\(\s*({0})\s*,\s*({0})\s*\)'.format(NUMBER)
+
+INSTRUCTION_PATTERN = re.compile(r'\s*{0}\s*(?:\+\s*{0}|\*\s*({1}))\s*'.format(POINT, NUMBER))
+
+TOKEN_PATTERN = re.compile(r'\s*(?:({0})|([(),+*]|log)|(\S))'.format(NUMBER))
+
+END = 'end'
+
+
+class ParseError(Exception):
+    """Malformed instruction with the position of the error."""
+    def __init__(self, instruction, column, message, line=None):
+        self.instruction = instruction
+        self.column = column
+        self.message = message
+        self.line = line
+        location = 'column {}'.format(column)
+
+        if line is not None:
+            location = 'line {}, {}'.format(line, location)
+
+        super().__init__('Incorrect instruction at {}: {}: {}'.format(
+            location, message, instruction))
+
+    def __reduce__(self):
+        return ParseError, (self.instruction, self.column, self.message, self.line)
+
+
+def parse_number(number):
+    """Parsing by a radix prefix, decimal numbers may have leading zeros."""
+    try:
+        return int(number, 0)
+    except ValueError:
+        return int(number, 10)
+
+
+def tokenize(instruction):
+    """Lazy tokens (kind, value, column) of an instruction, the last one is END."""
+    position = 0
+
+    while True:
+        match = TOKEN_PATTERN.match(instruction, position)
+
+        if match is None:
+            yield END, None, len(instruction) + 1
+            return
+
+        number, symbol, other = match.groups()
+        column = match.start(match.lastindex) + 1
+        position = match.end()
+
+        if number is not None:
+            yield NUMBER, parse_number(number), column
+        elif symbol is not None:
+            yield symbol, symbol, column
+        else:
+            raise ParseError(instruction, column, 'unexpected character {!r}'.format(other))
+
+
+def parse_instruction(instruction):
+    """Instruction parsed into (opcode, operands)."""
+    match = INSTRUCTION_PATTERN.fullmatch(instruction)
+
+    if match is None:
+        return parse_terms(instruction)
+
+    x1, y1, x2, y2, factor = match.groups()
+
+    if factor is None:
+        return ADD, (parse_number(x1), parse_number(y1), parse_number(x2), parse_number(y2))
+
+    return MULTIPLY, (parse_number(x1), parse_number(y1), parse_number(factor))
+
+
+def parse_terms(instruction):
+    """Instruction parsed token by token into (opcode, operands)."""
+    tokens = tokenize(instruction)
+
+    def expect(kind, description):
+        token_kind, value, column = next(tokens)
+
+        if token_kind != kind:
+            raise ParseError(instruction, column, 'expected {}'.format(description))
+
+        return value
+
+    def point():
+        expect('(', "'('")
+        x = expect(NUMBER, 'a number')
+        expect(',', "','")
+        y = expect(NUMBER, 'a number')
+        expect(')', "')'")
+
+        return x, y
+
+    operands = []
+    factors = False
+
+    while True:
+        x, y = point()
+        kind, _, column = next(tokens)
+        factor = 1
+
+        if kind == LOG and not operands:
+            operands = (x, y) + point()
+            expect(END, 'the end')
+
+            return LOG, operands
+
+        if kind == '*':
+            factor = expect(NUMBER, 'a factor')
+            factors = True
+            kind, _, column = next(tokens)
+
+        operands += (x, y, factor)
+
+        if kind == END:
+            break
+
+        if kind != '+':
+            raise ParseError(instruction, column, "expected '+', '*' or the end")
+
+    if len(operands) == 3:
+        if not factors:
+            raise ParseError(instruction, column, "expected '+' or '*'")
+
+        return MULTIPLY, tuple(operands)
+
+    if len(operands) == 6 and not factors:
+        return ADD, tuple(operands[:2] + operands[3:5])
+
+    return COMBINATION, tuple(operands)
+
+
+def parse_program(lines):
+    """Non-empty lines parsed into a list of (opcode, operands)."""
+    program = []
+
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+
+        if not line:
+            continue
+
+        try:
+            program.append(parse_instruction(line))
+        except ParseError as error:
+            raise ParseError(line, error.column, error.message, number) from None
+
+    return program
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Elliptic curve points module."""
+from lib.points.curve import Curve
+from lib.points.named_curves import NAMED_CURVES
 from lib.points.point import Point
 from lib.points.prime_point import PrimePoint
 from lib.points.binary_points import Point2N, Point2S
@@ -13,6 +15,6 @@ POINTS = {
 }
 
 
-def points_factory(curve_type, params):
+def points_factory(curve, x=None, y=None):
     """Point factory."""
-    return POINTS[curve_type](params)
+    return POINTS[curve.curve_type](x, y, curve)
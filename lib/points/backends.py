@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Big-integer backends of prime field arithmetic: products, squares,
+reductions and inverses modulo p.
+
+- `pure`: extended Euclid inversion in Python bytecode
+- `builtin`: inversion by `pow(x, -1, p)` running in C, Python 3.8+
+- `gmpy2`: GMP integers `mpz` for projective coordinates and GMP `invert`,
+  available when gmpy2 is installed
+
+The fastest available backend is the default one. Affine coordinates are
+always Python ints, so results are identical whatever the backend.
+"""
+import sys
+
+try:
+    import gmpy2
+except ImportError:  # pragma: no cover
+    gmpy2 = None
+
+
+class PureBackend:
+    """Python ints with inversion by the extended Euclidean algorithm."""
+    name = 'pure'
+
+    @staticmethod
+    def element(number):
+        """Number in the representation of projective coordinates."""
+        return number
+
+    @staticmethod
+    def multiply(this_num, that_num, modulus):
+        """Product of numbers modulo a prime."""
+        return this_num * that_num % modulus
+
+    @staticmethod
+    def square(number, modulus):
+        """Square of a number modulo a prime."""
+        return number * number % modulus
+
+    @staticmethod
+    def reduce(number, modulus):
+        """Least nonnegative residue of a number."""
+        return number % modulus
+
+    @staticmethod
+    def inverse(number, modulus):
+        """Inverse of a number modulo a prime, ZeroDivisionError for zero."""
+        number %= modulus
+        previous_num = 0
+        current_num = 1
+        previous_res = modulus
+        current_res = number
+
+        while current_res != 1:
+            factor = previous_res // current_res
+            previous_res, current_res = current_res, previous_res % current_res
+            previous_num, current_num = current_num, previous_num - (factor * current_num)
+
+        return current_num % modulus
+
+
+class BuiltinBackend(PureBackend):
+    """Python ints with inversion by the builtin modular power."""
+    name = 'builtin'
+
+    @staticmethod
+    def inverse(number, modulus):
+        """Inverse of a number modulo a prime, ZeroDivisionError for zero."""
+        try:
+            return pow(number, -1, modulus)
+        except ValueError:
+            raise ZeroDivisionError('{} is not invertible modulo {}'.format(number, modulus)) \
+                from None
+
+
+class Gmpy2Backend(PureBackend):
+    """GMP integers for projective coordinates with inversion by GMP."""
+    name = 'gmpy2'
+
+    @staticmethod
+    def element(number):
+        """Number in the representation of projective coordinates."""
+        return gmpy2.mpz(number)  # pylint: disable=no-member
+
+    @staticmethod
+    def inverse(number, modulus):
+        """Inverse of a number modulo a prime, ZeroDivisionError for zero."""
+        return int(gmpy2.invert(number, modulus))  # pylint: disable=no-member
+
+
+BACKENDS = {'pure': PureBackend()}
+
+if sys.version_info >= (3, 8):
+    BACKENDS['builtin'] = BuiltinBackend()
+
+if gmpy2 is not None:
+    BACKENDS['gmpy2'] = Gmpy2Backend()
+
+DEFAULT_BACKEND = next(name for name in ('gmpy2', 'builtin', 'pure') if name in BACKENDS)
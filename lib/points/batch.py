@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Batch point arithmetic sharing field inversions."""
+# pylint: disable=protected-access
+
+
+def batch_inverse(field, numbers):
+    """
+    Montgomery's simultaneous inversion of nonzero numbers:
+    one inversion and 3(n - 1) multiplications.
+    """
+    if not numbers:
+        return []
+
+    products = []
+    product = 1
+
+    for number in numbers:
+        product = field.multiply(product, number)
+        products.append(product)
+
+    inverse = field.inverse(product)
+    inverses = [None] * len(numbers)
+
+    for index in range(len(numbers) - 1, 0, -1):
+        inverses[index] = field.multiply(inverse, products[index - 1])
+        inverse = field.multiply(inverse, numbers[index])
+
+    inverses[0] = inverse
+
+    return inverses
+
+
+def batch_add(pairs):
+    """Sums of affine point pairs with a single inversion."""
+    results = [this._special_sum(that) for this, that in pairs]
+    pending = [index for index, result in enumerate(results) if result is None]
+
+    if not pending:
+        return results
+
+    slopes = [pairs[index][0]._slope(pairs[index][1]) for index in pending]
+
+    try:
+        inverses = batch_inverse(pairs[pending[0]][0], [denominator for _, denominator in slopes])
+    except ZeroDivisionError:
+        return [this + that for this, that in pairs]
+
+    for index, (numerator, _), inverse in zip(pending, slopes, inverses):
+        this, that = pairs[index]
+        results[index] = this._chord(that, this.multiply(numerator, inverse))
+
+    return results
+
+
+def batch_affine(items):
+    """Affine points of (point, projective result) items with a single inversion."""
+    results = [None] * len(items)
+    pending = []
+
+    for index, (point, result) in enumerate(items):
+        if result is None or not result[2]:
+            results[index] = point * 0
+        else:
+            pending.append(index)
+
+    if pending:
+        inverses = batch_inverse(items[pending[0]][0], [items[index][1][2] for index in pending])
+
+        for index, inverse in zip(pending, inverses):
+            point, result = items[index]
+            results[index] = point._affine(result, inverse)
+
+    return results
+
+
+def batch_odd_multiples(points, counts):
+    """Odd multiples P, 3P, 5P, ... of many points in lockstep, one inversion per step."""
+    multiples = [[point] for point in points]
+    doubling = [index for index, count in enumerate(counts) if count > 1]
+    doubles = dict(zip(doubling, batch_add([(points[index], points[index]) for index in doubling])))
+
+    for step in range(1, max(counts, default=0)):
+        active = [index for index in doubling if counts[index] > step]
+        sums = batch_add([(multiples[index][-1], doubles[index]) for index in active])
+
+        for index, total in zip(active, sums):
+            multiples[index].append(total)
+
+    return multiples
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Arithmetic of a binary field GF(2^m)."""
+from functools import lru_cache
+
+WINDOWS = [
+    (32, 3),
+    (160, 4)
+]
+
+DEFAULT_WINDOW = 5
+SPARSE_TERMS = 5
+
+# Inversion methods by name. benchmarks/binary_inversion.py shows the binary
+# extended Euclid ahead of Itoh-Tsujii for every degree up to 571 in CPython,
+# so Itoh-Tsujii is only used when a field is built with it explicitly.
+INVERSIONS = {
+    'euclid': 'euclid_inverse',
+    'itoh-tsujii': 'itoh_tsujii_inverse'
+}
+
+DEFAULT_INVERSION = 'euclid'
+
+
+def spread(byte):
+    """Interleaves zero bits into a byte, which squares it over GF(2)."""
+    result = 0
+
+    for index in range(8):
+        result |= (byte >> index & 1) << (2 * index)
+
+    return result
+
+
+SQUARES = [spread(byte).to_bytes(2, 'little') for byte in range(256)]
+
+
+class BinaryField:
+    """Binary field GF(2^m) given by an irreducible polynomial and an inversion method."""
+    def __init__(self, polynomial, inversion=DEFAULT_INVERSION):
+        if inversion not in INVERSIONS:
+            raise ValueError('Unknown inversion: {}, available ones are {}'
+                             .format(inversion, ', '.join(sorted(INVERSIONS))))
+
+        self.polynomial = polynomial
+        self.degree = polynomial.bit_length() - 1
+        self.mask = (1 << self.degree) - 1
+        self.powers = [power for power in range(self.degree) if polynomial >> power & 1]
+        self.sparse = len(self.powers) < SPARSE_TERMS
+        self.window = next(
+            (window for max_degree, window in WINDOWS if self.degree <= max_degree), DEFAULT_WINDOW)
+
+        self.inverse = getattr(self, INVERSIONS[inversion])
+
+    def modulus(self, number):
+        """Reduces a number modulo the polynomial."""
+        if self.sparse:
+            degree = self.degree
+            mask = self.mask
+            powers = self.powers
+
+            while number >> degree:
+                high = number >> degree
+                number &= mask
+
+                for power in powers:
+                    number ^= high << power
+
+            return number
+
+        bit_length = number.bit_length()
+        polynomial_bit_length = self.degree + 1
+
+        while bit_length >= polynomial_bit_length:
+            number ^= self.polynomial << (bit_length - polynomial_bit_length)
+            bit_length = number.bit_length()
+
+        return number
+
+    def multiply(self, this_num, that_num):
+        """Multiplies numbers by windows of the second one over a table of the first one."""
+        if not this_num or not that_num:
+            return 0
+
+        window = self.window
+        table = [0, this_num]
+
+        for index in range(2, 1 << window):
+            table.append(table[index >> 1] << 1 if index & 1 == 0 else table[index - 1] ^ this_num)
+
+        mask = (1 << window) - 1
+        shift = (that_num.bit_length() - 1) // window * window
+        result = 0
+
+        while shift >= 0:
+            result = (result << window) ^ table[that_num >> shift & mask]
+            shift -= window
+
+        return self.modulus(result)
+
+    def square(self, number):
+        """Squares a number by interleaving zero bits into it."""
+        length = (number.bit_length() + 7) // 8
+        spread_bytes = b''.join([SQUARES[byte] for byte in number.to_bytes(length, 'little')])
+
+        return self.modulus(int.from_bytes(spread_bytes, 'little'))
+
+    def euclid_inverse(self, number):
+        """Inverses a number by the binary extended Euclidean algorithm."""
+        this_num = self.modulus(number)
+        that_num = self.polynomial
+        this_bits = 1
+        that_bits = 0
+
+        if not this_num:
+            raise ZeroDivisionError('Zero has no inverse')
+
+        while this_num != 1:
+            shift = this_num.bit_length() - that_num.bit_length()
+
+            if shift < 0:
+                this_num, that_num = that_num, this_num
+                this_bits, that_bits = that_bits, this_bits
+                shift = -shift
+
+            this_num ^= that_num << shift
+            this_bits ^= that_bits << shift
+
+        return this_bits
+
+    def itoh_tsujii_inverse(self, number):
+        """Inverses a number as number^(2^m - 2) by an addition chain on m - 1."""
+        number = self.modulus(number)
+
+        if not number:
+            raise ZeroDivisionError('Zero has no inverse')
+
+        exponent = self.degree - 1
+        result = number
+        length = 1
+
+        for index in range(exponent.bit_length() - 2, -1, -1):
+            power = result
+
+            for _ in range(length):
+                power = self.square(power)
+
+            result = self.multiply(power, result)
+            length <<= 1
+
+            if exponent >> index & 1:
+                result = self.multiply(self.square(result), number)
+                length += 1
+
+        return self.square(result)
+
+
+@lru_cache(maxsize=None)
+def binary_field(polynomial):
+    """Shared field of a polynomial."""
+    return BinaryField(polynomial)
@@ -2,89 +2,44 @@
 # -*- coding: utf-8 -*-
 """Elliptic curve points."""
 from abc import ABCMeta
-from copy import copy
-from functools import reduce
 
 from lib.points import Point
-
-
-def convert_polynomial(polynomial):
-    """Convert polynomial to int."""
-    if polynomial is None:
-        return None
-    return reduce(lambda acc, power: acc ^ (1 << power), polynomial, 0)
+from lib.points.koblitz import tnaf
 
 
 class BinaryPoint(Point, metaclass=ABCMeta):
     # pylint: disable=abstract-method
     """Binary point from field of characteristic P."""
-    def __init__(self, params):
-        super().__init__(params)
+    __slots__ = ()
 
-        payload = params.get('payload')
-
-        if not isinstance(payload, int):
-            payload = convert_polynomial(payload)
-
-        self.polynomial = payload
+    @property
+    def polynomial(self):
+        """Irreducible polynomial of the field."""
+        return self.curve.polynomial
 
     def inverse(self, number):
         """Inverses a specified number."""
-        values = [number, self.polynomial]
-        bits = [1, 0]
-
-        while values[-1] != 1:
-            value_1_len = values[-1].bit_length()
-            value_2_len = values[-2].bit_length()
-
-            if value_1_len == value_2_len:
-                values.append(values[-1] ^ values[-2])
-                bits.append(bits[-1] ^ bits[-2])
-            elif value_1_len < value_2_len:
-                values.append(values[-1] << (value_2_len - value_1_len))
-                bits.append(bits[-1] << (value_2_len - value_1_len))
-                values[-1] = values[-1] ^ values[-3]
-                bits[-1] = bits[-1] ^ bits[-3]
-            else:
-                values.append(values[-2] << (value_1_len - value_2_len))
-                bits.append(bits[-2] << (value_1_len - value_2_len))
-                values[-1] = values[-1] ^ values[-2]
-                bits[-1] = bits[-1] ^ bits[-2]
-
-        return self.modulus(bits[-1])
+        return self.curve.field.inverse(number)
 
     def modulus(self, number):
         """Get modulus of number."""
-        bit_length = number.bit_length()
-        polynomial_bit_length = self.polynomial.bit_length()
-
-        while bit_length >= polynomial_bit_length:
-            number ^= self.polynomial << (bit_length - polynomial_bit_length)
-            bit_length = number.bit_length()
-
-        return number
+        return self.curve.field.modulus(number)
 
     def multiply(self, this_num, that_num):
         """Multiplies numbers."""
-        if not this_num or not that_num:
-            return 0
-
-        result = this_num
-
-        for bit in bin(that_num)[3:]:
-            result <<= 1
-            if bit == '1':
-                result ^= this_num
+        return self.curve.field.multiply(this_num, that_num)
 
-        return self.modulus(result)
+    def square(self, number):
+        """Squares a number."""
+        return self.curve.field.square(number)
 
     def __str__(self):
         if self.x is None or self.y is None:
             return 'e'
 
         return '({}, {})'.format(
-            bin(self.x)[2:].rjust(self.polynomial.bit_length() - 1, '0'),
-            bin(self.y)[2:].rjust(self.polynomial.bit_length() - 1, '0'),
+            bin(self.x)[2:].rjust(self.curve.field.degree, '0'),
+            bin(self.y)[2:].rjust(self.curve.field.degree, '0'),
         )
 
     __repr__ = __str__
@@ -92,8 +47,32 @@ class BinaryPoint(Point, metaclass=ABCMeta):
 
 class Point2N(BinaryPoint):
     """Point on not a supersingular curve."""
-    # pylint: disable=no-member
-    def __add__(self, addend):
+    __slots__ = ()
+
+    def on_curve(self):
+        """Whether the point satisfies y^2 + axy = x^3 + bx^2 + c."""
+        if self.x is None or self.y is None:
+            return True
+
+        x_square = self.square(self.x)
+        left = self.square(self.y) ^ self.multiply(self.a or 0, self.multiply(self.x, self.y))
+        right = self.multiply(x_square, self.x) ^ self.multiply(self.b or 0, x_square) \
+            ^ (self.c or 0)
+
+        return self.modulus(left) == self.modulus(right)
+
+    def multiplier(self, method=None):
+        """
+        Scalar multiplication engine of a method, the default one for points
+        of Koblitz curves is τNAF.
+        """
+        if method is None and self.curve.koblitz is not None and self.on_curve():
+            return tnaf
+
+        return super().multiplier(method)
+
+    def _special_sum(self, addend):
+        """Sum of points that needs no slope, None otherwise."""
         if not isinstance(addend, BinaryPoint):
             raise TypeError('Addend is not a point of non-supersingular curve: {}'.format(addend))
 
@@ -103,50 +82,160 @@ class Point2N(BinaryPoint):
         if addend.x is None or addend.y is None:
             return self
 
-        result = {
-            'payload': self.polynomial,
-            'coefficients': [self.a, self.b, self.c],
-        }
+        if self.x == addend.x and (self.x == 0 or self.y != addend.y):
+            return Point2N(None, None, self.curve)
+
+        return None
+
+    def _slope(self, addend):
+        """Numerator and denominator of the slope of a chord or tangent."""
+        if self.x == addend.x:
+            numerator = self.square(self.x) ^ self.multiply(self.a, self.y)
+
+            return numerator, self.multiply(self.x, self.a)
+
+        return self.y ^ addend.y, self.x ^ addend.x
+
+    def _chord(self, addend, factor):
+        """Sum of points by a known slope."""
+        factor_square = self.square(factor)
+        factorized_a = self.multiply(self.a, factor)
 
         if self.x == addend.x:
-            if self.x == 0 or self.y != addend.y:
-                return Point2N({})
-            numerator = self.multiply(self.x, self.x) ^ self.multiply(self.a, self.y)
-            denominator = self.inverse(self.multiply(self.x, self.a))
-            factor = self.multiply(numerator, denominator)
-            factor_square = self.multiply(factor, factor)
-            result['x'] = factor_square ^ self.b ^ self.multiply(factor, self.a)
+            res_x = factor_square ^ self.b ^ factorized_a
         else:
-            numerator = self.y ^ addend.y
-            x_xor = self.x ^ addend.x
-            denominator = self.inverse(x_xor)
-            factor = self.multiply(numerator, denominator)
-            factor_square = self.multiply(factor, factor)
-            factorized_a = self.multiply(self.a, factor)
-            result['x'] = factor_square ^ x_xor ^ factorized_a ^ self.b
+            res_x = factor_square ^ self.x ^ addend.x ^ factorized_a ^ self.b
+
+        factorized_x = self.multiply(factor, self.x ^ res_x)
+        res_y = self.y ^ factorized_x ^ self.multiply(self.a, res_x)
+
+        return Point2N(res_x, res_y, self.curve)
+
+    def _projective(self):
+        """
+        López-Dahab coordinates (X, Y, Z) of the point, x = X/Z, y = Y/Z^2,
+        on the isomorphic curve.
+        """
+        a_inverse, _ = self.curve.isomorphism
+
+        if a_inverse == 1:
+            return self.x, self.y, 1
+
+        a_inverse_square = self.square(a_inverse)
+        a_inverse_cube = self.multiply(a_inverse_square, a_inverse)
+
+        return self.multiply(self.x, a_inverse_square), self.multiply(self.y, a_inverse_cube), 1
+
+    def _double(self, point):
+        """Doubles a point in López-Dahab coordinates without inversion."""
+        x, y, z = point
+
+        if not z or not x:
+            return 1, 1, 0
+
+        # Tangent slope (X^2 + Y) / XZ keeps the formula free of c,
+        # so doubling agrees with the affine one for any input point.
+        _, b = self.curve.isomorphism
+        x_square = self.square(x)
+        numerator = x_square ^ y
+        denominator = self.multiply(x, z)
+        chord = numerator ^ denominator
+        res_z = self.square(denominator)
+        res_x = self.multiply(numerator, chord) ^ self.multiply(b, res_z)
+        res_y = self.multiply(self.square(x_square), res_z) ^ self.multiply(
+            self.multiply(denominator, chord), res_x)
+
+        return res_x, res_y, res_z
+
+    def _frobenius(self, point):
+        """Frobenius map (x^2, y^2) of a point in López-Dahab coordinates."""
+        x, y, z = point
+
+        return self.square(x), self.square(y), self.square(z)
+
+    def _add(self, point, base):
+        """Adds an affine base to a point in López-Dahab coordinates."""
+        x, y, z = point
+        base_x, base_y, _ = base
+
+        if not z:
+            return base
+
+        z_square = self.square(z)
+        numerator = self.multiply(base_y, z_square) ^ y
+        denominator = self.multiply(base_x, z) ^ x
+
+        if not denominator:
+            if numerator:
+                return 1, 1, 0
+
+            return self._double(base)
+
+        _, b = self.curve.isomorphism
+        c = self.multiply(z, denominator)
+        d = self.multiply(self.square(denominator), c ^ self.multiply(b, z_square))
+        res_z = self.square(c)
+        e = self.multiply(numerator, c)
+        res_x = self.square(numerator) ^ d ^ e
+        f = res_x ^ self.multiply(base_x, res_z)
+        g = self.multiply(base_x ^ base_y, self.square(res_z))
+        res_y = self.multiply(e ^ res_z, f) ^ g
+
+        return res_x, res_y, res_z
 
-        factorized_x = self.multiply(factor, self.x ^ result['x'])
-        result['y'] = self.y ^ factorized_x ^ self.multiply(self.a, result['x'])
+    def _affine(self, point, z_inverse=None):
+        """Converts a point from López-Dahab coordinates with a single inversion."""
+        x, y, z = point
 
-        return Point2N(result)
+        if not z:
+            return Point2N(None, None, self.curve)
+
+        if z_inverse is None:
+            z_inverse = self.inverse(z)
+
+        x = self.multiply(x, z_inverse)
+        y = self.multiply(y, self.square(z_inverse))
+
+        if self.a != 1:
+            a_square = self.square(self.a)
+            x = self.multiply(x, a_square)
+            y = self.multiply(y, self.multiply(a_square, self.a))
+
+        return Point2N(x, y, self.curve)
+
+    def __neg__(self):
+        if self.x is None or self.y is None:
+            return self
+
+        return Point2N(self.x, self.multiply(self.x, self.a) ^ self.y, self.curve)
 
     def __mul__(self, factor):
         if factor < 0:
-            new_point = copy(self)
-            new_point.y = self.multiply(self.x, self.a) ^ self.y
-
-            return new_point * (-factor)
+            return -self * -factor
 
         if factor == 0:
-            return Point2N({})
+            return Point2N(None, None, self.curve)
 
         return self.factorize(factor)
 
 
 class Point2S(BinaryPoint):
     """Point on a supersingular curve."""
-    # pylint: disable=no-member
-    def __add__(self, addend):
+    __slots__ = ()
+
+    def on_curve(self):
+        """Whether the point satisfies y^2 + ay = x^3 + bx + c."""
+        if self.x is None or self.y is None:
+            return True
+
+        left = self.square(self.y) ^ self.multiply(self.a or 0, self.y)
+        right = self.multiply(self.square(self.x), self.x) ^ self.multiply(self.b or 0, self.x) \
+            ^ (self.c or 0)
+
+        return self.modulus(left) == self.modulus(right)
+
+    def _special_sum(self, addend):
+        """Sum of points that needs no slope, None otherwise."""
         if not isinstance(addend, BinaryPoint):
             raise TypeError('Addend is not a point of supersingular curve: {}'.format(addend))
 
@@ -156,37 +245,107 @@ class Point2S(BinaryPoint):
         if addend.x is None or addend.y is None:
             return self
 
-        result = {
-            'payload': self.polynomial,
-            'coefficients': [self.a, self.b, self.c],
-        }
+        if self.x == addend.x and self.y != addend.y:
+            return Point2S(None, None, self.curve)
+
+        return None
+
+    def _slope(self, addend):
+        """Numerator and denominator of the slope of a chord or tangent."""
+        if self.x == addend.x:
+            return self.multiply(self.x, addend.x) ^ self.b, self.a
+
+        return self.y ^ addend.y, self.x ^ addend.x
 
+    def _chord(self, addend, factor):
+        """Sum of points by a known slope."""
         if self.x == addend.x:
-            if self.x == 0 or self.y != addend.y:
-                return Point2N({})
-            numerator = self.multiply(self.x, addend.x) ^ self.b
-            denominator = self.inverse(self.a)
-            factor = self.multiply(numerator, denominator)
-            result['x'] = self.multiply(factor, factor)
+            res_x = self.square(factor)
         else:
-            numerator = self.y ^ addend.y
-            x_xor = self.x ^ addend.x
-            denominator = self.inverse(x_xor)
-            factor = self.multiply(numerator, denominator)
-            result['x'] = self.multiply(factor, factor) ^ self.x ^ addend.x
+            res_x = self.square(factor) ^ self.x ^ addend.x
+
+        res_y = self.multiply(self.x ^ res_x, factor) ^ self.y ^ self.a
+
+        return Point2S(res_x, res_y, self.curve)
 
-        result['y'] = self.multiply(self.x ^ result['x'], factor) ^ self.y ^ self.a
+    def _projective(self):
+        """Jacobian coordinates (X, Y, Z) of the point, x = X/Z^2, y = Y/Z^3."""
+        return self.x, self.y, 1
 
-        return Point2N(result)
+    def _double(self, point):
+        """Doubles a point in Jacobian coordinates without inversion."""
+        x, y, z = point
+
+        if not z:
+            return 1, 1, 0
+
+        z_square = self.square(z)
+        z_fourth = self.square(z_square)
+        numerator = self.square(x) ^ self.multiply(self.b, z_fourth)
+        a_z_cube = self.multiply(self.a, self.multiply(z, z_square))
+        a_z_cube_square = self.square(a_z_cube)
+        res_z = self.multiply(self.a, z_fourth)
+        res_x = self.square(numerator)
+        res_y = self.multiply(numerator, self.multiply(a_z_cube_square, x) ^ res_x) \
+            ^ self.multiply(self.multiply(a_z_cube_square, a_z_cube), y) \
+            ^ self.multiply(self.a, self.multiply(res_z, self.square(res_z)))
+
+        return res_x, res_y, res_z
+
+    def _add(self, point, base):
+        """Adds an affine base to a point in Jacobian coordinates."""
+        x, y, z = point
+        base_x, base_y, _ = base
+
+        if not z:
+            return base
+
+        z_square = self.square(z)
+        numerator = y ^ self.multiply(base_y, self.multiply(z_square, z))
+        denominator = x ^ self.multiply(base_x, z_square)
+
+        if not denominator:
+            if numerator:
+                return 1, 1, 0
+
+            return self._double(base)
+
+        res_z = self.multiply(z, denominator)
+        res_z_square = self.square(res_z)
+        res_x = self.square(numerator) \
+            ^ self.multiply(denominator, self.square(denominator))
+        res_y = self.multiply(numerator, self.multiply(base_x, res_z_square) ^ res_x) \
+            ^ self.multiply(base_y ^ self.a, self.multiply(res_z_square, res_z))
+
+        return res_x, res_y, res_z
+
+    def _affine(self, point, z_inverse=None):
+        """Converts a point from Jacobian coordinates with a single inversion."""
+        x, y, z = point
+
+        if not z:
+            return Point2S(None, None, self.curve)
+
+        if z_inverse is None:
+            z_inverse = self.inverse(z)
+
+        z_inverse_square = self.square(z_inverse)
+
+        return Point2S(self.multiply(x, z_inverse_square),
+                       self.multiply(y, self.multiply(z_inverse_square, z_inverse)),
+                       self.curve)
+
+    def __neg__(self):
+        if self.x is None or self.y is None:
+            return self
+
+        return Point2S(self.x, self.y ^ self.a, self.curve)
 
     def __mul__(self, factor):
         if factor < 0:
-            new_point = copy(self)
-            new_point.y = self.y ^ self.a
-
-            return new_point * (-factor)
+            return -self * -factor
 
         if factor == 0:
-            return Point2S({})
+            return Point2S(None, None, self.curve)
 
         return self.factorize(factor)
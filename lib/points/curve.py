@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Elliptic curve context shared by its points."""
+from collections import namedtuple
+from functools import lru_cache, reduce
+
+from lib.points.binary_field import binary_field
+from lib.points.named_curves import NAMED_CURVES
+
+
+def convert_polynomial(polynomial):
+    """Convert polynomial to int."""
+    if polynomial is None:
+        return None
+    return reduce(lambda acc, power: acc ^ (1 << power), polynomial, 0)
+
+
+@lru_cache(maxsize=None)
+def named_orders():
+    """Orders of the named curves by their parameters."""
+    orders = {}
+
+    for curve in NAMED_CURVES.values():
+        order = curve['subgroup_order'] * curve['cofactor']
+        key = Curve(curve['curve_type'], curve['payload'], curve['coefficients'], order).key
+        orders[key] = order
+
+    return orders
+
+
+CurveParameters = namedtuple('CurveParameters', (
+    'curve_type', 'payload', 'coefficients', 'a', 'b', 'c', 'modulus', 'polynomial', 'field',
+    'isomorphism', 'a_is_minus_3', 'koblitz', 'order'))
+
+
+class Curve(CurveParameters):
+    """
+    Immutable and hashable curve: type, field and coefficients with
+    the constants derived from them. Points keep a reference to it
+    instead of copies of the parameters. The number of points is known
+    for named curves or may be specified.
+    """
+    __slots__ = ()
+
+    def __new__(cls, curve_type, payload, coefficients, order=None):
+        coefficients = list(coefficients) + [None] * (3 - len(coefficients))
+        modulus = polynomial = field = isomorphism = koblitz = None
+        a_is_minus_3 = False
+
+        if curve_type == 'p':
+            payload = tuple(payload)
+            modulus = payload[0]
+            coefficients = [coefficient % modulus if coefficient is not None else None
+                            for coefficient in coefficients]
+            a_is_minus_3 = coefficients[0] == modulus - 3
+        else:
+            polynomial = payload if isinstance(payload, int) else convert_polynomial(payload)
+            payload = polynomial
+            field = binary_field(polynomial)
+            coefficients = [field.modulus(coefficient) if coefficient is not None else None
+                            for coefficient in coefficients]
+
+            if curve_type == 'n':
+                isomorphism = cls._isomorphism(field, *coefficients[:2])
+                koblitz = cls._koblitz(*coefficients)
+
+        coefficients = tuple(coefficients)
+        order = order or named_orders().get((curve_type, payload, coefficients))
+
+        return super().__new__(cls, curve_type, payload, coefficients, *coefficients, modulus,
+                               polynomial, field, isomorphism, a_is_minus_3, koblitz, order)
+
+    @staticmethod
+    def _isomorphism(field, a, b):
+        """
+        Scale a^-1 and coefficient b' of the curve y^2 + xy = x^3 + b'x^2 + c'
+        isomorphic to y^2 + axy = x^3 + bx^2 + c. Point arithmetic never
+        needs c', so it is not computed.
+        """
+        if a == 1 or not a:
+            return 1, b or 0
+
+        a_inverse = field.inverse(a)
+
+        return a_inverse, field.multiply(b, field.square(a_inverse)) if b else 0
+
+    @staticmethod
+    def _koblitz(a, b, c):
+        """
+        Trace μ of the Frobenius map of a Koblitz curve y^2 + xy = x^3 + bx^2 + 1,
+        b in {0, 1}: 1 for b = 1, -1 for b = 0, None for other curves.
+        """
+        if a != 1 or c != 1 or b not in (None, 0, 1):
+            return None
+
+        return 1 if b == 1 else -1
+
+    @property
+    def key(self):
+        """Parameters identifying the curve."""
+        return self.curve_type, self.payload, self.coefficients
+
+    def __eq__(self, other):
+        return isinstance(other, Curve) and self.key == other.key
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __reduce__(self):
+        payload = self.payload if self.curve_type == 'p' else self.polynomial
+        return Curve, (self.curve_type, payload, self.coefficients, self.order)
+
+    def __str__(self):
+        return 'Curve({}, {}, {})'.format(*self.key)
+
+    __repr__ = __str__
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Enumeration of all points of curves over small fields with their orders.
+
+Over prime fields every x is checked at once against a table of square
+roots of all residues. Over binary fields y^2 + sy = r is rewritten as
+z^2 + z = r / s^2 with y = sz and solved for all x at once by a table of
+the roots z of every z^2 + z. Field products of whole arrays are carry-less
+shifts and reductions. Point orders divide the group order and are found by
+multiplications of whole blocks. NumPy is optional: without it points are
+found x by x and orders point by point.
+"""
+from random import Random
+
+from lib.points import POINTS
+from lib.points.logarithm import factorize, point_order
+from lib.points.order import coefficients, count_points, field_size, is_singular, y_roots
+from lib.points.vectorized import VectorizedEngine, vectorized_available
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+MAX_FIELD_BITS = 24
+
+BLOCK_SIZE = 1 << 14
+
+
+def check_curve(curve):
+    """Raises ValueError for singular curves and fields too large to enumerate."""
+    if is_singular(curve):
+        raise ValueError('Curve is singular, its points form no group')
+
+    if field_size(curve) > 1 << MAX_FIELD_BITS:
+        raise ValueError('Field is too large to enumerate, at most 2^{} elements are supported'
+                         .format(MAX_FIELD_BITS))
+
+
+def prime_roots(modulus):
+    """Least square root of every residue, -1 for non-residues."""
+    roots = numpy.full(modulus, -1, dtype=numpy.int64)
+    halves = numpy.arange(modulus // 2 + 1, dtype=numpy.int64)
+    roots[halves * halves % modulus] = halves
+
+    return roots
+
+
+def array_reduce(field, values):
+    """Field elements of carry-less products of arrays."""
+    for bit in range(2 * field.degree - 2, field.degree - 1, -1):
+        values = values ^ numpy.where(values >> bit & 1,
+                                      field.polynomial << (bit - field.degree), 0)
+
+    return values
+
+
+def array_multiply(field, this, that):
+    """Elementwise field products of arrays."""
+    result = numpy.zeros_like(this)
+
+    for bit in range(field.degree):
+        result ^= numpy.where(that >> bit & 1, this << bit, 0)
+
+    return array_reduce(field, result)
+
+
+def array_inverse(field, values):
+    """Elementwise field inverses number^(2^m - 2) of arrays, zero for zero."""
+    result = numpy.ones_like(values)
+    power = values
+
+    for _ in range(field.degree - 1):
+        power = array_multiply(field, power, power)
+        result = array_multiply(field, result, power)
+
+    return result
+
+
+def quadratic_roots(field):
+    """Even root z of z^2 + z = c of every element c, -1 if there is none."""
+    roots = numpy.full(1 << field.degree, -1, dtype=numpy.int64)
+    evens = numpy.arange(0, 1 << field.degree, 2, dtype=numpy.int64)
+    roots[array_multiply(field, evens, evens) ^ evens] = evens
+
+    return roots
+
+
+def prime_block(curve, roots, start, stop):
+    """Coordinates (x, y) of the points of a prime curve with x in [start, stop)."""
+    p = curve.modulus
+    a, b, _ = coefficients(curve)
+    x = numpy.arange(start, stop, dtype=numpy.int64)
+    y = roots[((x * x % p) * x + a * x + b) % p]
+    found = y >= 0
+    twice = found & (y != 0)
+
+    return (numpy.concatenate((x[found], x[twice])),
+            numpy.concatenate((y[found], p - y[twice])))
+
+
+def binary_block(curve, roots, start, stop):
+    """Coordinates (x, y) of the points of a binary curve with x in [start, stop)."""
+    # pylint: disable=too-many-locals
+    field = curve.field
+    a, b, c = coefficients(curve)
+    x = numpy.arange(start, stop, dtype=numpy.int64)
+    x_square = array_multiply(field, x, x)
+    x_cube = array_multiply(field, x_square, x)
+
+    if curve.curve_type == 'n':
+        rhs = x_cube ^ array_multiply(field, numpy.full_like(x, b), x_square) ^ c
+        scale = array_multiply(field, numpy.full_like(x, a), x)
+    else:
+        rhs = x_cube ^ array_multiply(field, numpy.full_like(x, b), x) ^ c
+        scale = numpy.full_like(x, a)
+
+    # y^2 = rhs has the single root rhs^(2^(m-1)) where the scale vanishes.
+    single = rhs
+
+    for _ in range(field.degree - 1):
+        single = array_multiply(field, single, single)
+
+    inverse = array_inverse(field, scale)
+    z = roots[array_multiply(field, rhs, array_multiply(field, inverse, inverse))]
+    y = array_multiply(field, scale, numpy.maximum(z, 0))
+    vanishing = scale == 0
+    found = ~vanishing & (z >= 0)
+
+    return (numpy.concatenate((x[vanishing], x[found], x[found])),
+            numpy.concatenate((single[vanishing], y[found], y[found] ^ scale[found])))
+
+
+def vectorized_coordinates(curve, block_size):
+    """Lazy blocks of arrays (x, y) of points ordered by x and y found by a table of roots."""
+    if curve.curve_type == 'p':
+        roots = prime_roots(curve.modulus)
+        block = prime_block
+    else:
+        roots = quadratic_roots(curve.field)
+        block = binary_block
+
+    size = field_size(curve)
+
+    for start in range(0, size, block_size):
+        x, y = block(curve, roots, start, min(start + block_size, size))
+        indices = numpy.lexsort((y, x))
+
+        yield x[indices], y[indices]
+
+
+def plain_points(curve, block_size):
+    """Lazy blocks of points ordered by x and y found x by x."""
+    point_class = POINTS[curve.curve_type]
+    block = []
+
+    for x in range(field_size(curve)):
+        block += [point_class(x, y, curve) for y in y_roots(curve, x, Random(x))]
+
+        if len(block) >= block_size:
+            yield block
+            block = []
+
+    if block:
+        yield block
+
+
+def points_blocks(curve, block_size=BLOCK_SIZE):
+    """Lazy blocks of the affine points of a curve ordered by x and y, infinity excluded."""
+    check_curve(curve)
+
+    if numpy is None:
+        return plain_points(curve, block_size)
+
+    point_class = POINTS[curve.curve_type]
+
+    return ([point_class(x, y, curve) for x, y in zip(x.tolist(), y.tolist())]
+            for x, y in vectorized_coordinates(curve, block_size))
+
+
+def count(curve):
+    """Number of points of a curve, infinity included."""
+    check_curve(curve)
+
+    if numpy is None:
+        return count_points(curve)
+
+    return 1 + sum(len(x) for x, _ in vectorized_coordinates(curve, BLOCK_SIZE << 4))
+
+
+def block_orders(points, order, order_factors):
+    """
+    Orders of a block of points of a group of an order with its prime
+    factors: the q-part of the order of P is the least q^k with
+    q^k * (order / q^e) * P at infinity.
+    """
+    curve = points[0].curve
+
+    if numpy is None or not vectorized_available(curve):
+        return [point_order(point, order_factors) for point in points]
+
+    engine = VectorizedEngine(curve)
+    batch = engine.arrays(points)
+    orders = numpy.ones(len(points), dtype=numpy.int64)
+
+    for prime, exponent in order_factors.items():
+        current = engine.multiply(batch, [order // prime ** exponent] * len(points))
+
+        for _ in range(exponent):
+            finite = ~current[2]
+
+            if not finite.any():
+                break
+
+            orders[finite] *= prime
+            current = engine.multiply(current, [prime] * len(points))
+
+    return orders.tolist()
+
+
+def group_structure(order, exponent):
+    """Invariants (n1, n2) of the group Z/n1 x Z/n2, n2 divides n1."""
+    return exponent, order // exponent
+
+
+def enumerate_points(curve, order=None):
+    """
+    Lazy pairs of every point of a curve, infinity first, and its order.
+    The group order is counted unless it is given.
+    """
+    if order is None:
+        order = count(curve)
+
+    order_factors = factorize(order)
+
+    yield POINTS[curve.curve_type](None, None, curve), 1
+
+    for block in points_blocks(curve):
+        yield from zip(block, block_orders(block, order, order_factors))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Fixed-base windowed precomputation."""
+from lib.points.multipliers import accumulate, projective
+
+WINDOW = 4
+
+
+class FixedBaseTable:
+    """
+    Table of multiples d * 2^(w * j) * P of a base point, so that
+    multiplication takes one mixed addition per window and no doublings.
+    """
+    # pylint: disable=too-few-public-methods
+    def __init__(self, point, bit_length, window=WINDOW, rows=None):
+        self.point = point
+        self.bit_length = bit_length
+        self.window = window
+        self.rows = rows
+
+        if rows is not None:
+            return
+
+        self.rows = []
+        base = point
+
+        for _ in range(-(-bit_length // window)):
+            row = [base]
+
+            for _ in range((1 << window) - 2):
+                row.append(row[-1] + base)
+
+            base = row[-1] + base
+            self.rows.append([projective(multiple) for multiple in row])
+
+    def multiply(self, factor):
+        """Multiplies the base point by a positive factor of at most bit_length bits."""
+        result = self.multiply_projective(factor)
+
+        if result is None:
+            return self.point * 0
+
+        return self.point._affine(result)  # pylint: disable=protected-access
+
+    def multiply_projective(self, factor):
+        """Product in projective coordinates, None for infinity."""
+        mask = (1 << self.window) - 1
+        result = None
+
+        for index, row in enumerate(self.rows):
+            digit = factor >> (index * self.window) & mask
+
+            if digit:
+                result = accumulate(self.point, result, row[digit - 1])
+
+        return result
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Scalar multiplication on Koblitz curves y^2 + xy = x^3 + ax^2 + 1,
+a in {0, 1}, by width-w τ-adic NAF.
+
+The Frobenius map τ(x, y) = (x^2, y^2) satisfies τ^2 - μτ + 2 = 0 with
+μ = (-1)^(1 - a), so a factor is rewritten as an element r0 + r1τ of
+Z[τ] and every doubling becomes a Frobenius map of three squarings.
+The factor is reduced modulo τ^m - 1, which annihilates every point
+of the curve over GF(2^m), so the expansion has about m digits.
+"""
+from fractions import Fraction
+from functools import lru_cache
+
+from lib.points.multipliers import multiples_count, odd_multiples, signed_digits, signed_sum, \
+    window_size
+
+MAX_TNAF_WINDOW = 5
+
+
+def lucas(mu, index):
+    """Lucas sequence terms (U[k-1], U[k]) with U[0] = 0, U[1] = 1, U[k+1] = μU[k] - 2U[k-1]."""
+    previous, current = 0, 1
+
+    for _ in range(index - 1):
+        previous, current = current, mu * current - 2 * previous
+
+    return previous, current
+
+
+def tau_power(mu, index):
+    """Element τ^k = U[k]τ - 2U[k-1] of Z[τ] as a pair (r0, r1)."""
+    previous, current = lucas(mu, index)
+
+    return -2 * previous, current
+
+
+def norm(element, mu):
+    """Norm r0^2 + μr0r1 + 2r1^2 of an element of Z[τ]."""
+    r0, r1 = element
+
+    return r0 * r0 + mu * r0 * r1 + 2 * r1 * r1
+
+
+def multiply(this, that, mu):
+    """Product of elements of Z[τ]."""
+    this0, this1 = this
+    that0, that1 = that
+
+    return this0 * that0 - 2 * this1 * that1, this0 * that1 + this1 * that0 + mu * this1 * that1
+
+
+def round_element(lambda0, lambda1, mu):
+    """Element of Z[τ] nearest to a rational one, Solinas' rounding."""
+    f0 = round(lambda0)
+    f1 = round(lambda1)
+    eta0 = lambda0 - f0
+    eta1 = lambda1 - f1
+    h0 = h1 = 0
+    eta = 2 * eta0 + mu * eta1
+
+    if eta >= 1:
+        if eta0 - 3 * mu * eta1 < -1:
+            h1 = mu
+        else:
+            h0 = 1
+    elif eta0 + 4 * mu * eta1 >= 2:
+        h1 = mu
+
+    if eta < -1:
+        if eta0 - 3 * mu * eta1 >= 1:
+            h1 = -mu
+        else:
+            h0 = -1
+    elif eta0 + 4 * mu * eta1 < -2:
+        h1 = -mu
+
+    return f0 + h0, f1 + h1
+
+
+@lru_cache(maxsize=None)
+def frobenius_modulus(degree, mu):
+    """Element τ^m - 1 of Z[τ] and its norm."""
+    r0, r1 = tau_power(mu, degree)
+    modulus = r0 - 1, r1
+
+    return modulus, norm(modulus, mu)
+
+
+def reduce_factor(factor, degree, mu):
+    """Element r0 + r1τ of small norm congruent to a factor modulo τ^m - 1."""
+    (s0, s1), modulus_norm = frobenius_modulus(degree, mu)
+    quotient = round_element(Fraction(factor * (s0 + mu * s1), modulus_norm),
+                             Fraction(-factor * s1, modulus_norm), mu)
+    q0, q1 = multiply(quotient, (s0, s1), mu)
+
+    return factor - q0, -q1
+
+
+@lru_cache(maxsize=None)
+def tau_image(mu, window):
+    """Image t of τ in Z/2^w with kernel τ^w Z[τ]: t = 2U[w-1]/U[w] mod 2^w."""
+    previous, current = lucas(mu, window)
+    modulus = 1 << window
+    inverse = current
+
+    # Newton's iteration doubles the number of correct low bits of an odd inverse.
+    for _ in range(window.bit_length()):
+        inverse = inverse * (2 - current * inverse) % modulus
+
+    return 2 * previous * inverse % modulus
+
+
+def tau_naf(element, mu, window):
+    """
+    Width-w τ-adic NAF of an element of Z[τ], least significant digit first.
+    Digits are odd integers u, |u| < 2^(w-1), standing for u itself.
+    """
+    image = tau_image(mu, window)
+
+    return signed_digits(element, window, lambda r0, r1: r0 + r1 * image,
+                         lambda r0, r1: (r1 + mu * (r0 // 2), -(r0 // 2)))
+
+
+def frobenius(point, result):
+    """Frobenius map of a projective result, None stands for infinity."""
+    if result is None:
+        return None
+
+    return point._frobenius(result)  # pylint: disable=protected-access
+
+
+def tnaf(point, factor, window=None, multiples=None):
+    """Width-w τNAF multiplication with odd multiples and their negations."""
+    curve = point.curve
+    degree = curve.field.degree
+
+    if window is None:
+        window = window_size(degree)
+
+    window = min(window, MAX_TNAF_WINDOW)
+
+    if multiples is None:
+        multiples = odd_multiples(point, multiples_count('wnaf', window))
+
+    return signed_sum(point, tau_naf(reduce_factor(factor, degree, curve.koblitz),
+                                      curve.koblitz, window), multiples, frobenius)
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Discrete logarithms: k with kP = Q for points P and Q of a curve.
+
+The order of P is split by Pohlig-Hellman into prime power subgroups.
+Logarithms in subgroups of a prime order up to BSGS_LIMIT are found by
+baby-step giant-step, larger ones by Pollard's rho with r-adding walks.
+Walks run in batches sharing field inversions and report distinguished
+points, the ones with a zero bit window in x, to a table. Two walks
+meeting at a distinguished point give the logarithm, so batches of
+independent walks spread over worker processes scale with their number.
+"""
+from random import Random
+
+from lib.points.batch import batch_add
+from lib.points.order import group_order, integer_sqrt
+
+BSGS_LIMIT = 1 << 16
+
+RHO_STEPS = 32
+
+RHO_WALKS = 32
+
+WALK_SEGMENTS = 16
+
+SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+
+def is_prime(number):
+    """Miller-Rabin test, deterministic below 3.3 * 10^24 and probable beyond."""
+    if number < 2:
+        return False
+
+    for prime in SMALL_PRIMES:
+        if number % prime == 0:
+            return number == prime
+
+    odd = number - 1
+    shift = (odd & -odd).bit_length() - 1
+    odd >>= shift
+
+    for witness in SMALL_PRIMES:
+        power = pow(witness, odd, number)
+
+        if power in (1, number - 1):
+            continue
+
+        for _ in range(shift - 1):
+            power = power * power % number
+
+            if power == number - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def gcd(this, that):
+    """Greatest common divisor."""
+    while that:
+        this, that = that, this % that
+
+    return this
+
+
+def rho_divisor(number, seed=1):
+    """Nontrivial divisor of an odd composite number by Pollard-Brent rho."""
+    while True:
+        value = saved = seed
+        power = 1
+        divisor = 1
+
+        while divisor == 1:
+            saved = value
+
+            for _ in range(power):
+                value = (value * value + seed) % number
+                divisor = gcd(abs(value - saved), number)
+
+                if divisor != 1:
+                    break
+
+            power <<= 1
+
+        if divisor != number:
+            return divisor
+
+        seed += 1
+
+
+def factorize(number):
+    """Prime factors of a positive number with their multiplicities as {prime: exponent}."""
+    factors = {}
+    pending = [number]
+
+    while pending:
+        number = pending.pop()
+
+        for prime in SMALL_PRIMES:
+            while number % prime == 0:
+                factors[prime] = factors.get(prime, 0) + 1
+                number //= prime
+
+        if number == 1:
+            continue
+
+        if is_prime(number):
+            factors[number] = factors.get(number, 0) + 1
+            continue
+
+        divisor = rho_divisor(number)
+        pending += [divisor, number // divisor]
+
+    return factors
+
+
+def point_order(point, order_factors):
+    """Order of a point dividing the group order given by its prime factors."""
+    order = 1
+
+    for prime, exponent in order_factors.items():
+        order *= prime ** exponent
+
+    for prime, exponent in order_factors.items():
+        for _ in range(exponent):
+            if (point * (order // prime)).x is not None:
+                break
+
+            order //= prime
+
+    return order
+
+
+def baby_giant(base, target, order):
+    """Logarithm of a target to a base of an order by baby-step giant-step, None if none."""
+    steps = integer_sqrt(order) + 1
+    current = base * 0
+    baby = {}
+
+    for index in range(steps):
+        baby.setdefault((current.x, current.y), index)
+        current += base
+
+    giant = -current
+    current = target
+
+    for index in range(0, order + steps, steps):
+        step = baby.get((current.x, current.y))
+
+        if step is not None:
+            return (index + step) % order
+
+        current += giant
+
+    return None
+
+
+def distinguished_bits(order):
+    """Zero bits marking distinguished points, a walk meets one every 2^bits steps."""
+    return max(order.bit_length() // 4 - 2, 0)
+
+
+def rho_walks(base, target, order, steps, seed, bits, count=RHO_WALKS):
+    """
+    Distinguished points (x, y, a, b) of a count of random walks X = aP + bQ
+    with RHO_STEPS adding steps, every walk runs WALK_SEGMENTS * 2^bits steps.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    generator = Random(seed)
+    # The low bits of x select a step, the next ones mark distinguished points.
+    mask = ((1 << bits) - 1) * RHO_STEPS
+    walks = [None] * count
+    found = []
+
+    for _ in range(WALK_SEGMENTS << bits):
+        pairs = []
+
+        for index, walk in enumerate(walks):
+            while walk is None or walk[0].x is None:
+                a, b = generator.randrange(order), generator.randrange(order)
+                walk = walks[index] = base * a + target * b, a, b
+
+            pairs.append((walk[0], steps[walk[0].x % RHO_STEPS][0]))
+
+        for index, point in enumerate(batch_add(pairs)):
+            _, a, b = walks[index]
+            _, step_a, step_b = steps[pairs[index][0].x % RHO_STEPS]
+            walks[index] = point, (a + step_a) % order, (b + step_b) % order
+
+            if point.x is not None and not point.x & mask:
+                found.append((point.x, point.y) + walks[index][1:])
+
+    return found
+
+
+def rho_steps(base, target, order, generator):
+    """Adding steps (aP + bQ, a, b) of r-adding walks."""
+    steps = []
+
+    for _ in range(RHO_STEPS):
+        a, b = generator.randrange(order), generator.randrange(order)
+        steps.append((base * a + target * b, a, b))
+
+    return steps
+
+
+def collide(this, that, order):
+    """Logarithm of two walks meeting at a point up to its sign, None if they are dependent."""
+    _, y, a, b = this
+    _, other_y, other_a, other_b = that
+
+    if y != other_y:
+        other_a, other_b = -other_a, -other_b
+
+    denominator = (other_b - b) % order
+
+    if not denominator:
+        return None
+
+    return (a - other_a) * pow(denominator, order - 2, order) % order
+
+
+def rho(base, target, order, executor=None, jobs=1, seed=0):
+    """
+    Logarithm of a target to a base of a prime order by Pollard's rho,
+    batches of walks run in jobs processes of an executor if there is one.
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    generator = Random(seed)
+    steps = rho_steps(base, target, order, generator)
+    bits = distinguished_bits(order)
+    table = {}
+
+    def batches():
+        while True:
+            yield base, target, order, steps, generator.getrandbits(64), bits
+
+    tasks = batches()
+    pending = []
+
+    if executor is not None:
+        pending = [executor.submit(rho_walks, *next(tasks)) for _ in range(jobs)]
+
+    while True:
+        if executor is None:
+            found = rho_walks(*next(tasks))
+        else:
+            found = pending.pop(0).result()
+            pending.append(executor.submit(rho_walks, *next(tasks)))
+
+        for point in found:
+            other = table.setdefault(point[0], point)
+
+            if other is point:
+                continue
+
+            result = collide(point, other, order)
+
+            if result is not None:
+                for future in pending:
+                    future.cancel()
+
+                return result
+
+
+def prime_power_log(base, target, prime, exponent, executor=None, jobs=1):
+    """Logarithm modulo prime^exponent to a base of that order, digit by digit."""
+    # pylint: disable=too-many-arguments
+    generator = base * prime ** (exponent - 1)
+    current = target
+    result = 0
+
+    for index in range(exponent):
+        remainder = current * prime ** (exponent - 1 - index)
+
+        if remainder.x is None:
+            continue
+
+        if prime <= BSGS_LIMIT:
+            digit = baby_giant(generator, remainder, prime)
+        else:
+            digit = rho(generator, remainder, prime, executor, jobs)
+
+        if digit is None:
+            return None
+
+        result += digit * prime ** index
+        current += -(base * (digit * prime ** index))
+
+    return result
+
+
+def logarithm(base, target, executor=None, jobs=1):
+    """
+    Least k >= 0 with k * base = target. Raises ValueError when the group
+    order is unknown, a point is off the curve or the target is not a
+    multiple of the base.
+    """
+    if not base.on_curve() or not target.on_curve():
+        raise ValueError('points are not on the curve')
+
+    order = group_order(base.curve, type(base))
+
+    if order is None:
+        raise ValueError('group order is unknown, it may be specified after the curve')
+
+    if target.x is None:
+        return 0
+
+    if base.x is None:
+        raise ValueError('target is not a multiple of the base')
+
+    base_order = point_order(base, factorize(order))
+    modulus = 1
+    result = 0
+
+    for prime, exponent in sorted(factorize(base_order).items()):
+        power = prime ** exponent
+        cofactor = base_order // power
+        residue = prime_power_log(base * cofactor, target * cofactor, prime, exponent, executor,
+                                  jobs)
+
+        if residue is None:
+            raise ValueError('target is not a multiple of the base')
+
+        # Chinese remainder theorem: result = residue mod power, result mod modulus is kept.
+        shift = (residue - result) * pow(modulus, power - power // prime - 1, power) % power
+        result += modulus * shift
+        modulus *= power
+
+    if base * result != target:
+        raise ValueError('target is not a multiple of the base')
+
+    return result
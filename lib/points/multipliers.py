@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Scalar multiplication engines.
+
+Every engine takes an affine point and a positive factor and returns
+the product in projective coordinates of the point class, using its
+_projective, _double and _add primitives. Precomputed multiples are
+affine, so the main loop runs on mixed additions only. They may be
+passed in when computed in a batch.
+"""
+from lib.points.batch import batch_add, batch_affine, batch_odd_multiples
+
+WINDOWS = [
+    (16, 2),
+    (64, 3),
+    (256, 4),
+    (1024, 5)
+]
+
+DEFAULT_WINDOW = 6
+
+PIPPENGER_THRESHOLD = 256
+
+
+def window_size(bit_length):
+    """Window width for a factor of a specified bit length."""
+    for max_bit_length, window in WINDOWS:
+        if bit_length <= max_bit_length:
+            return window
+
+    return DEFAULT_WINDOW
+
+
+def signed_digits(element, window, residue, divide):
+    """
+    Width-w non-adjacent digits of an element (r0, r1), least significant
+    first. An odd element loses the digit of its residue modulo 2^w, chosen
+    in (-2^(w-1), 2^(w-1)), then every element is divided by the base.
+    """
+    r0, r1 = element
+    digits = []
+    modulus = 1 << window
+    half = modulus >> 1
+
+    while r0 or r1:
+        digit = 0
+
+        if r0 & 1:
+            digit = residue(r0, r1) & (modulus - 1)
+
+            if digit >= half:
+                digit -= modulus
+
+            r0 -= digit
+
+        digits.append(digit)
+        r0, r1 = divide(r0, r1)
+
+    return digits
+
+
+def naf(factor, window):
+    """Width-w non-adjacent form of a factor, least significant digit first."""
+    return signed_digits((factor, 0), window, lambda r0, _: r0, lambda r0, _: (r0 >> 1, 0))
+
+
+def multiples_count(method, window):
+    """Number of odd multiples an engine precomputes for a window."""
+    if method == 'wnaf':
+        return 1 << (window - 2)
+
+    if method == 'sliding':
+        return 1 << (window - 1)
+
+    return 0
+
+
+def odd_multiples(point, count):
+    """Affine multiples P, 3P, 5P, ... of a point."""
+    twice = point + point
+    multiples = [point]
+
+    for _ in range(count - 1):
+        multiples.append(multiples[-1] + twice)
+
+    return multiples
+
+
+def projective(point):
+    """Projective coordinates of an affine point, None for infinity."""
+    if point.x is None or point.y is None:
+        return None
+
+    return point._projective()  # pylint: disable=protected-access
+
+
+def accumulate(point, result, base):
+    """Adds an affine base to a projective result, None stands for infinity."""
+    if base is None:
+        return result
+
+    if result is None:
+        return base
+
+    return point._add(result, base)  # pylint: disable=protected-access
+
+
+def double(point, result):
+    """Doubles a projective result, None stands for infinity."""
+    if result is None:
+        return None
+
+    return point._double(result)  # pylint: disable=protected-access
+
+
+def binary(point, factor, window=None, multiples=None):
+    """Left-to-right double-and-add."""
+    # pylint: disable=unused-argument
+    base = projective(point)
+    result = base
+
+    for index in range(factor.bit_length() - 2, -1, -1):
+        result = double(point, result)
+
+        if factor >> index & 1:
+            result = accumulate(point, result, base)
+
+    return result
+
+
+def signed_sum(point, digits, multiples, shift=double):
+    """
+    Sum of signed odd digits, least significant first, times the powers of
+    the base, whose multiplication of the running sum is shift.
+    """
+    positive = [projective(multiple) for multiple in multiples]
+    negative = [projective(-multiple) for multiple in multiples]
+    result = None
+
+    for digit in reversed(digits):
+        result = shift(point, result)
+
+        if digit > 0:
+            result = accumulate(point, result, positive[digit >> 1])
+        elif digit < 0:
+            result = accumulate(point, result, negative[-digit >> 1])
+
+    return result
+
+
+def wnaf(point, factor, window=None, multiples=None):
+    """Width-w NAF multiplication with odd multiples and their negations."""
+    if window is None:
+        window = window_size(factor.bit_length())
+
+    if multiples is None:
+        multiples = odd_multiples(point, multiples_count('wnaf', window))
+
+    return signed_sum(point, naf(factor, window), multiples)
+
+
+def sliding_window(point, factor, window=None, multiples=None):
+    """Left-to-right sliding window multiplication with odd multiples."""
+    if window is None:
+        window = window_size(factor.bit_length())
+
+    if multiples is None:
+        multiples = odd_multiples(point, multiples_count('sliding', window))
+
+    table = [projective(multiple) for multiple in multiples]
+    result = None
+    index = factor.bit_length() - 1
+
+    while index >= 0:
+        if not factor >> index & 1:
+            result = double(point, result)
+            index -= 1
+            continue
+
+        low = max(index - window + 1, 0)
+
+        while not factor >> low & 1:
+            low += 1
+
+        for _ in range(index - low + 1):
+            result = double(point, result)
+
+        digit = (factor >> low) & ((1 << (index - low + 1)) - 1)
+        result = accumulate(point, result, table[digit >> 1])
+        index = low - 1
+
+    return result
+
+
+def straus(terms, window=None):
+    """
+    Interleaved w-NAF multi-scalar multiplication of (point, factor) terms:
+    one doubling chain is shared by all terms.
+    """
+    point = terms[0][0]
+    widths = [window or window_size(factor.bit_length()) for _, factor in terms]
+    multiples = batch_odd_multiples([base for base, _ in terms],
+                                    [multiples_count('wnaf', width) for width in widths])
+    expansions = []
+
+    for (_, factor), width, base_multiples in zip(terms, widths, multiples):
+        expansions.append((
+            naf(factor, width),
+            [projective(multiple) for multiple in base_multiples],
+            [projective(-multiple) for multiple in base_multiples]
+        ))
+
+    result = None
+
+    for index in range(max(len(digits) for digits, _, _ in expansions) - 1, -1, -1):
+        result = double(point, result)
+
+        for digits, positive, negative in expansions:
+            digit = digits[index] if index < len(digits) else 0
+
+            if digit > 0:
+                result = accumulate(point, result, positive[digit >> 1])
+            elif digit < 0:
+                result = accumulate(point, result, negative[-digit >> 1])
+
+    return result
+
+
+def pippenger(terms, window=None):
+    """
+    Bucket method multi-scalar multiplication of (point, factor) terms:
+    every window of factor bits sorts the points into buckets by digit
+    and sums the buckets weighted by the digits with running sums.
+    Buckets of all windows are filled by affine additions in batches.
+    """
+    point = terms[0][0]
+
+    if window is None:
+        window = max(2, len(terms).bit_length() - 5)
+
+    shifts = range(0, max(factor.bit_length() for _, factor in terms), window)
+    mask = (1 << window) - 1
+    buckets = {}
+
+    for base, factor in terms:
+        for index, shift in enumerate(shifts):
+            digit = factor >> shift & mask
+
+            if digit:
+                buckets.setdefault((index, digit), []).append(base)
+
+    buckets = reduce_buckets(buckets)
+    partial_sums = []
+
+    for index in range(len(shifts)):
+        running = None
+
+        for digit in range(mask, 0, -1):
+            bucket = buckets.get((index, digit))
+
+            if bucket is not None:
+                running = accumulate(point, running, projective(bucket))
+
+            partial_sums.append(running)
+
+    partial_sums = affine(point, partial_sums)
+    result = None
+
+    for index in range(len(shifts) - 1, -1, -1):
+        for _ in range(window):
+            result = double(point, result)
+
+        for partial_sum in partial_sums[index * mask:(index + 1) * mask]:
+            result = accumulate(point, result, partial_sum)
+
+    return result
+
+
+def reduce_buckets(buckets):
+    """Sums of points in buckets by pairwise additions, one batch per round."""
+    while True:
+        pairs = []
+        owners = []
+
+        for key, items in buckets.items():
+            while len(items) > 1:
+                pairs.append((items.pop(), items.pop()))
+                owners.append(key)
+
+        if not pairs:
+            return {key: items[0] for key, items in buckets.items()}
+
+        for key, total in zip(owners, batch_add(pairs)):
+            buckets[key].append(total)
+
+
+def affine(point, results):
+    """Projective results converted to affine with a single inversion, kept projective."""
+    points = batch_affine([(point, result) for result in results])
+
+    return [projective(item) for item in points]
+
+
+def linear_combination(terms):
+    """
+    Sum of factor multiples of (point, factor) terms on the same curve.
+    Interleaved w-NAF serves a few terms, the bucket method many ones.
+    """
+    identity = terms[0][0] * 0
+    terms = [(base, base.reduce_factor(factor)) for base, factor in terms
+             if base.x is not None and base.y is not None]
+    terms = [(base, factor) if factor > 0 else (-base, -factor) for base, factor in terms if factor]
+
+    if not terms:
+        return identity
+
+    if len(terms) < PIPPENGER_THRESHOLD:
+        result = straus(terms)
+    else:
+        result = pippenger(terms)
+
+    if result is None:
+        return identity
+
+    return terms[0][0]._affine(result)  # pylint: disable=protected-access
+
+
+MULTIPLIERS = {
+    'binary': binary,
+    'wnaf': wnaf,
+    'sliding': sliding_window
+}
+
+DEFAULT_MULTIPLIER = 'wnaf'
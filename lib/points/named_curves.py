@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Named curves of FIPS 186 in the input format: binary curves
+y^2 + xy = x^3 + ax^2 + b are y^2 + 1xy = x^3 + ax^2 + b here.
+The order is the number of points, the generator subgroup order
+times the cofactor.
+"""
+
+NAMED_CURVES = {
+    'P-192': {
+        'curve_type': 'p',
+        'payload': [2 ** 192 - 2 ** 64 - 1],
+        'coefficients': [-3, 0x64210519e59c80e70fa7e9ab72243049feb8deecc146b9b1],
+        'subgroup_order': 0xffffffffffffffffffffffff99def836146bc9b1b4d22831,
+        'cofactor': 1,
+        'generator': (0x188da80eb03090f67cbf20eb43a18800f4ff0afd82ff1012,
+                      0x07192b95ffc8da78631011ed6b24cdd573f977a11e794811)
+    },
+    'P-224': {
+        'curve_type': 'p',
+        'payload': [2 ** 224 - 2 ** 96 + 1],
+        'coefficients': [-3, 0xb4050a850c04b3abf54132565044b0b7d7bfd8ba270b39432355ffb4],
+        'subgroup_order': 0xffffffffffffffffffffffffffff16a2e0b8f03e13dd29455c5c2a3d,
+        'cofactor': 1,
+        'generator': (0xb70e0cbd6bb4bf7f321390b94a03c1d356c21122343280d6115c1d21,
+                      0xbd376388b5f723fb4c22dfe6cd4375a05a07476444d5819985007e34)
+    },
+    'P-256': {
+        'curve_type': 'p',
+        'payload': [2 ** 256 - 2 ** 224 + 2 ** 192 + 2 ** 96 - 1],
+        'coefficients': [-3, 0x5ac635d8aa3a93e7b3ebbd55769886bc651d06b0cc53b0f63bce3c3e27d2604b],
+        'subgroup_order': 0xffffffff00000000ffffffffffffffffbce6faada7179e84f3b9cac2fc632551,
+        'cofactor': 1,
+        'generator': (0x6b17d1f2e12c4247f8bce6e563a440f277037d812deb33a0f4a13945d898c296,
+                      0x4fe342e2fe1a7f9b8ee7eb4a7c0f9e162bce33576b315ececbb6406837bf51f5)
+    },
+    'K-163': {
+        'curve_type': 'n',
+        'payload': [163, 7, 6, 3, 0],
+        'coefficients': [1, 1, 1],
+        'subgroup_order': 0x4000000000000000000020108a2e0cc0d99f8a5ef,
+        'cofactor': 2,
+        'generator': (0x2fe13c0537bbc11acaa07d793de4e6d5e5c94eee8,
+                      0x289070fb05d38ff58321f2e800536d538ccdaa3d9)
+    },
+    'B-163': {
+        'curve_type': 'n',
+        'payload': [163, 7, 6, 3, 0],
+        'coefficients': [1, 1, 0x20a601907b8c953ca1481eb10512f78744a3205fd],
+        'subgroup_order': 0x40000000000000000000292fe77e70c12a4234c33,
+        'cofactor': 2,
+        'generator': (0x3f0eba16286a2d57ea0991168d4994637e8343e36,
+                      0x0d51fbc6c71a0094fa2cdd545b11c5c0c797324f1)
+    },
+    'K-233': {
+        'curve_type': 'n',
+        'payload': [233, 74, 0],
+        'coefficients': [1, 0, 1],
+        'subgroup_order': 0x8000000000000000000000000000069d5bb915bcd46efb1ad5f173abdf,
+        'cofactor': 4,
+        'generator': (0x17232ba853a7e731af129f22ff4149563a419c26bf50a4c9d6eefad6126,
+                      0x1db537dece819b7f70f555a67c427a8cd9bf18aeb9b56e0c11056fae6a3)
+    },
+    'B-233': {
+        'curve_type': 'n',
+        'payload': [233, 74, 0],
+        'coefficients': [1, 1, 0x066647ede6c332c7f8c0923bb58213b333b20e9ce4281fe115f7d8f90ad],
+        'subgroup_order': 0x1000000000000000000000000000013e974e72f8a6922031d2603cfe0d7,
+        'cofactor': 2,
+        'generator': (0x0fac9dfcbac8313bb2139f1bb755fef65bc391f8b36f8f8eb7371fd558b,
+                      0x1006a08a41903350678e58528bebf8a0beff867a7ca36716f7e01f81052)
+    }
+}
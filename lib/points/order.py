@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Group order of curves over small fields.
+
+Curves over fields of at most NAIVE_FIELD_SIZE elements are counted
+point by point. Up to ORDER_MAX_BITS the order is found as Mestre
+suggests: the multiples of the orders of random points in the Hasse
+interval are found by baby-step giant-step until one of them is left.
+"""
+from functools import lru_cache
+from random import Random
+
+NAIVE_FIELD_SIZE = 1 << 12
+
+ORDER_MAX_BITS = 48
+
+ORDER_ATTEMPTS = 32
+
+
+def integer_sqrt(number):
+    """Floor of the square root of a non-negative integer."""
+    if number < 2:
+        return number
+
+    root = 1 << ((number.bit_length() + 1) >> 1)
+
+    while True:
+        next_root = (root + number // root) >> 1
+
+        if next_root >= root:
+            return root
+
+        root = next_root
+
+
+def field_size(curve):
+    """Number of elements of the curve field."""
+    if curve.curve_type == 'p':
+        return curve.modulus
+
+    return 1 << curve.field.degree
+
+
+def coefficients(curve):
+    """Curve coefficients with zeros for the missing ones."""
+    return tuple(coefficient or 0 for coefficient in curve.coefficients)
+
+
+def is_singular(curve):
+    """Whether the curve has no group of points."""
+    a, b, c = coefficients(curve)
+
+    if curve.curve_type == 'p':
+        return curve.modulus <= 3 or (4 * a ** 3 + 27 * b * b) % curve.modulus == 0
+
+    if curve.curve_type == 'n':
+        return not a or not c
+
+    return not a
+
+
+def prime_sqrt(number, modulus):
+    """Square root modulo an odd prime by Tonelli-Shanks, None for non-residues."""
+    number %= modulus
+
+    if number == 0:
+        return 0
+
+    if pow(number, (modulus - 1) >> 1, modulus) != 1:
+        return None
+
+    odd = modulus - 1
+    power = 0
+
+    while not odd & 1:
+        odd >>= 1
+        power += 1
+
+    non_residue = 2
+
+    while pow(non_residue, (modulus - 1) >> 1, modulus) != modulus - 1:
+        non_residue += 1
+
+    root = pow(number, (odd + 1) >> 1, modulus)
+    rest = pow(number, odd, modulus)
+    factor = pow(non_residue, odd, modulus)
+
+    while rest != 1:
+        index = 0
+        square = rest
+
+        while square != 1:
+            square = square * square % modulus
+            index += 1
+
+        step = pow(factor, 1 << (power - index - 1), modulus)
+        root = root * step % modulus
+        factor = step * step % modulus
+        rest = rest * factor % modulus
+        power = index
+
+    return root
+
+
+def trace(field, number):
+    """Absolute trace of a binary field element, 0 or 1."""
+    result = number
+
+    for _ in range(field.degree - 1):
+        number = field.square(number)
+        result ^= number
+
+    return result
+
+
+def solve_quadratic(field, number, generator):
+    """Root z of z^2 + z = number in a binary field, None if there is no one."""
+    if not number:
+        return 0
+
+    if trace(field, number):
+        return None
+
+    while True:
+        tau = generator.getrandbits(field.degree)
+        root = 0
+        power = number
+
+        for _ in range(field.degree - 1):
+            root = field.square(root) ^ field.multiply(field.square(power), tau)
+            power = field.square(power) ^ number
+
+        if field.square(root) ^ root:
+            return root
+
+
+def binary_rhs(curve, x):
+    """Right-hand side of a binary curve equation at x and the y substitution factor."""
+    field = curve.field
+    a, b, c = coefficients(curve)
+    x_square = field.square(x)
+
+    if curve.curve_type == 'n':
+        return field.multiply(x_square, x) ^ field.multiply(b, x_square) ^ c, field.multiply(a, x)
+
+    return field.multiply(x_square, x) ^ field.multiply(b, x) ^ c, a
+
+
+def y_roots(curve, x, generator):
+    """Sorted y coordinates of the points of a curve at x, none if x is off the curve."""
+    if curve.curve_type == 'p':
+        a, b, _ = coefficients(curve)
+        y = prime_sqrt(x * x * x + a * x + b, curve.modulus)
+
+        return [] if y is None else sorted({y, (curve.modulus - y) % curve.modulus})
+
+    field = curve.field
+    rhs, scale = binary_rhs(curve, x)
+
+    if not scale:
+        for _ in range(field.degree - 1):
+            rhs = field.square(rhs)
+
+        return [rhs]
+
+    z = solve_quadratic(field, field.multiply(rhs, field.inverse(field.square(scale))), generator)
+
+    if z is None:
+        return []
+
+    return sorted({field.multiply(scale, z), field.multiply(scale, z) ^ scale})
+
+
+def count_points(curve):
+    """Number of points with infinity counted one by one over x."""
+    count = 1
+
+    if curve.curve_type == 'p':
+        a, b, _ = coefficients(curve)
+        modulus = curve.modulus
+
+        for x in range(modulus):
+            rhs = (x * x * x + a * x + b) % modulus
+
+            if rhs == 0:
+                count += 1
+            elif pow(rhs, (modulus - 1) >> 1, modulus) == 1:
+                count += 2
+
+        return count
+
+    field = curve.field
+
+    for x in range(1 << field.degree):
+        rhs, scale = binary_rhs(curve, x)
+
+        if not scale:
+            count += 1
+        elif not trace(field, field.multiply(rhs, field.inverse(field.square(scale)))):
+            count += 2
+
+    return count
+
+
+def random_point(curve, point_class, generator):
+    """Random affine point of the curve."""
+    while True:
+        if curve.curve_type == 'p':
+            a, b, _ = coefficients(curve)
+            x = generator.randrange(curve.modulus)
+            y = prime_sqrt(x * x * x + a * x + b, curve.modulus)
+
+            if y is not None:
+                return point_class(x, y, curve)
+
+            continue
+
+        field = curve.field
+        x = generator.getrandbits(field.degree)
+        rhs, scale = binary_rhs(curve, x)
+
+        if not scale:
+            continue
+
+        root = solve_quadratic(field, field.multiply(rhs, field.inverse(field.square(scale))),
+                               generator)
+
+        if root is not None:
+            return point_class(x, field.multiply(scale, root), curve)
+
+
+def multiple(point, factor):
+    """Multiple of a point by double-and-add, the factor is not reduced."""
+    result = point * 0
+
+    for index in range(factor.bit_length() - 1, -1, -1):
+        result += result
+
+        if factor >> index & 1:
+            result += point
+
+    return result
+
+
+def order_multiples(point, low, high):
+    """Multiples of the order of a point in [low, high] by baby-step giant-step."""
+    steps = integer_sqrt(high - low) + 1
+    current = point * 0
+    baby = {}
+
+    for index in range(steps):
+        if index and current.x is None:
+            return set(range(-(-low // index) * index, high + 1, index))
+
+        baby.setdefault((current.x, current.y), index)
+        current += point
+
+    giant = current
+    current = multiple(point, low)
+    multiples = set()
+
+    for index in range(0, high - low + 1, steps):
+        negative = -current
+        step = baby.get((negative.x, negative.y))
+
+        if step is not None and low + index + step <= high:
+            multiples.add(low + index + step)
+
+        current += giant
+
+    return multiples
+
+
+def group_order(curve, point_class):
+    """
+    Number of points of a curve: the specified or known one, computed
+    for small fields, None if it is unknown.
+    """
+    if curve.order is not None:
+        return curve.order
+
+    return computed_order(curve, point_class)
+
+
+@lru_cache(maxsize=None)
+def computed_order(curve, point_class):
+    """
+    Number of points of a curve counted or found among the multiples of
+    random points for small fields, None otherwise. Cached by curve, so
+    a specified order never reaches the cache.
+    """
+    size = field_size(curve)
+
+    if size.bit_length() > ORDER_MAX_BITS or is_singular(curve):
+        return None
+
+    if size <= NAIVE_FIELD_SIZE:
+        return count_points(curve)
+
+    bound = integer_sqrt(4 * size)
+    low = size + 1 - bound
+    high = size + 1 + bound
+    generator = Random(size)
+    candidates = None
+
+    for _ in range(ORDER_ATTEMPTS):
+        multiples = order_multiples(random_point(curve, point_class, generator), low, high)
+        candidates = multiples if candidates is None else candidates & multiples
+
+        if len(candidates) == 1:
+            return candidates.pop()
+
+    return None
@@ -2,42 +2,111 @@
 # -*- coding: utf-8 -*-
 """Elliptic curve points."""
 # pylint: disable=invalid-name
+import sys
 from abc import ABCMeta, abstractmethod
 from copy import copy
 
+from lib.points.multipliers import DEFAULT_MULTIPLIER, MULTIPLIERS
+from lib.points.order import group_order
+
 
 class Point(metaclass=ABCMeta):
     """
     Base point on elliptic curve delegates computation to a Point
-    of a specified curve type.
+    of a specified curve type. A point holds its coordinates and
+    a reference to the shared curve, x and y are None for infinity.
     """
-    # pylint: disable=too-many-instance-attributes
-    def __init__(self, params):
-        self.x = params.get('x')
-        self.y = params.get('y')
-        self.curve_type = params.get('curve_type')
-        self.payload = params.get('payload')
-        self.coefficients = params.get('coefficients', [None] * 3)
-        self._unpack_coefficients()
+    __slots__ = ('x', 'y', 'curve')
+
+    def __init__(self, x, y, curve):
+        self.x = x
+        self.y = y
+        self.curve = curve
+
+    @property
+    def a(self):
+        """First curve coefficient."""
+        return self.curve.a
+
+    @property
+    def b(self):
+        """Second curve coefficient."""
+        return self.curve.b
+
+    @property
+    def c(self):
+        """Third curve coefficient."""
+        return self.curve.c
+
+    def reduce_factor(self, factor):
+        """Factor reduced modulo the group order when it is known and the point is on the curve."""
+        order = group_order(self.curve, type(self))
 
-    def _unpack_coefficients(self):
-        """Coefficients unpacking."""
-        if len(self.coefficients) < 3:
-            self.coefficients.append(None)
+        if order is None or not self.on_curve():
+            return factor
 
-        self.a, self.b, self.c = self.coefficients
+        return factor % order
 
-    def factorize(self, factor):
-        """Point factorization."""
-        result = copy(self)
+    def factorize(self, factor, method=None, window=None):
+        """Point factorization by a scalar multiplication engine, the default one if None."""
+        factor = self.reduce_factor(factor)
 
-        for bit in bin(factor)[3:]:
-            result += result
+        if factor == 0:
+            return self * 0
 
-            if bit == '1':
-                result += self
+        if factor == 1:
+            return copy(self)
 
-        return result
+        result = self.multiplier(method)(self, factor, window)
+
+        if result is None:
+            return self * 0
+
+        return self._affine(result)
+
+    def multiplier(self, method=None):
+        """Scalar multiplication engine of a method, the default one for the point if None."""
+        return MULTIPLIERS[method or DEFAULT_MULTIPLIER]
+
+    @abstractmethod
+    def on_curve(self):
+        """Whether the point satisfies the curve equation."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _projective(self):
+        """Projective coordinates of the point."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _double(self, point):
+        """Doubles a point in projective coordinates."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _add(self, point, base):
+        """Adds an affine base (Z = 1) to a point in projective coordinates."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _affine(self, point, z_inverse=None):
+        """Converts a point from projective coordinates, given the inverse of Z if known."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _special_sum(self, addend):
+        """Sum of points that needs no slope, None otherwise."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _slope(self, addend):
+        """Numerator and denominator of the slope of a chord or tangent."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _chord(self, addend, factor):
+        """Sum of points by a known slope."""
+        raise NotImplementedError()
 
     @abstractmethod
     def inverse(self, number):
@@ -45,13 +114,45 @@ class Point(metaclass=ABCMeta):
         raise NotImplementedError()
 
     @abstractmethod
+    def multiply(self, this_num, that_num):
+        """Multiplies numbers."""
+        raise NotImplementedError()
+
     def __add__(self, addend):
+        result = self._special_sum(addend)
+
+        if result is not None:
+            return result
+
+        numerator, denominator = self._slope(addend)
+
+        return self._chord(addend, self.multiply(numerator, self.inverse(denominator)))
+
+    @abstractmethod
+    def __neg__(self):
         raise NotImplementedError()
 
     @abstractmethod
     def __mul__(self, factor):
         raise NotImplementedError()
 
+    def __copy__(self):
+        return type(self)(self.x, self.y, self.curve)
+
+    def __eq__(self, other):
+        return isinstance(other, Point) and self.x == other.x and self.y == other.y \
+            and self.curve == other.curve
+
+    def __hash__(self):
+        return hash((self.x, self.y, self.curve))
+
+    def __sizeof__(self):
+        """Size of the point with its coordinates, the shared curve excluded."""
+        return object.__sizeof__(self) + sys.getsizeof(self.x) + sys.getsizeof(self.y)
+
+    def __reduce__(self):
+        return type(self), (self.x, self.y, self.curve)
+
     def __str__(self):
         if self.x is None or self.y is None:
             return 'e'
@@ -1,77 +1,176 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """Elliptic curve prime point."""
-from copy import copy
-
+from lib.points.backends import BACKENDS, DEFAULT_BACKEND
 from lib.points.point import Point
 
 
 class PrimePoint(Point):
-    """Prime point on elliptic curve."""
-    def __init__(self, params):
-        super().__init__(params)
-        self.modulus = self.payload[0] if self.payload else None
+    """
+    Prime point on elliptic curve. Field arithmetic runs on the big-integer
+    backend of the class, see `use_backend`.
+    """
+    __slots__ = ()
+
+    backend = BACKENDS[DEFAULT_BACKEND]
+
+    @property
+    def modulus(self):
+        """Field modulus."""
+        return self.curve.modulus
+
+    def on_curve(self):
+        """Whether the point satisfies y^2 = x^3 + ax + b."""
+        if self.x is None or self.y is None:
+            return True
+
+        a, b = self.a or 0, self.b or 0
+
+        return (self.y * self.y - self.x ** 3 - a * self.x - b) % self.modulus == 0
 
     def inverse(self, number):
         """Inverses a specified number."""
-        number %= self.modulus
-        previous_num = 0
-        current_num = 1
-        previous_res = self.modulus
-        current_res = number
+        return self.backend.inverse(number, self.modulus)
+
+    def multiply(self, this_num, that_num):
+        """Multiplies numbers."""
+        return self.backend.multiply(this_num, that_num, self.modulus)
+
+    def square(self, number):
+        """Squares a number."""
+        return self.backend.square(number, self.modulus)
+
+    def reduce(self, number):
+        """Reduces a number modulo the field prime."""
+        return self.backend.reduce(number, self.modulus)
+
+    def _projective(self):
+        """Jacobian coordinates (X, Y, Z) of the point, x = X/Z^2, y = Y/Z^3."""
+        element = self.backend.element
+
+        return element(self.x % self.modulus), element(self.y % self.modulus), element(1)
+
+    def _double(self, point):
+        """Doubles a point in Jacobian coordinates without inversion."""
+        x, y, z = point
+        backend, modulus = self.backend, self.modulus
+
+        if not z or not y:
+            return 1, 1, 0
+
+        y_square = backend.square(y, modulus)
+        s = backend.multiply(4 * x, y_square, modulus)
+        z_square = backend.square(z, modulus)
+
+        if self.curve.a_is_minus_3:
+            m = backend.multiply(3 * (x - z_square), x + z_square, modulus)
+        else:
+            m = backend.reduce(3 * backend.square(x, modulus) +
+                               backend.multiply(self.a, backend.square(z_square, modulus),
+                                                modulus), modulus)
+
+        res_x = backend.reduce(backend.square(m, modulus) - 2 * s, modulus)
+        res_y = backend.reduce(backend.multiply(m, s - res_x, modulus) -
+                               8 * backend.square(y_square, modulus), modulus)
+        res_z = backend.multiply(2 * y, z, modulus)
+
+        return res_x, res_y, res_z
+
+    def _add(self, point, base):
+        """Adds an affine base to a point in Jacobian coordinates."""
+        # pylint: disable=too-many-locals
+        x, y, z = point
+        base_x, base_y, _ = base
+        backend, modulus = self.backend, self.modulus
 
-        while current_res != 1:
-            factor = previous_res // current_res
-            previous_res, current_res = current_res, previous_res % current_res
-            previous_num, current_num = current_num, previous_num - (factor * current_num)
+        if not z:
+            return base
 
-        return current_num % self.modulus
+        z_square = backend.square(z, modulus)
+        h = backend.reduce(backend.multiply(base_x, z_square, modulus) - x, modulus)
+        r = backend.reduce(backend.multiply(base_y, backend.multiply(z, z_square, modulus),
+                                            modulus) - y, modulus)
 
-    def __add__(self, addend):
+        if not h:
+            if r:
+                return 1, 1, 0
+
+            return self._double(base)
+
+        h_square = backend.square(h, modulus)
+        h_cube = backend.multiply(h, h_square, modulus)
+        v = backend.multiply(x, h_square, modulus)
+        res_x = backend.reduce(backend.square(r, modulus) - h_cube - 2 * v, modulus)
+        res_y = backend.reduce(backend.multiply(r, v - res_x, modulus) -
+                               backend.multiply(y, h_cube, modulus), modulus)
+        res_z = backend.multiply(z, h, modulus)
+
+        return res_x, res_y, res_z
+
+    def _affine(self, point, z_inverse=None):
+        """Converts a point from Jacobian coordinates with a single inversion."""
+        x, y, z = point
+        backend, modulus = self.backend, self.modulus
+
+        if not z:
+            return PrimePoint(None, None, self.curve)
+
+        if z_inverse is None:
+            z_inverse = backend.inverse(z, modulus)
+
+        z_inverse_square = backend.square(z_inverse, modulus)
+
+        return PrimePoint(int(backend.multiply(x, z_inverse_square, modulus)),
+                          int(backend.multiply(y, backend.multiply(z_inverse_square, z_inverse,
+                                                                   modulus), modulus)),
+                          self.curve)
+
+    def _special_sum(self, addend):
+        """Sum of points that needs no slope, None otherwise."""
         if self.x is None or self.y is None:
             return addend
 
         if addend.x is None or addend.y is None:
             return self
 
+        if self.x == addend.x and (self.y == 0 or self.y != addend.y):
+            return PrimePoint(None, None, self.curve)
+
+        return None
+
+    def _slope(self, addend):
+        """Numerator and denominator of the slope of a chord or tangent."""
         if self.x == addend.x:
-            if self.y == 0 or self.y != addend.y:
-                return PrimePoint({})
+            return 3 * (self.x ** 2) + self.a, 2 * self.y
 
-            numerator = 3 * (self.x ** 2) + self.a
-            denominator = 2 * self.y
-        else:
-            numerator = addend.y - self.y
-            denominator = addend.x - self.x
-
-        denominator = self.inverse(denominator)
-        coefficient = (numerator * denominator) % self.modulus
-        res_x = (pow(coefficient, 2, self.modulus) - self.x - addend.x) % self.modulus
-        res_y = (coefficient * (self.x - res_x) - self.y) % self.modulus
-        return PrimePoint({
-            'x': res_x,
-            'y': res_y,
-            'payload': [self.modulus],
-            'coefficients': [self.a, self.b, self.c],
-        })
+        return addend.y - self.y, addend.x - self.x
+
+    def _chord(self, addend, factor):
+        """Sum of points by a known slope."""
+        res_x = (self.square(factor) - self.x - addend.x) % self.modulus
+        res_y = (factor * (self.x - res_x) - self.y) % self.modulus
+        return PrimePoint(res_x, res_y, self.curve)
+
+    def __neg__(self):
+        if self.x is None or self.y is None:
+            return self
+
+        return PrimePoint(self.x, (self.modulus - self.y) % self.modulus, self.curve)
 
     def __mul__(self, factor):
         if factor < 0:
-            new_point = copy(self)
-            new_point.y = self.modulus - self.y
-
-            return new_point * -factor
+            return -self * -factor
 
         if factor == 0:
-            return PrimePoint({})
+            return PrimePoint(None, None, self.curve)
 
         return self.factorize(factor)
 
-    def __copy__(self):
-        return PrimePoint({
-            'x': self.x,
-            'y': self.y,
-            'curve_type': self.curve_type,
-            'payload': self.payload,
-            'coefficients': list(filter(bool, [self.a, self.b, self.c]))
-        })
+
+def use_backend(name):
+    """Selects the big-integer backend of prime field arithmetic by name."""
+    if name not in BACKENDS:
+        raise ValueError('Unknown or unavailable backend: {}, available ones are {}'
+                         .format(name, ', '.join(sorted(BACKENDS))))
+
+    PrimePoint.backend = BACKENDS[name]
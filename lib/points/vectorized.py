@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vectorized arithmetic of points on curves over small prime fields.
+
+Batches of points are kept as NumPy int64 arrays (x, y, infinity) and
+every operation runs on the whole batch at once: with p below 2^31
+products of residues fit in a machine word. NumPy is optional, the
+engine is available only when it is installed.
+"""
+from lib.points.prime_point import PrimePoint
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+MAX_MODULUS = 1 << 31
+
+LIMB_BITS = 62
+
+
+def vectorized_available(curve):
+    """Whether the vectorized engine can serve a curve."""
+    return numpy is not None and curve.curve_type == 'p' and curve.modulus < MAX_MODULUS
+
+
+class VectorizedEngine:
+    """Batched point arithmetic of a curve over a prime field below 2^31."""
+    def __init__(self, curve):
+        self.curve = curve
+        self.modulus = curve.modulus
+        self.a = curve.a or 0
+
+    def arrays(self, points):
+        """Arrays (x, y, infinity) of affine points."""
+        infinity = numpy.array([point.x is None or point.y is None for point in points], dtype=bool)
+        x = numpy.array([point.x % self.modulus if point.x is not None else 0 for point in points],
+                        dtype=numpy.int64)
+        y = numpy.array([point.y % self.modulus if point.y is not None else 0 for point in points],
+                        dtype=numpy.int64)
+
+        return x, y, infinity
+
+    def points(self, batch):
+        """Affine points of arrays (x, y, infinity)."""
+        return [PrimePoint(None, None, self.curve) if infinity else PrimePoint(x, y, self.curve)
+                for x, y, infinity in zip(*(item.tolist() for item in batch))]
+
+    def add_points(self, pairs):
+        """Sums of pairs of affine points."""
+        if not pairs:
+            return []
+
+        return self.points(self.add(self.arrays([this for this, _ in pairs]),
+                                    self.arrays([that for _, that in pairs])))
+
+    def multiply_points(self, products):
+        """Products of pairs of affine points and factors."""
+        if not products:
+            return []
+
+        return self.points(self.multiply(self.arrays([point for point, _ in products]),
+                                         [factor for _, factor in products]))
+
+    def inverse(self, values):
+        """Inverses of residues by Fermat's little theorem, zero for zero."""
+        result = numpy.ones_like(values)
+        base = values % self.modulus
+        exponent = self.modulus - 2
+
+        while exponent:
+            if exponent & 1:
+                result = result * base % self.modulus
+
+            base = base * base % self.modulus
+            exponent >>= 1
+
+        return result
+
+    def add(self, this, that):
+        """Affine sums of batches of points sharing a single vectorized inversion."""
+        p = self.modulus
+        x1, y1, infinity1 = this
+        x2, y2, infinity2 = that
+
+        same_x = x1 == x2
+        doubling = same_x & (y1 == y2) & (y1 != 0)
+        opposite = same_x & ~doubling
+        numerator = numpy.where(doubling, (3 * (x1 * x1 % p) + self.a) % p, (y2 - y1) % p)
+        denominator = numpy.where(doubling, 2 * y1 % p, (x2 - x1) % p)
+        slope = numerator * self.inverse(denominator) % p
+
+        x3 = (slope * slope - x1 - x2) % p
+        y3 = (slope * ((x1 - x3) % p) - y1) % p
+
+        x3 = numpy.where(infinity1, x2, numpy.where(infinity2, x1, x3))
+        y3 = numpy.where(infinity1, y2, numpy.where(infinity2, y1, y3))
+        infinity = numpy.where(infinity1, infinity2,
+                               numpy.where(infinity2, infinity1, opposite))
+
+        return x3, y3, infinity
+
+    def double(self, batch):
+        """Affine doublings of a batch of points."""
+        return self.add(batch, batch)
+
+    def multiply(self, batch, factors):
+        """
+        Products of a batch of points by their own factors: left-to-right
+        double-and-add in Jacobian coordinates over all factor bits with
+        a single vectorized inversion at the end.
+        """
+        x, y, infinity = batch
+        negative = numpy.array([factor < 0 for factor in factors], dtype=bool)
+        y = numpy.where(negative, (-y) % self.modulus, y)
+        factors = [abs(factor) for factor in factors]
+        bit_length = max((factor.bit_length() for factor in factors), default=0)
+        limbs = numpy.array([[factor >> shift & ((1 << LIMB_BITS) - 1)
+                              for shift in range(0, bit_length, LIMB_BITS)] for factor in factors],
+                            dtype=numpy.int64).reshape(len(factors), -1)
+
+        doubled = self._double((x, y, numpy.ones_like(x)))
+        result = (numpy.ones_like(x), numpy.ones_like(x), numpy.zeros_like(x))
+
+        for index in range(bit_length - 1, -1, -1):
+            result = self._double(result)
+            bits = (limbs[:, index // LIMB_BITS] >> (index % LIMB_BITS) & 1).astype(bool)
+            result = self._add(result, (x, y), doubled, bits & ~infinity)
+
+        return self._affine(result)
+
+    def _double(self, point):
+        """Jacobian doublings, Z = 0 stands for infinity."""
+        p = self.modulus
+        x, y, z = point
+
+        y_square = y * y % p
+        z_square = z * z % p
+        s = 4 * (x * y_square % p) % p
+        m = (3 * (x * x % p) + self.a * (z_square * z_square % p) % p) % p
+        res_x = (m * m - 2 * s) % p
+        res_y = (m * ((s - res_x) % p) - 8 * (y_square * y_square % p)) % p
+        res_z = 2 * (y * z % p) % p
+
+        return res_x, res_y, res_z
+
+    def _add(self, point, base, doubled, mask):
+        """Jacobian sums with affine bases, given doubled, where a mask is set."""
+        p = self.modulus
+        x, y, z = point
+        base_x, base_y = base
+
+        z_square = z * z % p
+        h = (base_x * z_square - x) % p
+        r = (base_y * (z_square * z % p) - y) % p
+        h_square = h * h % p
+        h_cube = h_square * h % p
+        v = x * h_square % p
+        res_x = (r * r - h_cube - 2 * v) % p
+        res_y = (r * ((v - res_x) % p) - y * h_cube) % p
+        res_z = z * h % p
+
+        from_infinity = z == 0
+        doubling = ~from_infinity & (h == 0) & (r == 0)
+        res_x = numpy.where(from_infinity, base_x, numpy.where(doubling, doubled[0], res_x))
+        res_y = numpy.where(from_infinity, base_y, numpy.where(doubling, doubled[1], res_y))
+        res_z = numpy.where(from_infinity, 1, numpy.where(doubling, doubled[2], res_z))
+
+        return (numpy.where(mask, res_x, x), numpy.where(mask, res_y, y),
+                numpy.where(mask, res_z, z))
+
+    def _affine(self, point):
+        """Affine points of Jacobian ones."""
+        p = self.modulus
+        x, y, z = point
+
+        z_inverse = self.inverse(z)
+        z_inverse_square = z_inverse * z_inverse % p
+
+        return (x * z_inverse_square % p, y * (z_inverse_square * z_inverse % p) % p, z == 0)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Binary instruction files: a header with the curve followed by fixed-width
+instruction records, read through a memory mapping without copies.
+
+File layout, integers are big-endian:
+
+- header: magic `ECPB`, version (2 bytes), curve type (1 byte), flags
+  (1 byte: 1 for compressed points, 2 when the group order follows),
+  field element width W and scalar width S in bytes (2 bytes each),
+  number of coefficients (1 byte), then the field, the prime modulus or
+  the irreducible polynomial, in W + 1 bytes, the coefficients in W bytes
+  each and the group order in S bytes
+- records: opcode (1 byte: 1 for `+`, 2 for `*`, 3 for `log`), two point
+  slots and a signed scalar of S bytes. A point is a prefix byte, 0 for
+  infinity, 4 followed by x and y or, compressed, 2 or 3 followed by x.
+  `(x1, y1) + (x2, y2)` and `(x1, y1) log (x2, y2)` fill both point slots,
+  `(x, y) * k` the first one and the scalar, unused fields are zero.
+
+Result files have the header of their input and one record per instruction
+with its opcode: the resulting point in the first slot or the logarithm
+in the scalar.
+"""
+import mmap
+import struct
+from itertools import islice
+from random import Random
+
+from lib.computer import CHUNK_SIZE
+from lib.parser import ADD, LOG, MULTIPLY
+from lib.points import Curve
+from lib.points.order import binary_rhs, y_roots
+from lib.store import coordinate_width
+
+MAGIC = b'ECPB'
+
+VERSION = 1
+
+HEADER = struct.Struct('>4sHcBHHB')
+
+COMPRESSED = 1
+
+WITH_ORDER = 2
+
+OPCODES = {
+    ADD: 1,
+    MULTIPLY: 2,
+    LOG: 3
+}
+
+INSTRUCTIONS = {code: opcode for opcode, code in OPCODES.items()}
+
+INFINITY = 0
+
+UNCOMPRESSED = 4
+
+
+def scalar_width(number):
+    """Bytes of a signed number."""
+    return (number.bit_length() + 8) // 8
+
+
+class RecordLayout:
+    """Header and fixed-width records of a curve with or without point compression."""
+    def __init__(self, curve, compressed=False, width=None):
+        self.curve = curve
+        self.compressed = compressed
+        self.coordinate_width = coordinate_width(curve)
+        self.width = max(width or 0, self.coordinate_width + 1, scalar_width(curve.order or 0))
+        self.point_size = 1 + self.coordinate_width * (1 if compressed else 2)
+        self.size = 1 + 2 * self.point_size + self.width
+
+    @classmethod
+    def from_header(cls, data):
+        """Layout of a header at the start of a buffer and the header size."""
+        # pylint: disable=too-many-locals
+        magic, version, curve_type, flags, element_width, width, count = \
+            HEADER.unpack_from(data)
+
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('Unsupported binary instruction file')
+
+        offset = HEADER.size
+        numbers = []
+
+        for size in [element_width + 1] + [element_width] * count + \
+                [width] * bool(flags & WITH_ORDER):
+            numbers.append(int.from_bytes(data[offset:offset + size], 'big'))
+            offset += size
+
+        order = numbers[count + 1] if flags & WITH_ORDER else None
+        field = numbers[0]
+        curve_type = curve_type.decode('ascii')
+        payload = [field] if curve_type == 'p' else field
+        curve = Curve(curve_type, payload, numbers[1:count + 1], order)
+
+        return cls(curve, bool(flags & COMPRESSED), width), offset
+
+    def header(self):
+        """Encoded header."""
+        curve = self.curve
+        field = curve.modulus if curve.curve_type == 'p' else curve.polynomial
+        numbers = [number for number in curve.coefficients if number is not None]
+        flags = (COMPRESSED if self.compressed else 0) | (WITH_ORDER if curve.order else 0)
+        encoded = HEADER.pack(MAGIC, VERSION, curve.curve_type.encode('ascii'), flags,
+                              self.coordinate_width, self.width, len(numbers))
+        encoded += field.to_bytes(self.coordinate_width + 1, 'big')
+        encoded += b''.join(number.to_bytes(self.coordinate_width, 'big') for number in numbers)
+
+        if curve.order:
+            encoded += curve.order.to_bytes(self.width, 'big')
+
+        return encoded
+
+    def encode_point(self, x, y):
+        """Point slot of coordinates, None for infinity."""
+        width = self.coordinate_width
+
+        if x is None or y is None:
+            return bytes(self.point_size)
+
+        if self.curve.curve_type == 'p':
+            x, y = x % self.curve.modulus, y % self.curve.modulus
+        else:
+            x, y = self.curve.field.modulus(x), self.curve.field.modulus(y)
+
+        if not self.compressed:
+            return bytes((UNCOMPRESSED,)) + x.to_bytes(width, 'big') + y.to_bytes(width, 'big')
+
+        return bytes((2 | self._parity(x, y),)) + x.to_bytes(width, 'big')
+
+    def decode_point(self, data):
+        """Coordinates of a point slot, (None, None) for infinity."""
+        prefix = data[0]
+        x = int.from_bytes(data[1:1 + self.coordinate_width], 'big')
+
+        if prefix == INFINITY:
+            return None, None
+
+        if prefix == UNCOMPRESSED and not self.compressed:
+            return x, int.from_bytes(data[1 + self.coordinate_width:self.point_size], 'big')
+
+        if prefix in (2, 3) and self.compressed:
+            return x, self._decompress(x, prefix & 1)
+
+        raise ValueError('Unsupported point prefix: {}'.format(prefix))
+
+    def encode_instruction(self, instruction):
+        """Record of an instruction parsed into (opcode, operands)."""
+        opcode, operands = instruction
+
+        if opcode not in OPCODES:
+            raise ValueError('Instruction is not supported by binary files: {}'.format(opcode))
+
+        if opcode == MULTIPLY:
+            points = self.encode_point(*operands[:2]) + bytes(self.point_size)
+            factor = operands[2]
+        else:
+            points = self.encode_point(*operands[:2]) + self.encode_point(*operands[2:])
+            factor = 0
+
+        return bytes((OPCODES[opcode],)) + points + factor.to_bytes(self.width, 'big', signed=True)
+
+    def decode_instruction(self, data):
+        """Instruction (opcode, operands) of a record."""
+        opcode = INSTRUCTIONS.get(data[0])
+        middle = 1 + self.point_size
+
+        if opcode is None:
+            raise ValueError('Unsupported opcode: {}'.format(data[0]))
+
+        if opcode == MULTIPLY:
+            factor = int.from_bytes(data[1 + 2 * self.point_size:self.size], 'big', signed=True)
+
+            return opcode, self.decode_point(data[1:middle]) + (factor,)
+
+        return opcode, self.decode_point(data[1:middle]) + \
+            self.decode_point(data[middle:middle + self.point_size])
+
+    def encode_result(self, opcode, result):
+        """Record of the result of an instruction, a point or a logarithm."""
+        if opcode == LOG:
+            points = bytes(2 * self.point_size)
+            factor = result
+        else:
+            points = self.encode_point(result.x, result.y) + bytes(self.point_size)
+            factor = 0
+
+        return bytes((OPCODES[opcode],)) + points + factor.to_bytes(self.width, 'big', signed=True)
+
+    def decode_result(self, data):
+        """Opcode and result of a result record, coordinates (x, y) or a logarithm."""
+        opcode = INSTRUCTIONS[data[0]]
+
+        if opcode == LOG:
+            return opcode, int.from_bytes(data[1 + 2 * self.point_size:self.size], 'big',
+                                          signed=True)
+
+        return opcode, self.decode_point(data[1:1 + self.point_size])
+
+    def _parity(self, x, y):
+        """Bit selecting y among the two points at x: of y over prime fields, of y / s else."""
+        if self.curve.curve_type == 'p':
+            return y & 1
+
+        field = self.curve.field
+        _, scale = binary_rhs(self.curve, x)
+
+        return field.multiply(y, field.inverse(scale)) & 1 if scale else 0
+
+    def _decompress(self, x, parity):
+        """y of a point at x with a parity bit, ValueError if there is no point at x."""
+        roots = y_roots(self.curve, x, Random(x))
+
+        if not roots:
+            raise ValueError('No point with x = {} on the curve'.format(x))
+
+        return next((y for y in roots if self._parity(x, y) == parity), roots[0])
+
+
+class RecordReader:
+    """Instruction records of a binary file mapped into memory."""
+    def __init__(self, file_path):
+        with open(file_path, mode='rb') as records_file:
+            self.data = mmap.mmap(records_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self.layout, self.offset = RecordLayout.from_header(self.data)
+        except (ValueError, struct.error, UnicodeDecodeError):
+            self.data.close()
+            raise ValueError('Unsupported binary instruction file: {}'.format(file_path)) \
+                from None
+
+        if (len(self.data) - self.offset) % self.layout.size:
+            self.data.close()
+            raise ValueError('Truncated binary instruction file: {}'.format(file_path))
+
+    def __len__(self):
+        return (len(self.data) - self.offset) // self.layout.size
+
+    def instructions(self):
+        """Lazy instructions (opcode, operands) decoded from zero-copy slices of records."""
+        view = memoryview(self.data)
+        size = self.layout.size
+
+        try:
+            for offset in range(self.offset, len(self.data), size):
+                yield self.layout.decode_instruction(view[offset:offset + size])
+        finally:
+            view.release()
+
+    def close(self):
+        """Unmaps the file."""
+        self.data.close()
+
+
+def write_records(file_path, layout, records):
+    """Writes a header of a layout and encoded records to a file."""
+    with open(file_path, mode='wb') as records_file:
+        records_file.write(layout.header())
+
+        for record in records:
+            records_file.write(record)
+
+
+def write_instructions(file_path, curve, instructions, compressed=False):
+    """Writes instructions parsed into (opcode, operands) to a binary file of a curve."""
+    instructions = list(instructions)
+    factors = [operands[2] for opcode, operands in instructions if opcode == MULTIPLY]
+    layout = RecordLayout(curve, compressed, max(map(scalar_width, factors), default=0))
+    write_records(file_path, layout, map(layout.encode_instruction, instructions))
+
+    return layout
+
+
+def calc_records(computer, reader, chunk_size=CHUNK_SIZE):
+    """Lazy pairs of the instructions of a reader and their results computed in chunks."""
+    instructions = reader.instructions()
+
+    while True:
+        chunk = list(islice(instructions, chunk_size))
+
+        if not chunk:
+            return
+
+        yield from zip(chunk, computer.calc_program(chunk))
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Long-running computation server over a line protocol.
+
+A client selects a curve by the header lines of an input file joined
+by semicolons, with the optional group order, or by a named curve, then
+sends instructions:
+
+    curve p; 199; 1 3
+    (1, 76) * 5
+    curve K-163
+
+Every line gets a response line in request order, `ok` for a curve,
+`<instruction> = <result>` as in output files and `error: <message>`
+otherwise. Requests may be pipelined. Computers with their caches and
+precomputations are kept per curve for the server lifetime, additions
+run on the event loop and multiplications in a pool of worker processes
+with their own computers.
+"""
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+from lib.computer import computer_of
+from lib.parser import ADD, ParseError, parse_instruction, parse_number
+from lib.points import NAMED_CURVES, Curve
+
+PIPELINE_DEPTH = 256
+
+ENCODING = 'utf-8'
+
+WORKER_COMPUTERS = {}
+
+
+def parse_curve(message):
+    """Curve of a curve message: header lines joined by semicolons or a named curve."""
+    definition = message[len('curve'):].strip()
+
+    if definition in NAMED_CURVES:
+        params = NAMED_CURVES[definition]
+
+        return Curve(params['curve_type'], params['payload'], params['coefficients'])
+
+    parts = [part.split() for part in definition.split(';')]
+
+    if len(parts) not in (3, 4) or len(parts[0]) != 1 or parts[0][0] not in ('p', 'n', 's'):
+        raise ValueError('expected `curve <type>; <field>; <coefficients>[; <order>]`')
+
+    payload, coefficients = ([parse_number(number) for number in part] for part in parts[1:3])
+    order = parse_number(parts[3][0]) if len(parts) == 4 and parts[3] else None
+
+    return Curve(parts[0][0], payload, coefficients, order)
+
+
+def calc_remote(curve, instruction):
+    """Result of a parsed instruction in a worker process."""
+    return computer_of(WORKER_COMPUTERS, curve).calc_instruction(instruction)
+
+
+class Server:
+    """
+    Line protocol server keeping warm computers per curve, offloading
+    multiplications to jobs worker processes or computing them on
+    the event loop for no jobs.
+    """
+    def __init__(self, jobs=1, pipeline=PIPELINE_DEPTH):
+        self.computers = {}
+        self.pipeline = pipeline
+        self.executor = None
+
+        if jobs > 0:
+            # Forked workers would inherit the sockets of open connections
+            # and keep them from closing, spawned ones start clean.
+            self.executor = ProcessPoolExecutor(jobs, mp_context=get_context('spawn'))
+
+    async def start(self, address):
+        """Listening on `host:port` of TCP or on a Unix socket path."""
+        host, separator, port = address.rpartition(':')
+
+        if separator and port.isdigit():
+            return await asyncio.start_server(self.handle, host or 'localhost', int(port))
+
+        return await asyncio.start_unix_server(self.handle, address)
+
+    async def handle(self, reader, writer):
+        """Connection handling: responses are written in request order as they are ready."""
+        responses = asyncio.Queue(self.pipeline)
+        sender = asyncio.ensure_future(self._send(responses, writer))
+        computer = None
+
+        try:
+            while True:
+                line = await reader.readline()
+
+                if not line:
+                    break
+
+                message = line.decode(ENCODING).strip()
+
+                if not message:
+                    continue
+
+                if message.startswith('curve'):
+                    try:
+                        computer = computer_of(self.computers, parse_curve(message))
+                        response = 'ok'
+                    except (ValueError, ArithmeticError) as error:
+                        response = 'error: {}'.format(error)
+
+                    await responses.put(self._resolved(response))
+                else:
+                    await responses.put(self._calc(computer, message))
+        finally:
+            await responses.put(None)
+
+            try:
+                await sender
+            finally:
+                writer.close()
+
+    def close(self):
+        """Stops the worker processes."""
+        if self.executor is not None:
+            self.executor.shutdown()
+
+    async def _send(self, responses, writer):
+        """Writes responses of a connection in order."""
+        while True:
+            response = await responses.get()
+
+            if response is None:
+                return
+
+            writer.write('{}\n'.format(await response).encode(ENCODING))
+            await writer.drain()
+
+    def _calc(self, computer, raw_instruction):
+        """Future response of an instruction, cached results and additions are computed in place."""
+        if computer is None:
+            return self._resolved('error: no curve is selected')
+
+        try:
+            instruction = parse_instruction(raw_instruction)
+            result = computer.cache.get(instruction)
+
+            if result is None and (instruction[0] == ADD or self.executor is None):
+                result = computer.calc_instruction(instruction)
+        except (ParseError, ArithmeticError, ValueError, TypeError) as error:
+            return self._resolved('error: {}'.format(error))
+
+        if result is not None:
+            return self._resolved('{} = {}'.format(raw_instruction, result))
+
+        return asyncio.ensure_future(self._offload(computer, raw_instruction, instruction))
+
+    async def _offload(self, computer, raw_instruction, instruction):
+        """Response of an instruction computed by a worker process and cached."""
+        loop = asyncio.get_event_loop()
+
+        try:
+            result = await loop.run_in_executor(self.executor, calc_remote, computer.curve,
+                                                instruction)
+        except (ArithmeticError, ValueError, TypeError, BrokenProcessPool) as error:
+            return 'error: {}'.format(error)
+
+        computer.cache.put(instruction, result)
+
+        return '{} = {}'.format(raw_instruction, result)
+
+    @staticmethod
+    def _resolved(response):
+        """Future of a ready response."""
+        future = asyncio.get_event_loop().create_future()
+        future.set_result(response)
+
+        return future
+
+
+def serve(address, jobs=1):
+    """Runs a server on an address until it is interrupted."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    server = Server(jobs)
+    listener = loop.run_until_complete(server.start(address))
+    print('Serving on {}'.format(address))
+
+    try:
+        loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        loop.run_until_complete(listener.wait_closed())
+        server.close()
+        loop.close()
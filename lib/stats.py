@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Operation statistics of instructions: field multiplications, squarings,
+inversions and reductions, point additions and doublings, parse and
+compute time.
+
+Counting wrappers are installed on the point and field classes and around
+the prime field backend only while statistics are collected, otherwise the
+arithmetic runs untouched. Prime field reductions are those of sums and
+differences, products and squares reduce their results themselves.
+"""
+import csv
+import json
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+
+from lib.computer import distinct
+from lib.parser import parse_instruction
+from lib.points import Point, Point2N, Point2S, PrimePoint
+from lib.points.binary_field import BinaryField
+from lib.points.binary_points import BinaryPoint
+
+COUNTERS = ('multiplications', 'squarings', 'inversions', 'reductions', 'additions', 'doublings')
+
+TRACE_FIELDS = ('line', 'instruction', 'cached', 'parse_seconds', 'compute_seconds') + COUNTERS
+
+INSTRUMENTED = [
+    (BinaryPoint, 'multiply', 'multiplications'),
+    (BinaryPoint, 'square', 'squarings'),
+    (BinaryPoint, 'inverse', 'inversions'),
+    (BinaryField, 'modulus', 'reductions'),
+    (PrimePoint, '_add', 'additions'),
+    (PrimePoint, '_double', 'doublings'),
+    (Point2N, '_add', 'additions'),
+    (Point2N, '_double', 'doublings'),
+    (Point2S, '_add', 'additions'),
+    (Point2S, '_double', 'doublings')
+]
+
+BACKEND_INSTRUMENTED = [
+    ('multiply', 'multiplications'),
+    ('square', 'squarings'),
+    ('inverse', 'inversions'),
+    ('reduce', 'reductions')
+]
+
+
+def counting(method, counter, counts):
+    """Method wrapper incrementing a counter on every call."""
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        counts[counter] += 1
+        return method(*args, **kwargs)
+
+    return wrapper
+
+
+def counting_sum(method, counts):
+    """Affine sum wrapper counting additions and doublings."""
+    @wraps(method)
+    def wrapper(this, addend):
+        doubling = this.x == getattr(addend, 'x', None) and this.y == getattr(addend, 'y', None)
+        counts['doublings' if doubling else 'additions'] += 1
+        return method(this, addend)
+
+    return wrapper
+
+
+class CountingBackend:
+    """Prime field backend counting the operations of another one into a dictionary."""
+    # pylint: disable=too-few-public-methods
+    def __init__(self, backend, counts):
+        self.name = backend.name
+        self.element = backend.element
+
+        for name, counter in BACKEND_INSTRUMENTED:
+            setattr(self, name, counting(getattr(backend, name), counter, counts))
+
+
+@contextmanager
+def instrumented(counts):
+    """Point and field classes counting operations into a dictionary while the context lasts."""
+    originals = [(owner, name, owner.__dict__[name]) for owner, name, _ in INSTRUMENTED]
+    originals.append((Point, '__add__', Point.__dict__['__add__']))
+    originals.append((PrimePoint, 'backend', PrimePoint.backend))
+
+    for owner, name, counter in INSTRUMENTED:
+        setattr(owner, name, counting(owner.__dict__[name], counter, counts))
+
+    Point.__add__ = counting_sum(Point.__dict__['__add__'], counts)
+    PrimePoint.backend = CountingBackend(PrimePoint.backend, counts)
+
+    try:
+        yield counts
+    finally:
+        for owner, name, original in originals:
+            setattr(owner, name, original)
+
+
+class TraceWriter:
+    """Incremental per-instruction trace in CSV or, for .json paths, a JSON array."""
+    def __init__(self, file_path):
+        self.json = file_path.lower().endswith('.json')
+        self.file = open(file_path, mode='w', encoding='utf-8', newline='')
+        self.rows = 0
+
+        if self.json:
+            self.file.write('[')
+        else:
+            self.writer = csv.DictWriter(self.file, TRACE_FIELDS)
+            self.writer.writeheader()
+
+    def write(self, row):
+        """Writes a trace row."""
+        if self.json:
+            self.file.write('{}\n{}'.format(',' if self.rows else '', json.dumps(row)))
+        else:
+            self.writer.writerow(row)
+
+        self.rows += 1
+
+    def close(self):
+        """Finishes the trace."""
+        if self.json:
+            self.file.write('\n]\n')
+
+        self.file.close()
+
+
+class Stats:
+    """Operation counters of the current instruction with their totals and an optional trace."""
+    def __init__(self, trace_path=None):
+        self.counts = dict.fromkeys(COUNTERS, 0)
+        self.totals = dict.fromkeys(COUNTERS, 0)
+        self.instructions = 0
+        self.cached = 0
+        self.parse_seconds = 0.0
+        self.compute_seconds = 0.0
+        self.trace = TraceWriter(trace_path) if trace_path else None
+
+    def record(self, instruction, cached, parse_seconds, compute_seconds):
+        """Adds the counters of an instruction to the totals and the trace, then resets them."""
+        self.instructions += 1
+        self.cached += cached
+        self.parse_seconds += parse_seconds
+        self.compute_seconds += compute_seconds
+
+        if self.trace is not None:
+            row = {
+                'line': self.instructions,
+                'instruction': instruction,
+                'cached': cached,
+                'parse_seconds': parse_seconds,
+                'compute_seconds': compute_seconds
+            }
+            row.update(self.counts)
+            self.trace.write(row)
+
+        for counter in COUNTERS:
+            self.totals[counter] += self.counts[counter]
+            self.counts[counter] = 0
+
+    def summary(self):
+        """Aggregate statistics."""
+        result = {
+            'instructions': self.instructions,
+            'cached': self.cached,
+            'parse_seconds': self.parse_seconds,
+            'compute_seconds': self.compute_seconds
+        }
+        result.update(self.totals)
+
+        return result
+
+    def close(self):
+        """Finishes the trace if there is one."""
+        if self.trace is not None:
+            self.trace.close()
+
+
+def calc_profiled(computer, raw_instructions, stats):
+    """
+    Lazy calculation of distinct instructions one by one collecting their
+    statistics, pairs of instructions and results are yielded in input order.
+    """
+    with instrumented(stats.counts):
+        for raw_instruction in distinct(raw_instructions):
+            started = perf_counter()
+            instruction = parse_instruction(raw_instruction)
+            parsed = perf_counter()
+            cached = instruction in computer.cache
+            result = computer.calc_instruction(instruction)
+            stats.record(raw_instruction, cached, parsed - started, perf_counter() - parsed)
+
+            yield raw_instruction, result
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Persistent precomputation store: group orders of curves and fixed-base
+tables of base points, mapped read-only into every process that loads it.
+
+File layout, integers are big-endian:
+
+- header: magic `ECPS`, version (2 bytes), directory size (4 bytes)
+- directory: UTF-8 JSON list of entries of curves, given by their type,
+  payload and coefficients, with their group order, or with a base point,
+  its table bit length, window and number of rows and the offset of its
+  records from the end of the directory
+- records: multiples of base points as fixed-width records of a flag
+  byte, 0 for infinity, and the affine coordinates x, y in the width of
+  the curve field elements
+
+Tables are decoded from the mapping on their first use, so worker
+processes share one copy of the file in the page cache.
+"""
+import json
+import mmap
+import os
+import struct
+
+from lib.points import Curve, points_factory
+from lib.points.fixed_base import FixedBaseTable
+from lib.points.multipliers import projective
+
+MAGIC = b'ECPS'
+
+VERSION = 1
+
+HEADER = struct.Struct('>4sHI')
+
+
+def coordinate_width(curve):
+    """Bytes of a field element of a curve."""
+    bits = curve.modulus.bit_length() if curve.modulus is not None else curve.field.degree
+
+    return (bits + 7) // 8
+
+
+def curve_params(curve):
+    """JSON-compatible parameters the curve is built from."""
+    payload = list(curve.payload) if curve.curve_type == 'p' else curve.polynomial
+
+    return [curve.curve_type, payload, list(curve.coefficients)]
+
+
+def encode_records(table):
+    """Fixed-width records of the multiples of a table."""
+    width = coordinate_width(table.point.curve)
+    records = bytearray()
+
+    for row in table.rows:
+        for multiple in row:
+            if multiple is None:
+                records += bytes(1 + 2 * width)
+                continue
+
+            point = table.point._affine(multiple)  # pylint: disable=protected-access
+            records.append(1)
+            records += point.x.to_bytes(width, 'big') + point.y.to_bytes(width, 'big')
+
+    return records
+
+
+class PrecomputationStore:
+    """Read-only precomputations of a store file mapped into memory."""
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+        with open(file_path, mode='rb') as store_file:
+            self.data = mmap.mmap(store_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, size = HEADER.unpack_from(self.data)
+
+        if magic != MAGIC or version != VERSION:
+            self.data.close()
+            raise ValueError('Unsupported precomputation store: {}'.format(file_path))
+
+        self.records = HEADER.size + size
+        self.orders = {}
+        self.entries = {}
+        self.tables = {}
+
+        for entry in json.loads(self.data[HEADER.size:HEADER.size + size].decode('utf-8')):
+            curve = Curve(*entry['curve'])
+
+            if 'base' in entry:
+                self.entries[curve, tuple(entry['base'])] = entry
+            else:
+                self.orders[curve] = entry['order']
+
+    def order(self, curve):
+        """Stored group order of a curve or None."""
+        return self.orders.get(curve)
+
+    def table(self, point, bit_length):
+        """
+        Fixed-base table of a point decoded from the store on first use,
+        None if it is missing or covers fewer bits.
+        """
+        key = point.curve, (point.x, point.y)
+        table = self.tables.get(key)
+
+        if table is None:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                return None
+
+            table = FixedBaseTable(point, entry['bit_length'], entry['window'],
+                                   self._rows(point, entry))
+            self.tables[key] = table
+
+        return table if table.bit_length >= bit_length else None
+
+    def stored_tables(self):
+        """Every stored table, decoded."""
+        for curve, base in self.entries:
+            point = points_factory(curve, *base)
+            yield self.table(point, 0)
+
+    def close(self):
+        """Unmaps the file."""
+        self.data.close()
+
+    def _rows(self, point, entry):
+        """Projective multiples of a table entry decoded from its records."""
+        width = coordinate_width(point.curve)
+        size = 1 + 2 * width
+        offset = self.records + entry['offset']
+        columns = (1 << entry['window']) - 1
+        rows = []
+
+        for _ in range(entry['rows']):
+            row = []
+
+            for _ in range(columns):
+                record = self.data[offset:offset + size]
+                offset += size
+
+                if not record[0]:
+                    row.append(None)
+                    continue
+
+                x = int.from_bytes(record[1:1 + width], 'big')
+                y = int.from_bytes(record[1 + width:], 'big')
+                row.append(projective(points_factory(point.curve, x, y)))
+
+            rows.append(row)
+
+        return rows
+
+
+def open_store(file_path):
+    """Store of a file path, None if there is no path or the file does not exist yet."""
+    if file_path is None or not os.path.exists(file_path):
+        return None
+
+    return PrecomputationStore(file_path)
+
+
+def write_store(file_path, orders, tables):
+    """
+    Writes group orders of curves by curve and fixed-base tables to a store
+    file. The file is replaced atomically, processes mapping the old one keep it.
+    """
+    directory = []
+    records = []
+    offset = 0
+
+    for table in tables:
+        curve = table.point.curve
+        encoded = encode_records(table)
+        directory.append({
+            'curve': curve_params(curve),
+            'base': [table.point.x, table.point.y],
+            'bit_length': table.bit_length,
+            'window': table.window,
+            'rows': len(table.rows),
+            'offset': offset
+        })
+        records.append(encoded)
+        offset += len(encoded)
+
+    for curve, order in orders.items():
+        directory.append({'curve': curve_params(curve), 'order': order})
+
+    encoded_directory = json.dumps(directory).encode('utf-8')
+    temporary_path = '{}.{}.tmp'.format(file_path, os.getpid())
+
+    with open(temporary_path, mode='wb') as store_file:
+        store_file.write(HEADER.pack(MAGIC, VERSION, len(encoded_directory)))
+        store_file.write(encoded_directory)
+
+        for encoded in records:
+            store_file.write(encoded)
+
+    os.replace(temporary_path, file_path)
+
+
+def save_computer(file_path, computer, store=None):
+    """
+    Writes the group order and the fixed-base tables of a computer merged
+    with a loaded store, returns False when there is nothing new to write.
+    """
+    orders = dict(store.orders) if store is not None else {}
+    tables = {}
+
+    if store is not None:
+        tables = {(table.point.curve, (table.point.x, table.point.y)): table
+                  for table in store.stored_tables()}
+
+    built = {(table.point.curve, key): table for key, table in computer.tables.tables.items()}
+
+    if not built and (computer.order is None or computer.curve in orders):
+        return False
+
+    if computer.order is not None:
+        orders[computer.curve] = computer.order
+
+    tables.update(built)
+    write_store(file_path, orders, tables.values())
+
+    return True
@@ -4,33 +4,168 @@
 import sys
 
 from argparse import ArgumentParser
+from itertools import chain, takewhile
 from os.path import exists
 
-from lib import Computer, parse_number
+from lib import Computer, ParseError, parse_number
+from lib.computer import computer_of
+from lib.parallel import calc_parallel, calc_sections
+from lib.parser import ORDER_PATTERN
+from lib.points import Curve
+from lib.points.enumeration import count, enumerate_points, group_structure
+from lib.records import RecordReader, calc_records, write_records
+from lib.server import serve
+from lib.stats import Stats, calc_profiled
+from lib.store import open_store, save_computer
 
 
 __version__ = '1.0'
 
+OUTPUT_BUFFER_SIZE = 1 << 16
+
+SECTION_SEPARATOR = '---'
+
 
 def main():
     """Computation tools starting."""
-    input_file, output_file, debug = parse_args()
-    input_data = read_input(input_file)
-    curve_type, payload, coefficients, instructions = parse_input(input_data)
-    computer = Computer(curve_type, payload, coefficients)
+    # pylint: disable=too-many-branches,too-many-locals
+    input_file, output_file, debug, jobs, stats_path, address, store_path, enumerate_mode, \
+        input_format = parse_args()
+
+    if address is not None:
+        serve(address, jobs)
+        return
+
+    if input_format == 'binary':
+        calc_binary(input_file, output_file, debug, store_path)
+        return
 
-    for instruction in instructions:
-        if debug:
-            print('instruction: {}'.format(instruction))
+    sections = parse_sections(read_input(input_file))
+    computers = {}
+    stats = None
+    store = None
 
-        computer.calc(instruction)
+    if enumerate_mode:
+        results = (enumeration_results(*section) for section in sections)
+    elif stats_path is not None:
+        stats = Stats(stats_path or None)
+        results = (calc_profiled(computer_of(computers, section_curve(section)), section[-1],
+                                 stats) for section in sections)
+    elif jobs > 1 and sectioned(input_file):
+        results = calc_sections(((section_curve(section), section[-1]) for section in sections),
+                                jobs, store_path)
+    elif jobs > 1:
+        results = (calc_parallel(curve_type, payload, coefficients, instructions, jobs,
+                                 order=order, store_path=store_path)
+                   for curve_type, payload, coefficients, order, instructions in sections)
+    else:
+        store = open_store(store_path)
+        results = (computer_of(computers, section_curve(section), store).calc_stream(section[-1])
+                   for section in sections)
 
     if debug:
-        print('answer: {}'.format(computer.cache))
+        results = map(debug_results, results)
+
+    try:
+        write_sections(output_file, results)
+    except (ParseError, ValueError) as error:
+        print(error)
+        sys.exit(1)
+    finally:
+        if stats is not None:
+            stats.close()
+
+    if debug:
+        for computer in computers.values():
+            print('cache: {}, order {}: {}'.format(computer.curve, computer.order,
+                                                   computer.cache.stats()))
+
+    if stats is not None:
+        for name, value in stats.summary().items():
+            print('stats: {}: {}'.format(name, value))
 
     print('Result has been written in file `{}`'.format(output_file))
 
-    write_output(output_file, computer.cache)
+    if store_path is not None and stats is None:
+        for computer in computers.values():
+            if save_computer(store_path, computer, store):
+                print('Precomputations have been stored in file `{}`'.format(store_path))
+
+                if store is not None:
+                    store.close()
+
+                store = open_store(store_path)
+
+
+def calc_binary(input_file, output_file, debug, store_path):
+    """
+    Calculation of a binary instruction file mapped into memory in a single
+    process, results are written as records of the same layout.
+    """
+    check_input(input_file)
+    store = open_store(store_path)
+
+    try:
+        reader = RecordReader(input_file)
+    except ValueError as error:
+        print(error)
+        sys.exit(1)
+
+    curve = reader.layout.curve
+    computer = Computer(curve.curve_type, curve.payload, curve.coefficients, order=curve.order,
+                        store=store)
+    results = calc_records(computer, reader)
+
+    if debug:
+        results = debug_results(results)
+
+    try:
+        write_records(output_file, reader.layout,
+                      (reader.layout.encode_result(instruction[0], result)
+                       for instruction, result in results))
+    except ValueError as error:
+        print(error)
+        sys.exit(1)
+    finally:
+        reader.close()
+
+    print('Result has been written in file `{}`'.format(output_file))
+
+    if store_path is not None and save_computer(store_path, computer, store):
+        print('Precomputations have been stored in file `{}`'.format(store_path))
+
+
+def debug_results(results):
+    """Prints instructions with their results as they are computed."""
+    for instruction, result in results:
+        print('instruction: {}'.format(instruction))
+        print('answer: {}'.format(result))
+
+        yield instruction, result
+
+
+def enumeration_results(curve_type, payload, coefficients, order, instructions):
+    """
+    Lazy group order, every point of the curve with its order and the group
+    structure Z/n1 x Z/n2. Instructions are not expected in this mode.
+    """
+    if next(instructions, None) is not None:
+        raise ValueError('Instructions are not expected in the enumerate mode')
+
+    curve = Curve(curve_type, payload, coefficients)
+    order = count(curve) if order is None else order
+    exponent = 1
+
+    yield 'group order', order
+
+    for point, point_order in enumerate_points(curve, order):
+        exponent = max(exponent, point_order)
+
+        yield 'order {}'.format(point), point_order
+
+    invariants = [n for n in group_structure(order, exponent) if n > 1] or [1]
+
+    yield 'group structure', ' x '.join('Z/{}'.format(n) for n in invariants)
 
 
 def parse_args():
@@ -44,40 +179,129 @@ def parse_args():
     parser.add_argument('-o', '--output', type=str, default='output.txt',
                         help='output file path, default is `output.txt`')
     parser.add_argument('-d', '--debug', action='store_true', help="debug mode")
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='number of worker processes, default is 1')
+    parser.add_argument('-s', '--stats', nargs='?', const='', default=None, metavar='TRACE',
+                        help='count field and point operations instruction by instruction '
+                             'in a single process, optionally writing a trace file, '
+                             'JSON for .json paths and CSV otherwise')
+    parser.add_argument('--serve', type=str, default=None, metavar='ADDRESS',
+                        help='serve the line protocol on `host:port` or a Unix socket path '
+                             'with jobs worker processes for multiplications')
+    parser.add_argument('--store', type=str, default=None, metavar='PATH',
+                        help='precomputation store file mapped by every process, updated with '
+                             'new tables and group orders by single process runs only: warm it '
+                             'up by a run without --jobs before pooled runs')
+    parser.add_argument('-f', '--format', choices=('text', 'binary'), default='text',
+                        help='format of input and output files, binary files are computed '
+                             'in a single process, default is `text`')
+    parser.add_argument('-e', '--enumerate', action='store_true',
+                        help='list every point of a curve over a small field with its order '
+                             'and the group structure instead of instructions')
 
     args = parser.parse_args()
 
-    return args.input, args.output, args.debug
+    return args.input, args.output, args.debug, args.jobs, args.stats, args.serve, args.store, \
+        args.enumerate, args.format
 
 
-def read_input(file_path):
-    """Input file reading."""
+def check_input(file_path):
+    """Exits when the input file does not exist."""
     if not exists(file_path):
         print('Input file doesn`t exists: {}'.format(file_path))
         sys.exit(1)
 
+
+def read_input(file_path):
+    """Lazy input file reading line by line."""
+    check_input(file_path)
+
+    return read_lines(file_path)
+
+
+def read_lines(file_path):
+    """Stripped lines of a file."""
     with open(file_path, mode='r', encoding='utf-8') as input_file:
-        return list(map(str.strip, input_file))
+        yield from map(str.strip, input_file)
+
 
+def write_sections(file_path, sections):
+    """
+    Incremental output writing of instructions with their results section
+    by section, sections are separated as in the input.
+    """
+    separator = ''
 
-def write_output(file_path, data):
-    """Output writing."""
-    lines = list(map(lambda key: '{} = {}'.format(key, data[key]), data.keys()))
+    with open(file_path, mode='w+', encoding='utf-8', buffering=OUTPUT_BUFFER_SIZE) as output_file:
+        for index, results in enumerate(sections):
+            if index:
+                output_file.write('{}{}'.format(separator, SECTION_SEPARATOR))
+                separator = '\r\n'
 
-    with open(file_path, mode='w+', encoding='utf-8') as output_file:
-        output_file.write('\r\n'.join(lines))
+            for instruction, result in results:
+                output_file.write('{}{} = {}'.format(separator, instruction, result))
+                separator = '\r\n'
+
+
+def sectioned(file_path):
+    """Whether an input file has several sections."""
+    return any(line == SECTION_SEPARATOR for line in read_lines(file_path))
+
+
+def split_sections(input_lines):
+    """Lazy sections of lines separated by SECTION_SEPARATOR lines, empty ones are skipped."""
+    input_lines = iter(input_lines)
+
+    for line in input_lines:
+        if line and line != SECTION_SEPARATOR:
+            yield chain([line], takewhile(SECTION_SEPARATOR.__ne__, input_lines))
+
+
+def parse_sections(input_lines):
+    """
+    Lazy sections of an input parsed as input files, the instructions of
+    a section are read before the next section. An input has at least one.
+    """
+    empty = True
+
+    for section_lines in split_sections(input_lines):
+        empty = False
+        yield parse_input(section_lines)
+
+    if empty:
+        parse_input([])
+
+
+def section_curve(section):
+    """Curve of a parsed section."""
+    curve_type, payload, coefficients, order, _ = section
+
+    return Curve(curve_type, payload, coefficients, order)
 
 
 def parse_input(input_lines):
-    """Input data parsing."""
+    """
+    Input data parsing: header lines, the optional group order line
+    and a lazy stream of instructions.
+    """
+    input_lines = iter(input_lines)
+
     try:
-        curve_type = input_lines[0]
-        payload = parse_numbers(input_lines[1])
-        coefficients = parse_numbers(input_lines[2])
-        instructions = list(filter(bool, input_lines[3::]))
+        curve_type = next(input_lines)
+        payload = parse_numbers(next(input_lines))
+        coefficients = parse_numbers(next(input_lines))
+        instructions = filter(bool, input_lines)
+        order = None
+        first = next(instructions, None)
+
+        # Only a single number is the order, other lines are reported by the parser.
+        if first is not None and ORDER_PATTERN.fullmatch(first):
+            order = parse_number(first)
+        elif first is not None:
+            instructions = chain([first], instructions)
 
-        return curve_type, payload, coefficients, instructions
-    except IndexError:
+        return curve_type, payload, coefficients, order, instructions
+    except StopIteration:
         print('Input data is incorrect')
         sys.exit(1)
 
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Prime field backend tests."""
+from random import Random
+from unittest import TestCase
+
+from lib import Computer
+from lib.points import NAMED_CURVES, POINTS, Curve, points_factory
+from lib.points.backends import BACKENDS, DEFAULT_BACKEND
+from lib.points.order import random_point
+from lib.points.prime_point import PrimePoint, use_backend
+
+
+class BackendsTest(TestCase):
+    """Prime field backend test class."""
+    def tearDown(self):
+        use_backend(DEFAULT_BACKEND)
+
+    def test_field(self):
+        """Should give identical products, squares, reductions and inverses on every backend."""
+        random = Random(0)
+        moduli = [199, 2 ** 127 - 1, NAMED_CURVES['P-256']['payload'][0]]
+
+        for modulus in moduli:
+            for _ in range(20):
+                this = random.randrange(-modulus, 2 * modulus)
+                that = random.randrange(1, modulus)
+                expected = (this * that % modulus, this * this % modulus, this % modulus)
+
+                for backend in BACKENDS.values():
+                    self.assertEqual((backend.multiply(this, that, modulus),
+                                      backend.square(this, modulus),
+                                      backend.reduce(this, modulus)), expected)
+                    self.assertEqual(backend.inverse(that, modulus) * that % modulus, 1)
+                    self.assertEqual(backend.inverse(that - modulus, modulus) * that % modulus, 1)
+
+                    with self.assertRaises(ZeroDivisionError):
+                        backend.inverse(modulus, modulus)
+
+    def test_points(self):
+        """Should give identical int coordinates of sums and products on every backend."""
+        random = Random(1)
+        params = NAMED_CURVES['P-256']
+        named = Curve(params['curve_type'], params['payload'], params['coefficients'])
+        points = [points_factory(named, *params['generator']),
+                  random_point(Curve('p', [199], [1, 3]), PrimePoint, random)]
+        factors = [random.getrandbits(256) for _ in range(5)]
+        results = {}
+
+        for name in BACKENDS:
+            use_backend(name)
+            results[name] = [point * factor for point in points for factor in factors]
+            results[name] += [point + point * 3 for point in points]
+            computer = Computer('p', [199], [1, 3])
+            results[name].append(computer.calc('({0.x}, {0.y}) * 1000'.format(points[1])))
+
+            for point in results[name]:
+                self.assertIs(type(point.x), int)
+
+        expected = [(point.x, point.y) for point in results['pure']]
+
+        for name, points in results.items():
+            self.assertEqual([(point.x, point.y) for point in points], expected, name)
+
+    def test_default(self):
+        """Should choose the fastest available backend and reject unknown ones."""
+        self.assertIs(POINTS['p'].backend, BACKENDS[DEFAULT_BACKEND])
+        self.assertEqual(DEFAULT_BACKEND, 'gmpy2' if 'gmpy2' in BACKENDS else
+                         'builtin' if 'builtin' in BACKENDS else 'pure')
+
+        with self.assertRaises(ValueError):
+            use_backend('unknown')
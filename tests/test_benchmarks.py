@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Benchmark suite tests."""
+from unittest import TestCase
+
+from benchmarks.suite import cases, compare, measure, summary
+
+
+class BenchmarksTest(TestCase):
+    """Benchmark suite test class."""
+    def test_cases(self):
+        """Should cover every curve family, operation and field primitive."""
+        names = set(cases())
+
+        for curve in ('P-192', 'P-256', 'B-163', 'K-163', 'p-199', 'n-2^4', 's-2^4'):
+            for operation in ('add', 'double', 'multiply', 'field/inverse', 'field/multiply',
+                              'field/modulus'):
+                self.assertIn('{}/{}'.format(curve, operation), names)
+
+        self.assertIn('main/P-256', names)
+
+    def test_measure(self):
+        """Should report operations per second of every repeat."""
+        rates = measure(lambda: sum(range(100)), 10, repeats=3, min_seconds=0.001)
+        result = summary(rates)
+
+        self.assertEqual(result['repeats'], 3)
+        self.assertGreater(result['ops'], 0)
+        self.assertGreaterEqual(result['stdev'], 0)
+
+    def test_compare(self):
+        """Should flag cases slower than the baseline by more than the threshold."""
+        baseline = {'fast': {'ops': 100.0}, 'slow': {'ops': 100.0}, 'gone': {'ops': 1.0}}
+        results = {'fast': {'ops': 95.0}, 'slow': {'ops': 70.0}, 'new': {'ops': 1.0}}
+
+        self.assertEqual(compare(results, baseline, 0.2), {'slow': 0.7})
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Binary field arithmetic tests."""
+from random import Random
+from unittest import TestCase
+
+from lib.points.binary_field import BinaryField
+from lib.points.curve import convert_polynomial
+
+
+def multiply(polynomial, this_num, that_num):
+    """Bit-serial reference multiplication."""
+    result = 0
+
+    while that_num:
+        if that_num & 1:
+            result ^= this_num
+
+        that_num >>= 1
+        this_num <<= 1
+
+    while result.bit_length() >= polynomial.bit_length():
+        result ^= polynomial << (result.bit_length() - polynomial.bit_length())
+
+    return result
+
+
+class BinaryFieldTest(TestCase):
+    """Binary field test class."""
+    def test_arithmetic(self):
+        """Should multiply, square and reduce as the reference does."""
+        random = Random(0)
+
+        for powers in ([4, 1, 0], [8, 4, 3, 1, 0], [163, 7, 6, 3, 0], [233, 74, 0],
+                       [9, 8, 7, 6, 4, 3, 0]):
+            polynomial = convert_polynomial(powers)
+            field = BinaryField(polynomial)
+
+            for _ in range(200):
+                this_num = random.getrandbits(field.degree + random.randrange(3))
+                that_num = random.getrandbits(field.degree)
+
+                self.assertEqual(field.multiply(this_num, that_num),
+                                 multiply(polynomial, this_num, that_num))
+                self.assertEqual(field.square(this_num), multiply(polynomial, this_num, this_num))
+                self.assertEqual(field.modulus(this_num << field.degree),
+                                 multiply(polynomial, this_num, 1 << field.degree))
+
+    def test_inverse(self):
+        """Should inverse numbers by both inversion methods."""
+        random = Random(1)
+
+        for powers in ([4, 1, 0], [5, 2, 0], [163, 7, 6, 3, 0], [233, 74, 0]):
+            field = BinaryField(convert_polynomial(powers))
+
+            for _ in range(50):
+                number = random.getrandbits(field.degree) or 1
+
+                for inverse in (field.euclid_inverse, field.itoh_tsujii_inverse):
+                    self.assertEqual(field.multiply(inverse(number), number), 1)
+
+            self.assertRaises(ZeroDivisionError, field.inverse, field.polynomial)
+
+    def test_inversion(self):
+        """Should inverse by the binary extended Euclid unless Itoh-Tsujii is chosen."""
+        polynomial = convert_polynomial([163, 7, 6, 3, 0])
+        default = BinaryField(polynomial)
+        field = BinaryField(polynomial, 'itoh-tsujii')
+
+        self.assertEqual(default.inverse, default.euclid_inverse)
+        self.assertEqual(field.inverse, field.itoh_tsujii_inverse)
+        self.assertEqual(field.multiply(field.inverse(12345), 12345), 1)
+
+        with self.assertRaises(ValueError):
+            BinaryField(polynomial, 'unknown')
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Result cache tests."""
+from unittest import TestCase
+
+from lib import Computer
+from lib.cache import ResultCache
+
+
+class ResultCacheTest(TestCase):
+    """Result cache test class."""
+    def test_eviction(self):
+        """Should evict least recently used entries over the bounds."""
+        cache = ResultCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertEqual(cache.get('b'), None)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+        cache = ResultCache(10, 1)
+        cache.put('a', 1)
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats()['bytes'], 0)
+
+    def test_canonical_keys(self):
+        """Should share results of instructions spelled differently and echo their spelling."""
+        computer = Computer('p', [199], [1, 3])
+        instructions = ['(1, 76) * 3', '(0x1, 0b1001100) * 3', '(0o1, 76) * 3', '(1, 76) * 3']
+
+        results = list(computer.calc_stream(instructions))
+        stats = computer.cache.stats()
+
+        self.assertEqual([instruction for instruction, _ in results], instructions[:3])
+        self.assertEqual({str(result) for _, result in results}, {'(138, 47)'})
+        self.assertEqual((stats['entries'], stats['misses']), (1, 1))
+        self.assertEqual(str(computer.calc('(1, 0x4c) * 3')), '(138, 47)')
+        self.assertEqual(computer.cache.stats()['hits'], 1)
+        self.assertGreater(stats['bytes'], 0)
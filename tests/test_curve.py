@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Curve context tests."""
+import pickle
+from unittest import TestCase
+
+from lib.points import Curve, points_factory
+
+
+class CurveTest(TestCase):
+    """Curve context test class."""
+    def test_normalization(self):
+        """Should normalize fields and compare curves by parameters."""
+        self.assertEqual(Curve('p', [23], [20, 1]), Curve('p', (23,), [20, 1]))
+        self.assertEqual(Curve('n', [4, 1, 0], [1, 1, 1]), Curve('n', 0b10011, [1, 1, 1]))
+        self.assertNotEqual(Curve('n', [4, 1, 0], [1, 1, 1]), Curve('s', [4, 1, 0], [1, 1, 1]))
+        self.assertTrue(Curve('p', [23], [-3, 1]).a_is_minus_3)
+
+    def test_coefficients_reduction(self):
+        """Should reduce coefficients to field elements, so results are field elements too."""
+        self.assertEqual(Curve('p', [23], [-3, 24]), Curve('p', [23], [20, 1]))
+        self.assertEqual(Curve('n', [4, 1, 0], [0b10011, 1, 1]), Curve('n', [4, 1, 0], [0, 1, 1]))
+
+        point = points_factory(Curve('n', [4, 1, 0], [1000, 1001]), 0b0010, 0b1111)
+        other = points_factory(point.curve, 0b1100, 0b1100)
+
+        self.assertEqual(((point + other).x, (point + other).y), (0b0110, 0b1111))
+        self.assertEqual(point + point, point * 2)
+
+    def test_immutability(self):
+        """Should forbid changes of a curve and of point attributes set."""
+        curve = Curve('p', [23], [1, 1])
+        point = points_factory(curve, 3, 10)
+
+        with self.assertRaises(AttributeError):
+            curve.a = 2
+
+        with self.assertRaises(AttributeError):
+            point.z = 1
+
+    def test_points_identity(self):
+        """Should hash equal points equally and keep them through pickling."""
+        curve = Curve('n', [4, 1, 0], [1, 1, 1])
+        point = points_factory(curve, 0b1000, 0b0010)
+        same = points_factory(Curve('n', [4, 1, 0], [1, 1, 1]), 0b1000, 0b0010)
+
+        self.assertEqual(point, same)
+        self.assertEqual(len({point, same, point + point}), 2)
+        self.assertEqual(pickle.loads(pickle.dumps(point)), point)
+        self.assertEqual(point * 2, point + point)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Point enumeration tests."""
+from unittest import TestCase
+from unittest.mock import patch
+
+from lib.points import Curve
+from lib.points import enumeration
+from lib.points.enumeration import count, enumerate_points
+from lib.points.logarithm import factorize
+from lib.points.order import count_points
+from main import enumeration_results
+
+
+class EnumerationTest(TestCase):
+    """Point enumeration test class."""
+    curves = [Curve('p', [199], [1, 3]), Curve('p', [1009], [0, 7]),
+              Curve('n', [4, 1, 0], [1, 1, 1]), Curve('n', [5, 2, 0], [0b110, 1, 1]),
+              Curve('s', [4, 1, 0], [1, 1, 1]), Curve('s', [7, 1, 0], [1, 0, 1])]
+
+    def test_points(self):
+        """Should list every point of prime and binary curves once with its order."""
+        for curve in self.curves:
+            pairs = list(enumerate_points(curve))
+            keys = [(point.x, point.y) for point, _ in pairs]
+
+            self.assertEqual(len(pairs), count_points(curve))
+            self.assertEqual(count(curve), count_points(curve))
+            self.assertEqual(keys[0], (None, None))
+            self.assertEqual(keys[1:], sorted(set(keys[1:])))
+
+            for point, order in pairs:
+                self.assertTrue(point.on_curve())
+                self.assertIsNone((point * order).x)
+
+                for prime in factorize(order):
+                    self.assertIsNotNone((point * (order // prime)).x)
+
+    def test_plain(self):
+        """Should list the same points and orders without NumPy."""
+        for curve in self.curves:
+            expected = [(point.x, point.y, order) for point, order in enumerate_points(curve)]
+
+            with patch.object(enumeration, 'numpy', None):
+                actual = [(point.x, point.y, order) for point, order in enumerate_points(curve)]
+
+            self.assertEqual(actual, expected)
+
+    def test_results(self):
+        """Should report the group order and the structure of cyclic and non-cyclic groups."""
+        results = list(enumeration_results('p', [11], [10, 0], None, iter([])))
+
+        self.assertEqual(results[0], ('group order', 12))
+        self.assertEqual(results[2], ('order (0, 0)', 2))
+        self.assertEqual(results[-1], ('group structure', 'Z/6 x Z/2'))
+
+        results = list(enumeration_results('p', [199], [1, 3], 197, iter([])))
+
+        self.assertEqual(results[-1], ('group structure', 'Z/197'))
+
+    def test_errors(self):
+        """Should reject large fields, singular curves and instructions."""
+        with self.assertRaises(ValueError):
+            next(enumerate_points(Curve('p', [2 ** 31 - 1], [1, 3])))
+
+        with self.assertRaises(ValueError):
+            next(enumerate_points(Curve('p', [199], [0, 0])))
+
+        with self.assertRaises(ValueError):
+            list(enumeration_results('p', [199], [1, 3], None, iter(['(1, 76) * 2'])))
@@ -35,6 +35,32 @@ class EllipticCurveTest(TestCase):
 
             self.assertEqual(str(actual), instructions[instruction])
 
+    def test_prime_jacobian_mul(self):
+        """Should multiply points in Jacobian coordinates as affine double-and-add."""
+        modulus = 0xfffffffffffffffffffffffffffffffeffffffffffffffff
+        factors = [2, 3, 0xff, 0x64210519e59c80e70fa7e9ab72243049feb8deecc146b9b1,
+                   0x7192b95ffc8da78631011ed6b24cdd573f977a11e794811]
+
+        for a, b in ((-3, 5), (1, 5)):
+            computer = Computer('p', [modulus], [a, b])
+            x = next(x for x in range(1, 100)
+                     if pow(x ** 3 + a * x + b, (modulus - 1) // 2, modulus) == 1)
+            y = pow(x ** 3 + a * x + b, (modulus + 1) // 4, modulus)
+
+            for factor in factors:
+                expected = computer.calc('({}, {}) * 1'.format(x, y))
+
+                for bit in bin(factor)[3:]:
+                    expected = computer.calc('({0.x}, {0.y}) + ({0.x}, {0.y})'.format(expected))
+
+                    if bit == '1':
+                        expected = computer.calc('({0.x}, {0.y}) + ({1}, {2})'
+                                                 .format(expected, x, y))
+
+                actual = computer.calc('({}, {}) * {}'.format(x, y, factor))
+
+                self.assertEqual(str(actual), str(expected))
+
     def test_prime_sum_points(self):
         """Should sum points in Zp."""
         curve_type = 'p'
@@ -137,6 +163,31 @@ class EllipticCurveTest(TestCase):
 
             self.assertEqual(str(actual), instructions[instruction])
 
+    def test_supersingular(self):
+        """Should sum and multiply points and numbers on a supersingular curve."""
+        curve_type = 's'
+        payload = [4, 1, 0]
+        coefficients = [1, 1, 1]
+
+        computer = Computer(curve_type, payload, coefficients)
+
+        instructions = {
+            '(0b0001, 0b0111) + (0b0001, 0b0111)': '(0000, 0110)',
+            '(0b0001, 0b0111) + (0b0110, 0b0010)': '(1001, 0100)',
+            '(0b0110, 0b0010) + (0b0110, 0b0011)': 'e',
+            '(0b0110, 0b0010) * 1': '(0110, 0010)',
+            '(0b0110, 0b0010) * 2': '(0111, 0101)',
+            '(0b0110, 0b0010) * 3': '(0111, 0100)',
+            '(0b0110, 0b0010) * 4': '(0110, 0011)',
+            '(0b0110, 0b0010) * 5': 'e',
+            '(0b0110, 0b0010) * 6': '(0110, 0010)'
+        }
+
+        for instruction in instructions:
+            actual = computer.calc(instruction)
+
+            self.assertEqual(str(actual), instructions[instruction])
+
     def test_prime_mul_2(self):
         """Should multiply points in Zp."""
         curve_type = 'p'
@@ -187,3 +238,84 @@ class EllipticCurveTest(TestCase):
             actual = computer.calc(instruction)
 
             self.assertEqual(str(actual), instructions[instruction])
+
+    def test_fixed_base_tables(self):
+        """Should multiply hot base points through fixed-base tables."""
+        curve_type = 'p'
+        payload = [6277101735386680763835789423207666416083908700390324961279]
+        coefficients = [-3, 2455155546008943817740293915197451784769108058161191238065]
+
+        computer = Computer(curve_type, payload, coefficients)
+        plain_computer = Computer(curve_type, payload, coefficients, tables_size=0)
+
+        # pylint: disable=line-too-long
+        point = '(602046282375688656758213480587526111916698976636884684818, 174050332293622031404857552280219410364023488927386650641)'
+        # pylint: enable=line-too-long
+
+        for factor in range(-20, 2 ** 190, 2 ** 185 + 12345):
+            instruction = '{} * {}'.format(point, factor)
+
+            self.assertEqual(str(computer.calc(instruction)), str(plain_computer.calc(instruction)))
+
+        self.assertEqual(len(computer.tables), 1)
+
+    def test_batch(self):
+        """Should calculate instructions in a batch as one by one."""
+        curves = [
+            ('p', [199], [1, 3], ['(1, 76)', '(158, 166)', '(138, 47)']),
+            ('n', [4, 1, 0], [1, 1, 1],
+             ['(0b1000, 0b0010)', '(0b0110, 0b0111)', '(0b1010, 0b0101)']),
+            ('s', [4, 1, 0], [1, 1, 1],
+             ['(0b0001, 0b0111)', '(0b0110, 0b0010)', '(0b0111, 0b0101)'])
+        ]
+
+        for curve_type, payload, coefficients, points in curves:
+            instructions = []
+
+            for this in points:
+                for that in points:
+                    instructions.append('{} + {}'.format(this, that))
+
+                for factor in (-7, -1, 0, 1, 2, 3, 12, 197, 2 ** 40 + 1):
+                    instructions.append('{} * {}'.format(this, factor))
+
+            computer = Computer(curve_type, payload, coefficients)
+            batch_computer = Computer(curve_type, payload, coefficients)
+
+            expected = [str(computer.calc(instruction)) for instruction in instructions]
+            actual = [str(result) for result in batch_computer.calc_batch(instructions)]
+
+            self.assertEqual(actual, expected)
+
+    def test_stream(self):
+        """Should calculate distinct instructions of a stream in order."""
+        points = ['(1, 76)', '(158, 166)', '(138, 47)']
+        instructions = ['{} * {}'.format(point, factor)
+                        for point in points for factor in (2, 3, 12, 2, 197)]
+        instructions += ['{} + {}'.format(point, point) for point in points]
+
+        computer = Computer('p', [199], [1, 3])
+        stream_computer = Computer('p', [199], [1, 3])
+
+        expected = [(instruction, str(computer.calc(instruction)))
+                    for instruction in dict.fromkeys(instructions)]
+        actual = [(instruction, str(result))
+                  for instruction, result in stream_computer.calc_stream(iter(instructions), 4)]
+
+        self.assertEqual(actual, expected)
+        self.assertEqual(len(stream_computer.cache), len(expected))
+
+    def test_linear_combination(self):
+        """Should calculate linear combinations of points."""
+        computer = Computer('p', [199], [1, 3])
+
+        instructions = {
+            '(1, 76) * 3 + (158, 166) * -5': '(132, 85)',
+            '(1, 76) + (158, 166) + (138, 47)': str(computer.calc('(1, 76) * 6')),
+            '(1, 76) * 2 + (0b1, 0x4c) * -2': 'e',
+            '(1, 76) + (158, 166)': '(138, 47)'
+        }
+
+        actual = computer.calc_batch(list(instructions))
+
+        self.assertEqual([str(result) for result in actual], list(instructions.values()))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Koblitz curves multiplication tests."""
+from random import Random
+from unittest import TestCase
+
+from lib.points import NAMED_CURVES, Curve, Point2N, points_factory
+from lib.points.koblitz import frobenius_modulus, multiply, norm, reduce_factor, tau_naf, \
+    tau_power, tnaf
+from lib.points.multipliers import wnaf
+from lib.points.order import random_point
+
+
+def evaluate(digits, mu):
+    """Element of Z[τ] of τ-adic digits."""
+    result = 0, 0
+
+    for index, digit in enumerate(digits):
+        power = tau_power(mu, index) if index else (1, 0)
+        term = multiply((digit, 0), power, mu)
+        result = result[0] + term[0], result[1] + term[1]
+
+    return result
+
+
+class KoblitzTest(TestCase):
+    """Koblitz curves multiplication test class."""
+    def test_detection(self):
+        """Should detect Koblitz curves by their coefficients."""
+        self.assertEqual(Curve('n', [163, 7, 6, 3, 0], [1, 1, 1]).koblitz, 1)
+        self.assertEqual(Curve('n', [233, 74, 0], [1, 0, 1]).koblitz, -1)
+        self.assertIsNone(Curve('n', [233, 74, 0], [1, 1, 0b110]).koblitz)
+        self.assertIsNone(Curve('n', [4, 1, 0], [0b10, 1, 1]).koblitz)
+        self.assertIsNone(Curve('s', [4, 1, 0], [1, 1, 1]).koblitz)
+
+    def test_tau_naf(self):
+        """Should expand elements of Z[τ] in a width-w τ-adic NAF."""
+        for mu in (1, -1):
+            for window in range(2, 6):
+                for r0 in range(-40, 41):
+                    for r1 in range(-40, 41, 3):
+                        digits = tau_naf((r0, r1), mu, window)
+
+                        self.assertEqual(evaluate(digits, mu), (r0, r1))
+                        self.assertTrue(all(digit % 2 for digit in digits if digit))
+                        self.assertTrue(all(abs(digit) < 1 << (window - 1) for digit in digits))
+
+                        for index, digit in enumerate(digits):
+                            if digit:
+                                self.assertFalse(any(digits[index + 1:index + window]))
+
+    def test_reduce_factor(self):
+        """Should reduce factors to congruent elements of a small norm."""
+        random = Random(0)
+
+        for degree, mu in ((163, 1), (233, -1)):
+            modulus, modulus_norm = frobenius_modulus(degree, mu)
+            s0, s1 = modulus
+
+            for _ in range(20):
+                factor = random.getrandbits(2 * degree)
+                r0, r1 = reduce_factor(factor, degree, mu)
+                d0, d1 = factor - r0, -r1
+                numerator = multiply((d0, d1), (s0 + mu * s1, -s1), mu)
+
+                self.assertEqual(numerator[0] % modulus_norm, 0)
+                self.assertEqual(numerator[1] % modulus_norm, 0)
+                self.assertLess(norm((r0, r1), mu), modulus_norm)
+
+    def test_small_curves(self):
+        """Should multiply points of every order equally to w-NAF."""
+        # pylint: disable=protected-access
+        random = Random(0)
+
+        for polynomial in ([5, 2, 0], [7, 1, 0], [11, 2, 0]):
+            for b in (0, 1):
+                curve = Curve('n', polynomial, [1, b, 1])
+
+                for _ in range(5):
+                    point = random_point(curve, Point2N, random)
+
+                    for factor in list(range(1, 40)) + [random.getrandbits(40) for _ in range(5)]:
+                        actual = tnaf(point, factor) or (1, 1, 0)
+                        expected = wnaf(point, factor) or (1, 1, 0)
+
+                        self.assertEqual(point._affine(actual), point._affine(expected))
+
+    def test_named_curves(self):
+        """Should multiply generators of K-163 and K-233 by τNAF."""
+        random = Random(0)
+
+        for name in ('K-163', 'K-233'):
+            params = NAMED_CURVES[name]
+            curve = Curve(params['curve_type'], params['payload'], params['coefficients'])
+            point = points_factory(curve, *params['generator'])
+
+            self.assertIsNotNone(curve.koblitz)
+            self.assertIs(point.multiplier(), tnaf)
+            self.assertIsNone((point * params['subgroup_order']).x)
+
+            for _ in range(3):
+                factor = random.getrandbits(params['payload'][0])
+
+                self.assertEqual(point * factor, point.factorize(factor, 'binary'))
+
+    def test_not_on_curve(self):
+        """Should multiply points off a Koblitz curve by w-NAF."""
+        point = points_factory(Curve('n', [4, 1, 0], [1, 1, 1]), 0b0001, 0b0001)
+
+        self.assertFalse(point.on_curve())
+        self.assertIs(point.multiplier(), wnaf)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Discrete logarithm tests."""
+from concurrent.futures import ProcessPoolExecutor
+from random import Random
+from unittest import TestCase
+
+from lib import Computer
+from lib.points import POINTS, Curve, points_factory
+from lib.points.logarithm import baby_giant, factorize, is_prime, logarithm, point_order, rho
+from lib.points.order import group_order, random_point
+
+
+class LogarithmTest(TestCase):
+    """Discrete logarithm test class."""
+    def test_factorize(self):
+        """Should factor group orders into primes."""
+        numbers = [1, 2, 216, 2 ** 14 * 61, 4196903 * 2, 165103 * 13007, (2 ** 61 - 1) * 1000003]
+
+        for number in numbers:
+            factors = factorize(number)
+            product = 1
+
+            for prime, exponent in factors.items():
+                self.assertTrue(is_prime(prime))
+                product *= prime ** exponent
+
+            self.assertEqual(product, number)
+
+        self.assertFalse(is_prime(561))
+        self.assertFalse(is_prime(3215031751))
+
+    def test_small_curves(self):
+        """Should find logarithms on prime and binary curves with composite orders."""
+        random = Random(0)
+        curves = [Curve('p', [199], [1, 3]), Curve('p', [1000003], [2, 7]),
+                  Curve('n', [5, 2, 0], [1, 1, 1]), Curve('s', [7, 1, 0], [1, 1, 1]),
+                  Curve('n', [11, 2, 0], [0b101, 1, 1])]
+
+        for curve in curves:
+            point_class = POINTS[curve.curve_type]
+            order = group_order(curve, point_class)
+
+            for _ in range(5):
+                base = random_point(curve, point_class, random)
+                factor = random.randrange(point_order(base, factorize(order)))
+
+                self.assertEqual(logarithm(base, base * factor), factor)
+
+    def test_rho(self):
+        """Should find logarithms in a prime order subgroup by walks in and out of process."""
+        random = Random(1)
+        curve = Curve('p', [2147483647], [3, 5])
+        base = random_point(curve, POINTS['p'], random) * 13007
+
+        self.assertEqual(point_order(base, factorize(group_order(curve, POINTS['p']))), 165103)
+
+        factors = [random.randrange(165103) for _ in range(3)]
+
+        for factor in factors:
+            self.assertEqual(rho(base, base * factor, 165103, seed=factor), factor)
+
+        with ProcessPoolExecutor(2) as executor:
+            for factor in factors:
+                self.assertEqual(rho(base, base * factor, 165103, executor, 2), factor)
+
+        self.assertEqual(baby_giant(base, base * factors[0], 165103), factors[0])
+
+    def test_errors(self):
+        """Should reject points off the curve, unknown orders and targets out of the subgroup."""
+        computer = Computer('p', [199], [1, 3])
+
+        self.assertEqual(computer.calc('(1, 76) log (158, 166)'), 2)
+
+        with self.assertRaises(ValueError):
+            computer.calc('(1, 76) log (3, 5)')
+
+        curve = Curve('p', [2 ** 127 - 1], [1, 3])
+        point = random_point(curve, POINTS['p'], Random(2))
+
+        with self.assertRaises(ValueError):
+            logarithm(point, point * 3)
+
+        curve = Curve('p', [1000003], [2, 7])
+        generator = Random(3)
+        base = random_point(curve, POINTS['p'], generator) * (2 ** 14)
+        target = random_point(curve, POINTS['p'], generator) * 61
+
+        self.assertEqual(point_order(base, factorize(999424)), 61)
+
+        with self.assertRaises(ValueError):
+            logarithm(base, target)
+
+        self.assertEqual(logarithm(base, points_factory(curve)), 0)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Input parsing tests."""
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from lib import Computer, ParseError
+from main import main, parse_input, parse_sections, write_sections
+
+
+class MainTest(TestCase):
+    """Input parsing test class."""
+    def test_order(self):
+        """Should read a single number in any radix after the header as the group order."""
+        for line, order in (('216', 216), ('0xd8', 216), ('0b11011000', 216), ('0o330', 216)):
+            _, _, _, actual, instructions = parse_input(['p', '199', '1 3', line, '(1, 76) * 2'])
+
+            self.assertEqual(actual, order)
+            self.assertEqual(list(instructions), ['(1, 76) * 2'])
+
+    def test_malformed_first_instruction(self):
+        """Should leave a malformed first instruction to the parser instead of the order."""
+        curve_type, payload, coefficients, order, instructions = parse_input(
+            ['p', '199', '1 3', '1, 76) * 2', '0x1g'])
+        computer = Computer(curve_type, payload, coefficients, order=order)
+
+        self.assertIsNone(order)
+
+        for instruction in instructions:
+            with self.assertRaises(ParseError):
+                computer.calc(instruction)
+
+    def test_sections(self):
+        """Should read curves with their orders and instructions section by section."""
+        lines = ['p', '199', '1 3', '(1, 76) * 2', '', '---', '', 'n', '4 1 0', '1 1 1',
+                 '(0001, 0110) * 3', '---', '---', 'p', '199', '1 3', '197', '(1, 76) * 5']
+        sections = [(curve_type, payload, coefficients, order, list(instructions))
+                    for curve_type, payload, coefficients, order, instructions
+                    in parse_sections(lines)]
+
+        self.assertEqual(sections, [
+            ('p', [199], [1, 3], None, ['(1, 76) * 2']),
+            ('n', [4, 1, 0], [1, 1, 1], None, ['(0001, 0110) * 3']),
+            ('p', [199], [1, 3], 197, ['(1, 76) * 5'])])
+        self.assertEqual(len(list(parse_sections(lines[:4]))), 1)
+
+        with TemporaryDirectory() as directory:
+            file_path = join(directory, 'output.txt')
+            write_sections(file_path, [[('(1, 76) * 2', 'e')], [], [('(1, 6) * 3', 'e')]])
+
+            with open(file_path, mode='r', encoding='utf-8', newline='') as output_file:
+                self.assertEqual(output_file.read(),
+                                 '(1, 76) * 2 = e\r\n---\r\n---\r\n(1, 6) * 3 = e')
+
+    def test_section_orders(self):
+        """Should compute a repeated curve with another order line by another computer."""
+        lines = ['p', '97', '2 3', '(3, 6) * 2', '---', 'p', '97', '2 3', '7', '(3, 6) * 7']
+
+        for jobs in ('1', '2'):
+            with TemporaryDirectory() as directory:
+                input_path = join(directory, 'input.txt')
+                output_path = join(directory, 'output.txt')
+
+                with open(input_path, mode='w', encoding='utf-8') as input_file:
+                    input_file.write('\n'.join(lines))
+
+                with patch('sys.argv', ['main.py', '-i', input_path, '-o', output_path,
+                                        '-j', jobs]), patch('builtins.print'):
+                    main()
+
+                with open(output_path, mode='r', encoding='utf-8', newline='') as output_file:
+                    self.assertEqual(output_file.read(),
+                                     '(3, 6) * 2 = (80, 10)\r\n---\r\n(3, 6) * 7 = e')
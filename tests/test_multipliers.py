@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Scalar multiplication engines tests."""
+from unittest import TestCase
+
+from lib.points import Curve, points_factory
+from lib.points.multipliers import MULTIPLIERS, linear_combination, naf, pippenger, straus
+
+
+class MultipliersTest(TestCase):
+    """Scalar multiplication engines test class."""
+    def test_naf(self):
+        """Should expand factors in a width-w non-adjacent form."""
+        for window in range(2, 6):
+            for factor in range(1, 300):
+                digits = naf(factor, window)
+
+                self.assertEqual(sum(digit << index for index, digit in enumerate(digits)), factor)
+                self.assertTrue(all(digit % 2 for digit in digits if digit))
+                self.assertTrue(all(abs(digit) < 1 << (window - 1) for digit in digits))
+
+    def test_engines_agree(self):
+        """Should multiply points equally by every engine and window."""
+        points = [
+            points_factory(Curve('p', [199], [1, 3]), 1, 76),
+            points_factory(Curve('n', [4, 1, 0], [1, 1, 1]), 0b1000, 0b0010),
+            points_factory(Curve('s', [4, 1, 0], [1, 1, 1]), 0b0110, 0b0010)
+        ]
+
+        for point in points:
+            expected = point
+
+            for factor in range(2, 40):
+                expected += point
+
+                for method in MULTIPLIERS:
+                    for window in (None, 2, 3, 4):
+                        actual = point.factorize(factor, method, window)
+
+                        self.assertEqual(str(actual), str(expected))
+
+    def test_linear_combination(self):
+        """Should sum multiples of points by interleaved and bucket methods."""
+        # pylint: disable=protected-access
+        points = [
+            [points_factory(Curve('p', [199], [1, 3]), 1, 76),
+             points_factory(Curve('p', [199], [1, 3]), 158, 166)],
+            [points_factory(Curve('n', [4, 1, 0], [1, 1, 1]), 0b1000, 0b0010),
+             points_factory(Curve('n', [4, 1, 0], [1, 1, 1]), 0b0110, 0b0111)],
+            [points_factory(Curve('s', [4, 1, 0], [1, 1, 1]), 0b0110, 0b0010),
+             points_factory(Curve('s', [4, 1, 0], [1, 1, 1]), 0b0001, 0b0111)]
+        ]
+
+        for this, that in points:
+            for count in (1, 2, 3, 20):
+                terms = [(this if index % 2 else that, 37 * index + 5) for index in range(count)]
+                expected = this * 0
+
+                for point, factor in terms:
+                    expected += point * factor
+
+                self.assertEqual(linear_combination(terms), expected)
+                self.assertEqual(linear_combination(terms + [(that, -5)]), expected + that * -5)
+
+                for engine in (straus, pippenger):
+                    for window in (None, 2, 5):
+                        result = engine(terms, window)
+                        actual = this * 0 if result is None else this._affine(result)
+
+                        self.assertEqual(actual, expected)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Group order tests."""
+from random import Random
+from unittest import TestCase
+
+from lib import Computer
+from lib.points import NAMED_CURVES, POINTS, Curve, points_factory
+from lib.points.binary_field import binary_field
+from lib.points.order import count_points, group_order, prime_sqrt, solve_quadratic, trace
+
+
+class GroupOrderTest(TestCase):
+    """Group order test class."""
+    def test_named_curves(self):
+        """Should know orders of named curves and reduce factors by them."""
+        for name, params in NAMED_CURVES.items():
+            curve = Curve(params['curve_type'], params['payload'], params['coefficients'])
+            generator = points_factory(curve, *params['generator'])
+
+            self.assertEqual(curve.order, params['subgroup_order'] * params['cofactor'], name)
+            self.assertTrue(generator.on_curve(), name)
+            self.assertEqual(generator.reduce_factor(curve.order + 5), 5)
+
+        off_curve = points_factory(Curve('p', [2 ** 192 - 2 ** 64 - 1], [-3, 1]), 1, 2)
+
+        self.assertEqual(off_curve.reduce_factor(10 ** 60), 10 ** 60)
+
+    def test_computed_orders(self):
+        """Should compute orders of curves over small fields."""
+        curves = [
+            Curve('p', [13], [1, 1]),
+            Curve('p', [65521], [3, 7]),
+            Curve('p', [1000003], [5, 11]),
+            Curve('n', [4, 1, 0], [1, 1, 1]),
+            Curve('n', [13, 4, 3, 1, 0], [1, 5, 77]),
+            Curve('s', [4, 1, 0], [1, 1, 1]),
+            Curve('s', [13, 4, 3, 1, 0], [3, 0, 1])
+        ]
+
+        for curve in curves:
+            order = group_order(curve, POINTS[curve.curve_type])
+
+            if curve.field is None and curve.modulus > 1 << 16:
+                self.assertLessEqual(abs(curve.modulus + 1 - order) ** 2, 4 * curve.modulus)
+            else:
+                self.assertEqual(order, count_points(curve))
+
+        self.assertIsNone(group_order(Curve('p', [13], [0, 0]), POINTS['p']))
+        self.assertIsNone(group_order(Curve('n', [4, 1, 0], [1, 1]), POINTS['n']))
+
+    def test_specified_order(self):
+        """Should use an order specified after the same curve was looked up without one."""
+        unknown = Computer('p', [2 ** 127 - 1], [1, 7])
+        specified = Computer('p', [2 ** 127 - 1], [1, 7], order=12345)
+
+        self.assertIsNone(unknown.order)
+        self.assertEqual(specified.order, 12345)
+        self.assertEqual(Computer('p', [199], [1, 3], order=216).order, 216)
+        self.assertEqual(Computer('p', [199], [1, 3]).order, 197)
+
+    def test_roots(self):
+        """Should solve square and binary quadratic equations."""
+        for number in range(1, 101):
+            root = prime_sqrt(number, 101)
+            self.assertEqual(root is None, pow(number, 50, 101) != 1)
+            self.assertTrue(root is None or root * root % 101 == number)
+
+        field = binary_field(0b10000000000101101)
+
+        for number in range(1, 500):
+            root = solve_quadratic(field, number, Random(number))
+            self.assertEqual(root is None, bool(trace(field, number)))
+            self.assertTrue(root is None or field.square(root) ^ root == number)
+
+    def test_computer(self):
+        """Should reduce factors by the specified order."""
+        computer = Computer('p', [199], [1, 3], order=197)
+
+        self.assertEqual(computer.order, 197)
+        instruction = '(1, 76) * {}'.format(197 * 10 ** 40 + 2)
+
+        self.assertEqual(str(computer.calc(instruction)), '(158, 166)')
+        self.assertEqual(Computer('p', [199], [1, 3]).order, 197)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Parallel evaluation tests."""
+from unittest import TestCase
+
+from lib import Computer, ParseError
+from lib.parallel import calc_parallel, calc_sections, chunks, instruction_cost
+from lib.points import Curve
+
+
+class ParallelTest(TestCase):
+    """Parallel evaluation test class."""
+    def test_chunks(self):
+        """Should split instructions by cost weighting multiplications by factor length."""
+        instructions = ['(1, 76) + (1, 76)', '(1, 76) * 255', '(1, 76) * 3', 'broken']
+
+        self.assertEqual([instruction_cost(instruction) for instruction in instructions],
+                         [1, 8, 2, 1])
+        self.assertEqual(instruction_cost('(1, 76) * 255 + (1, 76) * -3 + (1, 76)'), 12)
+        self.assertEqual(instruction_cost('(1, 76) * 0x{}'.format('f' * 32)), 128)
+        self.assertEqual(instruction_cost('(1, 76)*255'), 8)
+        self.assertEqual(instruction_cost('(1,76)*0b101+(1,76)  *  -0o7'), 7)
+        self.assertEqual(list(chunks(instructions, 3)),
+                         [['(1, 76) + (1, 76)', '(1, 76) * 255'], ['(1, 76) * 3', 'broken']])
+
+    def test_parallel(self):
+        """Should merge results of worker processes in input order."""
+        instructions = ['(1, 76) * {}'.format(factor) for factor in range(1, 60)]
+        instructions += ['(1, 76) + (158, 166)', '(1, 76) * 2']
+
+        computer = Computer('p', [199], [1, 3])
+        expected = [(instruction, str(result))
+                    for instruction, result in computer.calc_stream(instructions)]
+        actual = list(calc_parallel('p', [199], [1, 3], iter(instructions), 2, 16))
+
+        self.assertEqual(actual, expected)
+
+    def test_logarithms(self):
+        """Should compute logarithms apart from chunks by walks over the pool."""
+        instructions = ['(1, 76) * 3', '(1, 76) log (158, 166)', '(1, 76) * 5',
+                        '(1, 76) log (1, 76)']
+
+        self.assertIsNone(instruction_cost(instructions[1]))
+        self.assertEqual(list(chunks(instructions, 10)),
+                         [['(1, 76) * 3'], ['(1, 76) log (158, 166)'], ['(1, 76) * 5'],
+                          ['(1, 76) log (1, 76)']])
+        computer = Computer('p', [199], [1, 3])
+        expected = [(instruction, str(computer.calc(instruction))) for instruction in instructions]
+
+        self.assertEqual(list(calc_parallel('p', [199], [1, 3], iter(instructions), 2)), expected)
+        self.assertEqual([result for _, result in expected[1::2]], ['2', '1'])
+
+    def test_parse_error(self):
+        """Should raise errors of malformed instructions from worker processes."""
+        instructions = ['(1, 76) * 2', '(1, 76) ^ 2']
+
+        with self.assertRaises(ParseError) as context:
+            list(calc_parallel('p', [199], [1, 3], iter(instructions), 2, 1))
+
+        self.assertEqual(context.exception.column, 9)
+
+    def test_sections(self):
+        """Should compute sections of several curves in worker processes in input order."""
+        sections = [(Curve('p', [199], [1, 3]), ['(1, 76) * 3', '(1, 76) + (158, 166)']),
+                    (Curve('n', [4, 1, 0], [1, 1, 1]), ['(1, 6) * 3']),
+                    (Curve('p', [199], [1, 3]), ['(1, 76) * 3', '(1, 76) log (158, 166)'])]
+        expected = []
+
+        for curve, instructions in sections:
+            computer = Computer(curve.curve_type, curve.payload, curve.coefficients)
+            expected.append([(instruction, str(computer.calc(instruction)))
+                             for instruction in instructions])
+
+        self.assertEqual(list(calc_sections(iter(sections), 2)), expected)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Instruction parser tests."""
+import pickle
+from unittest import TestCase
+
+from lib import Computer
+from lib.parser import ADD, COMBINATION, LOG, MULTIPLY, ParseError, parse_instruction, \
+    parse_program
+
+
+class ParserTest(TestCase):
+    """Instruction parser test class."""
+    def test_instructions(self):
+        """Should parse instructions into opcodes with integer operands."""
+        instructions = {
+            '(0b0010, 0b1111) + (0xc, 0o14)': (ADD, (2, 15, 12, 12)),
+            '(010, -2) * 5': (MULTIPLY, (10, -2, 5)),
+            '(1,2)*0x10': (MULTIPLY, (1, 2, 16)),
+            '(1, 2) * 3 + (4, 5)': (COMBINATION, (1, 2, 3, 4, 5, 1)),
+            '(1, 2) log (0x3,4)': (LOG, (1, 2, 3, 4)),
+            '(1, 2) + (3, 4) + (5, 6)': (COMBINATION, (1, 2, 1, 3, 4, 1, 5, 6, 1)),
+            '(1, 2) * -1 + (3, 4) * 2': (COMBINATION, (1, 2, -1, 3, 4, 2))
+        }
+
+        for instruction, expected in instructions.items():
+            self.assertEqual(parse_instruction(instruction), expected)
+
+    def test_errors(self):
+        """Should report positions of errors."""
+        instructions = {
+            '(1, 2) - (3, 4)': 8,
+            '(1, 2) * (3, 4)': 10,
+            '(1, 2': 6,
+            '(1, 2) log (3, 4) + (1, 2)': 19,
+            '(1, 2) * 3 log (1, 2)': 12,
+            '(1, 0b2) * 3': 6,
+            '(1, 2)': 7,
+            '': 1
+        }
+
+        for instruction, column in instructions.items():
+            with self.assertRaises(ParseError) as context:
+                parse_instruction(instruction)
+
+            self.assertEqual(context.exception.column, column)
+
+        with self.assertRaises(ParseError) as context:
+            Computer('p', [199], [1, 3]).calc('(1, 76) ^ 3')
+
+        self.assertEqual(context.exception.column, 9)
+
+    def test_pickle(self):
+        """Should restore errors passed between processes."""
+        error = pickle.loads(pickle.dumps(ParseError('(1, 76) ^ 3', 9, 'unexpected', 4)))
+
+        self.assertEqual((error.instruction, error.column, error.message, error.line),
+                         ('(1, 76) ^ 3', 9, 'unexpected', 4))
+        self.assertEqual(str(error), str(ParseError('(1, 76) ^ 3', 9, 'unexpected', 4)))
+
+    def test_program(self):
+        """Should parse non-empty lines of a program and report line numbers."""
+        self.assertEqual(parse_program(['(1, 2) * 3', '', '(1, 2) + (3, 4)']),
+                         [(MULTIPLY, (1, 2, 3)), (ADD, (1, 2, 3, 4))])
+
+        with self.assertRaises(ParseError) as context:
+            parse_program(['(1, 2) * 3', '', '(1, 2) * x'])
+
+        self.assertEqual((context.exception.line, context.exception.column), (3, 10))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Binary instruction file tests."""
+from os.path import join
+from random import Random
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from lib import Computer
+from lib.parser import parse_instruction
+from lib.points import NAMED_CURVES, POINTS, Curve
+from lib.points.order import random_point
+from lib.records import RecordLayout, RecordReader, calc_records, write_instructions, \
+    write_records
+
+
+class RecordsTest(TestCase):
+    """Binary instruction file test class."""
+    def test_round_trip(self):
+        """Should compute binary files with and without compression as text instructions."""
+        # pylint: disable=too-many-locals
+        random = Random(0)
+        params = NAMED_CURVES['K-163']
+        curves = [Curve('p', [199], [1, 3]), Curve('n', [5, 2, 0], [0b110, 1, 1]),
+                  Curve('s', [4, 1, 0], [1, 1, 1]),
+                  Curve(params['curve_type'], params['payload'], params['coefficients'])]
+
+        for curve in curves:
+            points = [random_point(curve, POINTS[curve.curve_type], random) for _ in range(3)]
+            lines = ['({0.x}, {0.y}) + ({1.x}, {1.y})'.format(this, that)
+                     for this in points for that in points]
+            lines += ['({0.x}, {0.y}) * {1}'.format(point, random.getrandbits(200) - (1 << 199))
+                      for point in points]
+            target = next(points[0] * factor for factor in (5, 1) if (points[0] * factor).x)
+
+            if curve.order is None:
+                lines.append('({0.x}, {0.y}) log ({1.x}, {1.y})'.format(points[0], target))
+
+            computer = Computer(curve.curve_type, curve.payload, curve.coefficients)
+            expected = [computer.calc(line) for line in lines]
+
+            for compressed in (False, True):
+                with TemporaryDirectory() as directory:
+                    input_path = join(directory, 'input.bin')
+                    output_path = join(directory, 'output.bin')
+                    write_instructions(input_path, curve, map(parse_instruction, lines),
+                                       compressed)
+                    reader = RecordReader(input_path)
+
+                    self.assertEqual(reader.layout.curve, curve)
+                    self.assertEqual(len(reader), len(lines))
+                    self.assertEqual(list(reader.instructions())[-4:],
+                                     [parse_instruction(line) for line in lines[-4:]])
+
+                    write_records(output_path, reader.layout,
+                                  (reader.layout.encode_result(instruction[0], result)
+                                   for instruction, result in calc_records(computer, reader, 4)))
+                    reader.close()
+
+                    with open(output_path, mode='rb') as output_file:
+                        data = output_file.read()
+
+                layout, offset = RecordLayout.from_header(data)
+                results = [layout.decode_result(data[start:start + layout.size])[1]
+                           for start in range(offset, len(data), layout.size)]
+
+                self.assertEqual(layout.compressed, compressed)
+                self.assertEqual(results, [result if isinstance(result, int) else
+                                           (result.x, result.y) for result in expected])
+
+    def test_header(self):
+        """Should keep the group order and widen records for large scalars."""
+        curve = Curve('p', [199], [1, 3], 197)
+        layout = RecordLayout(curve, True, 40)
+        decoded, offset = RecordLayout.from_header(layout.header())
+
+        self.assertEqual((decoded.curve.order, decoded.width, decoded.compressed), (197, 40, True))
+        self.assertEqual(offset, len(layout.header()))
+        self.assertEqual(layout.size, 1 + 2 * 2 + 40)
+
+    def test_errors(self):
+        """Should reject other files, truncated records, combinations and points off the curve."""
+        curve = Curve('p', [199], [1, 3])
+
+        with TemporaryDirectory() as directory:
+            file_path = join(directory, 'input.bin')
+
+            with open(file_path, mode='wb') as records_file:
+                records_file.write(b'p\n199\n1 3\n(1, 76) * 2\n')
+
+            with self.assertRaises(ValueError):
+                RecordReader(file_path)
+
+            write_instructions(file_path, curve, [parse_instruction('(1, 76) * 2')])
+
+            with open(file_path, mode='ab') as records_file:
+                records_file.write(b'\x02')
+
+            with self.assertRaises(ValueError):
+                RecordReader(file_path)
+
+            with self.assertRaises(ValueError):
+                write_instructions(file_path, curve, [parse_instruction('(1, 76) * 2 + (1, 76)')])
+
+        layout = RecordLayout(curve, True)
+
+        with self.assertRaises(ValueError):
+            layout.decode_point(layout.encode_point(4, 5))
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Computation server tests."""
+import asyncio
+from unittest import TestCase
+
+from lib import Computer
+from lib.server import Server, parse_curve
+
+
+async def exchange(server, messages):
+    """Responses of a server to pipelined messages of a single connection."""
+    listener = await server.start('127.0.0.1:0')
+    port = listener.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(''.join('{}\n'.format(message) for message in messages).encode())
+    writer.write_eof()
+    responses = (await reader.read()).decode().splitlines()
+    writer.close()
+    listener.close()
+    await listener.wait_closed()
+
+    return responses
+
+
+class ServerTest(TestCase):
+    """Computation server test class."""
+    def test_parse_curve(self):
+        """Should parse curves by header lines and names."""
+        self.assertEqual(parse_curve('curve p; 199; 1 3').key, ('p', (199,), (1, 3, None)))
+        self.assertEqual(parse_curve('curve p; 199; 1 3; 0xc5').order, 197)
+        self.assertEqual(parse_curve('curve K-163').field.degree, 163)
+
+        with self.assertRaises(ValueError):
+            parse_curve('curve x; 199')
+
+    def test_pipelined(self):
+        """Should answer pipelined messages in order with and without worker processes."""
+        instructions = ['(1, 76) * {}'.format(factor) for factor in range(2, 40)]
+        instructions += ['(1, 76) + (158, 166)', '(1, 76) * 2 + (158, 166) * 3', '(1, 76) * 5']
+        expected = ['{} = {}'.format(instruction, Computer('p', [199], [1, 3]).calc(instruction))
+                    for instruction in instructions]
+        messages = ['(1, 76) * 2', 'curve p; 199; 1 3'] + instructions + ['(1, 76) ^ 2']
+
+        for jobs in (0, 1):
+            server = Server(jobs)
+            loop = asyncio.new_event_loop()
+
+            try:
+                responses = loop.run_until_complete(exchange(server, messages))
+            finally:
+                server.close()
+                loop.close()
+
+            self.assertEqual(responses[:2], ['error: no curve is selected', 'ok'])
+            self.assertEqual(responses[2:-1], expected)
+            self.assertTrue(responses[-1].startswith('error: '))
+            self.assertEqual(len(server.computers), 1)
+
+    def test_orders(self):
+        """Should keep computers of a curve with and without an order apart."""
+        messages = ['curve p; 97; 2 3', '(3, 6) * 7', 'curve p; 97; 2 3; 7', '(3, 6) * 7']
+        expected = ['ok', '(3, 6) * 7 = {}'.format(Computer('p', [97], [2, 3]).calc('(3, 6) * 7')),
+                    'ok', '(3, 6) * 7 = e']
+
+        for jobs in (0, 1):
+            server = Server(jobs)
+            loop = asyncio.new_event_loop()
+
+            try:
+                responses = loop.run_until_complete(exchange(server, messages))
+            finally:
+                server.close()
+                loop.close()
+
+            self.assertEqual(responses, expected)
+            self.assertEqual(len(server.computers), 2)
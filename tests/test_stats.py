@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Operation statistics tests."""
+import csv
+import json
+from os.path import join
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from lib import Computer
+from lib.points import NAMED_CURVES, Point, Point2N, PrimePoint
+from lib.stats import COUNTERS, Stats, calc_profiled, instrumented
+
+
+class StatsTest(TestCase):
+    """Operation statistics test class."""
+    def test_instrumented(self):
+        """Should count operations only inside the context."""
+        computer = Computer('p', [199], [1, 3])
+        point = computer.calc('(1, 76) * 1')
+        originals = Point.__add__, PrimePoint.backend, Point2N.multiply
+        counts = dict.fromkeys(COUNTERS, 0)
+
+        with instrumented(counts):
+            self.assertIsNot(PrimePoint.backend, originals[1])
+            _ = point + point
+            _ = point + point * 3
+
+        self.assertEqual((Point.__add__, PrimePoint.backend, Point2N.multiply), originals)
+        self.assertGreaterEqual(counts['doublings'], 2)
+        self.assertGreaterEqual(counts['additions'], 2)
+        self.assertGreaterEqual(counts['inversions'], 3)
+
+        total = dict(counts)
+        _ = point + point
+        self.assertEqual(counts, total)
+
+    def test_profiled(self):
+        """Should compute results equally with per-instruction traces and totals."""
+        instructions = ['(1, 76) * {}'.format(factor) for factor in range(2, 20)]
+        instructions += ['(1, 76) + (158, 166)', '(1, 76) * 2', '(1, 76) * 2 + (158, 166) * 3']
+        expected = list(Computer('p', [199], [1, 3]).calc_stream(instructions))
+
+        with TemporaryDirectory() as directory:
+            for name in ('trace.csv', 'trace.json'):
+                path = join(directory, name)
+                stats = Stats(path)
+                actual = list(calc_profiled(Computer('p', [199], [1, 3]), instructions, stats))
+                stats.close()
+
+                self.assertEqual(actual, expected)
+
+                with open(path, encoding='utf-8') as trace_file:
+                    if name.endswith('.json'):
+                        rows = json.load(trace_file)
+                    else:
+                        rows = list(csv.DictReader(trace_file))
+
+                self.assertEqual(len(rows), len(expected))
+                self.assertEqual([row['instruction'] for row in rows],
+                                 [instruction for instruction, _ in expected])
+
+                summary = stats.summary()
+
+                self.assertEqual(summary['instructions'], len(expected))
+                self.assertEqual(summary['doublings'],
+                                 sum(int(row['doublings']) for row in rows))
+                self.assertGreater(summary['inversions'], 0)
+
+    def test_binary_reductions(self):
+        """Should count a reduction for every binary field multiplication and squaring."""
+        computer = Computer('n', [163, 7, 6, 3, 0], [1, 1, 1])
+        stats = Stats()
+        instructions = ['(0x2fe13c0537bbc11acaa07d793de4e6d5e5c94eee8, '
+                        '0x289070fb05d38ff58321f2e800536d538ccdaa3d9) * 12345678901234567890']
+        list(calc_profiled(computer, instructions, stats))
+        summary = stats.summary()
+
+        self.assertGreater(summary['multiplications'], 0)
+        self.assertGreaterEqual(summary['reductions'],
+                                summary['multiplications'] + summary['squarings'])
+
+    def test_prime_arithmetic(self):
+        """Should count the field operations of Jacobian doublings and additions."""
+        params = NAMED_CURVES['P-192']
+        computer = Computer(params['curve_type'], params['payload'], params['coefficients'])
+        stats = Stats()
+        instructions = ['({0[0]}, {0[1]}) * 123456789123456789'.format(params['generator'])]
+        list(calc_profiled(computer, instructions, stats))
+        summary = stats.summary()
+
+        self.assertGreaterEqual(summary['doublings'], 50)
+        self.assertGreaterEqual(summary['multiplications'], 4 * summary['doublings'])
+        self.assertGreaterEqual(summary['squarings'], 4 * summary['doublings'])
+        self.assertGreaterEqual(summary['reductions'], 2 * summary['doublings'])
+        self.assertLess(summary['multiplications'] + summary['squarings'],
+                        20 * (summary['doublings'] + summary['additions']))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Precomputation store tests."""
+from os.path import join
+from random import Random
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from lib.computer import Computer
+from lib.points import NAMED_CURVES, POINTS, Curve, points_factory
+from lib.points.fixed_base import FixedBaseTable
+from lib.points.order import random_point
+from lib.store import PrecomputationStore, open_store, save_computer, write_store
+
+
+class StoreTest(TestCase):
+    """Precomputation store test class."""
+    def test_round_trip(self):
+        """Should multiply by stored tables as by built ones on prime and binary curves."""
+        random = Random(0)
+        params = NAMED_CURVES['P-256']
+        named = Curve(params['curve_type'], params['payload'], params['coefficients'])
+        points = [points_factory(named, *params['generator'])]
+        points += [random_point(curve, POINTS[curve.curve_type], random) for curve in (
+            Curve('p', [199], [1, 3]), Curve('n', [5, 2, 0], [0b110, 1, 1]),
+            Curve('s', [4, 1, 0], [1, 1, 1]))]
+        tables = [FixedBaseTable(point, point.curve.order.bit_length()) for point in points
+                  if point.curve.order is not None]
+        tables += [FixedBaseTable(point, 12, 3) for point in points[1:]]
+
+        with TemporaryDirectory() as directory:
+            file_path = join(directory, 'store.bin')
+            write_store(file_path, {named: named.order, points[1].curve: 216}, tables)
+            store = PrecomputationStore(file_path)
+
+            self.assertEqual(store.order(named), named.order)
+            self.assertEqual(store.order(points[1].curve), 216)
+            self.assertIsNone(store.order(points[2].curve))
+            self.assertIsNone(store.table(points[0] * 2, 1))
+            self.assertIsNone(store.table(points[1], 13))
+
+            for table in tables:
+                stored = store.table(table.point, table.bit_length)
+
+                self.assertEqual((stored.window, stored.bit_length),
+                                 (table.window, table.bit_length))
+
+                for _ in range(10):
+                    factor = random.getrandbits(table.bit_length) | 1
+
+                    self.assertEqual(stored.multiply(factor), table.point * factor)
+
+            store.close()
+
+    def test_computer(self):
+        """Should use stored orders and tables from the first multiplication and merge new ones."""
+        with TemporaryDirectory() as directory:
+            file_path = join(directory, 'store.bin')
+            computer = Computer('p', [199], [1, 3], tables_size=1)
+
+            for factor in range(2, 40):
+                computer.calc('(1, 76) * {}'.format(factor))
+
+            self.assertIsNone(open_store(file_path))
+            self.assertTrue(save_computer(file_path, computer))
+
+            store = open_store(file_path)
+            warm = Computer('p', [199], [1, 3], tables_size=1, store=store)
+
+            self.assertEqual(warm.curve.order, computer.order)
+            self.assertEqual(str(warm.calc('(1, 76) * 100')), str(computer.calc('(1, 76) * 100')))
+            self.assertIsNotNone(warm.tables.get(points_factory(warm.curve, 1, 76), 8))
+            self.assertEqual(len(warm.tables), 0)
+            self.assertFalse(save_computer(file_path, warm, store))
+
+            for factor in range(2, 40):
+                warm.calc('(158, 166) * {}'.format(factor))
+
+            self.assertTrue(save_computer(file_path, warm, store))
+            store.close()
+            store = open_store(file_path)
+
+            self.assertEqual(len(store.entries), 2)
+            store.close()
+
+    def test_unsupported(self):
+        """Should reject files of other formats."""
+        with TemporaryDirectory() as directory:
+            file_path = join(directory, 'store.bin')
+
+            with open(file_path, mode='wb') as store_file:
+                store_file.write(b'not a store file')
+
+            with self.assertRaises(ValueError):
+                PrecomputationStore(file_path)
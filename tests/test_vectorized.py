@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Vectorized engine tests."""
+from unittest import TestCase, skipUnless
+
+from lib import Computer
+from lib.points import Curve, points_factory
+from lib.points.vectorized import VectorizedEngine, numpy
+
+
+@skipUnless(numpy, 'NumPy is not installed')
+class VectorizedEngineTest(TestCase):
+    """Vectorized engine test class."""
+    def test_engine(self):
+        """Should add and multiply batches of points as one by one."""
+        curve = Curve('p', [199], [1, 3])
+        engine = VectorizedEngine(curve)
+        points = [points_factory(curve, 1, 76), points_factory(curve, 158, 166),
+                  points_factory(curve, 138, 47), points_factory(curve, 1, 123)]
+        pairs = [(this, that) for this in points for that in points]
+        factors = (2, 3, -5, 196, 197, 2 ** 70 + 3)
+        products = [(point, factor) for point in points for factor in factors]
+
+        self.assertEqual(engine.add_points(pairs), [this + that for this, that in pairs])
+        self.assertEqual(engine.multiply_points(products),
+                         [point * factor for point, factor in products])
+
+        batch = engine.arrays(points)
+
+        self.assertEqual(engine.points(engine.double(batch)), [point + point for point in points])
+        self.assertEqual(engine.inverse(numpy.arange(1, 199)).tolist(),
+                         [pow(value, 197, 199) for value in range(1, 199)])
+
+    def test_computer(self):
+        """Should pick the vectorized engine for small prime fields only."""
+        instructions = ['(1, 76) * {}'.format(factor) for factor in range(-40, 40)]
+        instructions += ['(1, 76) + (158, 166)', '(138, 47) + (138, 152)']
+
+        computer = Computer('p', [199], [1, 3])
+        generic = Computer('p', [199], [1, 3], vectorized=False)
+
+        self.assertIsNotNone(computer.vectorized)
+        self.assertIsNone(Computer('p', [2 ** 61 - 1], [1, 3]).vectorized)
+        self.assertIsNone(Computer('n', [4, 1, 0], [1, 1, 1]).vectorized)
+        self.assertEqual([str(result) for result in computer.calc_batch(instructions)],
+                         [str(generic.calc(instruction)) for instruction in instructions])